@@ -18,7 +18,7 @@ def run() -> None:
     logger.info(f"Loaded configuration: {cfg}")
 
     # Fetch data
-    provider = YahooFinanceProvider()
+    provider = YahooFinanceProvider(cache=True)
     end_date = datetime.today()
     start_date = end_date - timedelta(days=365)
     logger.info("Fetching historical data for AAPL...")
@@ -43,9 +43,8 @@ def main() -> None:
 
     logger.info("Downloading data from Yahoo Finance: {}", args.symbol)
     data_provider = YahooFinanceProvider(cache=True)
-    from datetime import datetime as _dt
-    start_dt = _dt.fromisoformat(args.start)
-    end_dt = _dt.fromisoformat(args.end)
+    start_dt = datetime.fromisoformat(args.start)
+    end_dt = datetime.fromisoformat(args.end)
     df = data_provider.get_historical_data(args.symbol, start_dt, end_dt)
 
     strategy_cls = STRATEGY_REGISTRY[args.strategy]
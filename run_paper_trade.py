@@ -25,6 +25,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Type
 
+import numpy as np
+import pandas as pd
 from loguru import logger
 
 from src.data.providers.yahoo import YahooFinanceProvider  # default provider
@@ -42,11 +44,16 @@ from src.core.exceptions import DataProviderError
 # dependency on a plugin registry.  Extend this mapping as you add more
 # built-in strategies.
 # ---------------------------------------------------------------------------
+from src.strategies.bollinger_bands import BollingerBandsStrategy
 from src.strategies.buy_and_hold import BuyAndHoldStrategy
+from src.strategies.rsi_mean_reversion import RSIMeanReversionStrategy
+from src.strategies.sma_crossover import SMACrossoverStrategy
 
 STRATEGY_REGISTRY: Dict[str, Type] = {
     "buy_and_hold": BuyAndHoldStrategy,
-    # "sma_crossover": SMACrossover,  # Example: uncomment when added
+    "sma_crossover": SMACrossoverStrategy,
+    "rsi_mean_reversion": RSIMeanReversionStrategy,
+    "bollinger_bands": BollingerBandsStrategy,
 }
 
 # ---------------------------------------------------------------------------
@@ -69,6 +76,53 @@ def _signal_to_order(symbol: str, sig_type: SignalType, quantity: int = 1) -> Or
         quantity=quantity,
     )
 
+
+def _sleep_until(deadline: float) -> None:
+    """Sleep until the ``time.monotonic()`` *deadline* (no-op if already past)."""
+
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+class _CloseHistory:
+    """Append-only Close history backed by pre-allocated NumPy buffers.
+
+    Replaces growing a DataFrame with ``df.loc[now] = price`` (which copies
+    the frame on every tick); :meth:`frame` wraps the filled prefix without
+    copying it.
+    """
+
+    def __init__(self, hist_df: pd.DataFrame, capacity: int = 0) -> None:
+        closes = hist_df["Close"].to_numpy(dtype=np.float64)
+        index = pd.DatetimeIndex(hist_df.index)
+        if index.tz is not None:  # live ticks are naive UTC (``utcnow``)
+            index = index.tz_convert(None)
+        times = index.as_unit("ns").to_numpy()
+        size = max(len(closes) + capacity, 2 * len(closes), 64)
+        self._close = np.empty(size, dtype=np.float64)
+        self._time = np.empty(size, dtype="datetime64[ns]")
+        self._close[: len(closes)] = closes
+        self._time[: len(closes)] = times
+        self._n = len(closes)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def append(self, time: datetime, price: float) -> None:
+        if self._n == len(self._close):  # unbounded sessions: grow geometrically
+            self._close = np.resize(self._close, 2 * self._n)
+            self._time = np.resize(self._time, 2 * self._n)
+        self._close[self._n] = price
+        self._time[self._n] = np.datetime64(time, "ns")
+        self._n += 1
+
+    def frame(self) -> pd.DataFrame:
+        """Current history as a ``Close``-only DataFrame (views, no copy)."""
+
+        index = pd.DatetimeIndex(self._time[: self._n], copy=False)
+        return pd.DataFrame({"Close": self._close[: self._n]}, index=index, copy=False)
+
 # ---------------------------------------------------------------------------
 # CLI ------------------------------------------------------------------------
 # ---------------------------------------------------------------------------
@@ -144,11 +198,20 @@ def main(argv: list[str] | None = None) -> None:  # pragma: no cover
         hist_df = provider.get_historical_data(args.symbol, history_start, datetime.utcnow())
     except DataProviderError as e:
         logger.warning("Historical data fetch failed: {} – continuing with empty warm-up.", e)
-        import pandas as pd
         hist_df = pd.DataFrame(columns=["Close"])
 
     strategy_cls = STRATEGY_REGISTRY[args.strategy]
-    strategy = strategy_cls()  # Strategies currently take no params via CLI
+    # Strategies take default params via CLI, apart from the traded symbol
+    model = strategy_cls.ParamModel
+    takes_symbol = model is not None and "symbol" in model.model_fields
+    strategy = strategy_cls({"symbol": args.symbol} if takes_symbol else None)
+    # Reason: windowed strategies keep just their trailing prices and are fed
+    # one Close per tick; others get the full history frame each tick.
+    streaming = strategy.lookback is not None
+    if streaming:
+        strategy.seed(hist_df["Close"].to_numpy(dtype=np.float64))
+    else:
+        history = _CloseHistory(hist_df, capacity=args.max_ticks + 1)
 
     broker = PaperBroker(
         starting_cash=args.cash,
@@ -166,16 +229,28 @@ def main(argv: list[str] | None = None) -> None:  # pragma: no cover
     # ------------------------------------------------------------------
     # Live loop ---------------------------------------------------------
     # ------------------------------------------------------------------
-    tick = 0
+    # Reason: ticks are scheduled on a fixed monotonic grid so the time spent
+    # fetching quotes and evaluating the strategy does not stretch the cadence.
+    # Slots missed during an overrun are skipped rather than fired back to back;
+    # ``tick`` counts executed ticks (for --max-ticks), ``slot`` the grid.
+    period = max(args.refresh, 1)
+    session_start = time.monotonic()
+    tick = slot = 0
     try:
         while True:
+            due = int((time.monotonic() - session_start) // period)
+            if due > slot:
+                logger.warning("Tick overran – skipping {} missed slot(s)", due - slot)
+                slot = due
+            slot += 1
             tick += 1
+            next_wakeup = session_start + slot * period
             now = datetime.utcnow()
             try:
                 quote = provider.get_real_time_quote(args.symbol)
             except DataProviderError as e:
-                logger.error("Quote fetch failed: {} – retrying after {}s", e, args.refresh)
-                time.sleep(max(args.refresh, 1))
+                logger.error("Quote fetch failed: {} – retrying at next tick", e)
+                _sleep_until(next_wakeup)
                 continue
             price = float(quote["price"])
 
@@ -183,8 +258,11 @@ def main(argv: list[str] | None = None) -> None:  # pragma: no cover
             broker.on_price_tick(args.symbol, now, price, price, price)
 
             # Append to history & query strategy
-            hist_df.loc[now] = price
-            signals = strategy.generate_signals(hist_df)
+            if streaming:
+                signals = strategy.update(price)
+            else:
+                history.append(now, price)
+                signals = strategy.generate_signals(history.frame())
             sig = signals.get(args.symbol)
             if sig and sig.type in (SignalType.BUY, SignalType.SELL):
                 order = _signal_to_order(args.symbol, sig.type)
@@ -198,21 +276,17 @@ def main(argv: list[str] | None = None) -> None:  # pragma: no cover
             if args.max_ticks and tick >= args.max_ticks:
                 logger.info("Max ticks reached – stopping session")
                 break
-            time.sleep(max(args.refresh, 1))
+            _sleep_until(next_wakeup)
     except KeyboardInterrupt:
         logger.warning("Session interrupted by user – generating report…")
 
     # ------------------------------------------------------------------
     # Report generation -------------------------------------------------
     # ------------------------------------------------------------------
-    equity_curve = broker._equity_curve  # list[(ts, equity)]
-    if not equity_curve:
+    ser = broker.equity_curve()
+    if ser.empty:
         logger.error("No equity data captured – nothing to report")
         sys.exit(1)
-    times, equities = zip(*equity_curve)
-    import pandas as pd
-
-    ser = pd.Series(equities, index=pd.to_datetime(times), name="equity")
     report_path = generate_html_report(ser, summary(ser), outdir / f"paper_{args.symbol}.html", trades=broker.fills)
     logger.success("HTML performance report written to {}", report_path)
 
@@ -24,6 +24,7 @@ setup(
         "pyyaml",
     ],
     extras_require={
+        "fast": ["numba", "orjson", "pyarrow"],
         "dev": [
             "black",
             "pytest",
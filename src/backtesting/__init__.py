@@ -1,5 +1,5 @@
 from .engine import BacktestEngine  # noqa: F401
-from .metrics import PerformanceSummary, summary
+from .metrics import PerformanceSummary, summary, summary_cached
 from .report import (
     ReportGenerator,
     generate_html_report,
@@ -3,19 +3,19 @@ from __future__ import annotations
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
+from functools import reduce
 from typing import Dict, List, Sequence
 
+import numpy as np
 import pandas as pd
+from loguru import logger
 
 from src.strategies.base import Strategy
-from src.strategies.signal import SignalType
+from src.strategies.signal import CODE_SIGNALS, SIGNAL_CODES
 
-from src.orders.order import Order
-from src.orders.order_book import OrderBook
-from src.orders.types import OrderType
 from src.portfolio.manager import PortfolioManager
 
-from .events import FillEvent, MarketEvent, SignalEvent
+from .events import FillEvent, SignalEvent
 
 
 @dataclass
@@ -35,7 +35,7 @@ class Portfolio:
     # -------------------------------------------------------------
     def update_with_fill(self, fill: FillEvent) -> None:
         pos = self.positions[fill.symbol]
-        direction = 1 if fill.fill_type == SignalType.BUY else -1
+        direction = fill.direction
         new_qty = pos.quantity + direction * fill.quantity
         if new_qty == 0:
             pos.avg_price = 0.0
@@ -74,98 +74,164 @@ class BacktestEngine:
         # Align dates across symbols by outer join index
         self.data = data
         self.symbols = list(data.keys())
-        self.dates = sorted(
-            set().union(*[df.index.to_pydatetime().tolist() for df in data.values()])
-        )
+        # Reason: seed the union with the first frame's index rather than an
+        # empty (tz-naive) one, which would degrade tz-aware data to object.
+        indexes = [pd.DatetimeIndex(df.index) for df in data.values()]
+        index = reduce(pd.DatetimeIndex.union, indexes) if indexes else pd.DatetimeIndex([])
+        self._index: pd.DatetimeIndex = index.sort_values()
+        # Reason: label lookups (``df.loc[time]``) per bar dominate long runs,
+        # so Close prices are pre-aligned to ``_index`` as one contiguous
+        # (bars × symbols) float64 matrix once; missing bars are NaN.
+        self._sym_idx: Dict[str, int] = {sym: i for i, sym in enumerate(self.symbols)}
+        self._close_mat = np.empty((len(self._index), len(self.symbols)), dtype=np.float64)
+        for sym, df in data.items():
+            self._close_mat[:, self._sym_idx[sym]] = (
+                df["Close"].reindex(self._index).to_numpy(dtype=np.float64)
+            )
         self.strategies = strategies
-        self.portfolio = PortfolioManager(starting_cash)
+        # Loop-invariant: the symbols each strategy trades.
+        self._required_syms_per_strat: List[set[str]] = [
+            {strat.parameters.get("symbol", sym) for sym in self.symbols}
+            for strat in self.strategies
+        ]
+        # Position rows follow ``self.symbols`` so fills can be applied by index
+        self.portfolio = PortfolioManager(starting_cash, symbols=self.symbols)
         self.commission = commission
         self.slippage_pct = slippage_pct
         self.progress_interval = progress_interval
-        # Use new order-book for tracking and matching orders
-        self.order_book = OrderBook()
+        # Pending MARKET orders as a struct-of-arrays buffer (one entry per
+        # order, in submission order); drained in one batch per bar.
+        self._pending_sym: List[int] = []
+        self._pending_side: List[int] = []
+        self._pending_qty: List[int] = []
 
     # ------------------------------------------------------------------
-    def _price_at(self, symbol: str, time: datetime) -> float | None:
-        df = self.data[symbol]
-        if time in df.index:
-            return float(df.loc[time]["Close"])
-        return None
+    @property
+    def dates(self) -> List[datetime]:
+        """Backtest timestamps (union of all symbol indexes), sorted."""
 
-    # ------------------------------------------------------------------
-    def _generate_market_events(self, time: datetime) -> List[MarketEvent]:
-        events: List[MarketEvent] = []
-        for sym in self.symbols:
-            price = self._price_at(sym, time)
-            if price is None:
-                continue
-            row = self.data[sym].loc[time].to_dict()
-            events.append(MarketEvent(sym, time, price, row))
-        return events
+        return list(self._index)
 
     # ------------------------------------------------------------------
     def _process_signals(self, time: datetime, signals: Dict[str, SignalEvent]) -> None:
         for sig in signals.values():
-            if sig.signal_type == SignalType.HOLD:
+            side = SIGNAL_CODES[sig.signal_type]  # one hash lookup, no enum compares
+            if not side:  # HOLD
                 continue
-            order = Order(
-                symbol=sig.symbol,
-                side=sig.signal_type,
-                order_type=OrderType.MARKET,
-                quantity=100,  # fixed lot for demo
-            )
-            self.order_book.add_order(order)
+            self._pending_sym.append(self._sym_idx[sig.symbol])
+            self._pending_side.append(side)
+            self._pending_qty.append(100)  # fixed lot for demo
 
     # ------------------------------------------------------------------
-    def _execute_orders(self, time: datetime) -> None:
-        for sym in self.symbols:
-            if time not in self.data[sym].index:
-                continue
-            row = self.data[sym].loc[time]
-            # Handle datasets that may only contain Close values
-            close = float(row["Close"])
-            high = float(row.get("High", close))
-            low = float(row.get("Low", close))
-
-            fills = self.order_book.process_bar(
-                sym,
-                time,
-                price=close,
-                high=high,
-                low=low,
-                commission=self.commission,
-            )
-            for fill in fills:
-                self.portfolio.update_with_fill(fill)
+    def _execute_orders(self, i: int) -> None:
+        """Fill every pending MARKET order whose symbol has a bar at *i*.
+
+        Orders fill at the bar's close; symbols without a bar keep their
+        orders pending for the next bar that has one.
+        """
+
+        if not self._pending_sym:
+            return
+        sym_idx = np.asarray(self._pending_sym, dtype=np.int32)
+        side = np.asarray(self._pending_side, dtype=np.int8)
+        qty = np.asarray(self._pending_qty, dtype=np.int64)
+        close_vec = self._close_mat[i]
+        fill_price = close_vec[sym_idx]
+        live = ~np.isnan(fill_price)
+        if not live.any():
+            return
+        # Reason: fills are applied grouped by symbol (in ``self.symbols``
+        # order) and in submission order within a symbol, matching the
+        # per-symbol order-book drain this replaces.
+        order = np.flatnonzero(live)
+        order = order[np.argsort(sym_idx[order], kind="stable")]
+        self.portfolio.apply_fills(
+            self._index[i],
+            sym_idx[order],
+            side[order],
+            qty[order],
+            fill_price[order],
+            self.commission,
+        )
+        rest = np.flatnonzero(~live)
+        self._pending_sym = sym_idx[rest].tolist()
+        self._pending_side = side[rest].tolist()
+        self._pending_qty = qty[rest].tolist()
+
+    # ------------------------------------------------------------------
+    def _precompute_signals(self) -> tuple[np.ndarray, List[List[str]]]:
+        """Vectorised signal codes for every strategy, bar and symbol.
+
+        Returns ``(signals_mat, per_bar)``: ``signals_mat[k, i, j]`` is the
+        int8 code strategy *k* emits for ``self.symbols[j]`` at bar *i*, and
+        ``per_bar[k]`` lists the symbols strategy *k* lacks a vectorised
+        implementation for; those are evaluated bar-by-bar inside :meth:`run`.
+        """
+
+        signals_mat = np.zeros(
+            (len(self.strategies), len(self._index), len(self.symbols)), dtype=np.int8
+        )
+        per_bar: List[List[str]] = []
+        for k, (strat, required_syms) in enumerate(
+            zip(self.strategies, self._required_syms_per_strat)
+        ):
+            fallback: List[str] = []
+            for sym in required_syms:
+                frame = strat.generate_signals_vectorized(self.data[sym])
+                if frame is None:
+                    fallback.append(sym)
+                elif sym in frame.columns:
+                    # Reason: per-bar evaluation on dates where *sym* has no bar
+                    # reuses its latest row, which is exactly a forward-fill.
+                    codes = frame[sym].reindex(self._index, method="ffill").fillna(0)
+                    signals_mat[k, :, self._sym_idx[sym]] = codes.to_numpy(dtype=np.int8)
+            per_bar.append(fallback)
+        return signals_mat, per_bar
 
     # ------------------------------------------------------------------
     def run(self) -> pd.DataFrame:
         """Run backtest; returns equity curve DataFrame."""
 
-        equity_curve = []
-        for idx, dt in enumerate(self.dates):
-            # 1. market events
-            market_events = self._generate_market_events(dt)
-            if not market_events:
+        self.signals_mat, per_bar = self._precompute_signals()
+        n_bars = len(self._index)
+        progress_interval = self.progress_interval
+        has_bar = ~np.isnan(self._close_mat).all(axis=1)
+
+        # Equity is written into pre-allocated arrays; bars without any
+        # market data are skipped, so only the first ``n_rec`` slots are used.
+        eq_rows = np.empty(n_bars, dtype=np.intp)
+        eq_vals = np.empty(n_bars, dtype=np.float64)
+        n_rec = 0
+        for idx, dt in enumerate(self._index):
+            # 1. market events – nothing consumes the event objects, only
+            # whether any symbol has a bar, so skip building them
+            if not has_bar[idx]:
                 continue
             # 2. strategy signals
-            for strat in self.strategies:
-                # build dataframe subset for required indicators up to current time
-                required_syms = {strat.parameters.get("symbol", sym) for sym in self.symbols}
-                for sym in required_syms:
+            for strat, fallback, codes in zip(self.strategies, per_bar, self.signals_mat[:, idx]):
+                for sym in fallback:
+                    # Fallback: build dataframe subset up to current time
                     df = self.data[sym].loc[:dt]
                     sigs = strat.generate_signals(df)
                     if sym in sigs:
                         se = sigs[sym]
                         signal_event = SignalEvent(sym, dt, se.type, se.confidence)
                         self._process_signals(dt, {sym: signal_event})
+                for j in np.flatnonzero(codes).tolist():
+                    sym = self.symbols[j]
+                    signal_event = SignalEvent(sym, dt, CODE_SIGNALS[int(codes[j])])
+                    self._process_signals(dt, {sym: signal_event})
             # 3. execute orders
-            self._execute_orders(dt)
+            self._execute_orders(idx)
             # 4. record equity
-            prices_now = {sym: self._price_at(sym, dt) or 0.0 for sym in self.symbols}
-            equity = self.portfolio.total_equity(prices_now)
-            equity_curve.append({"time": dt, "equity": equity})
+            close_vec = self._close_mat[idx]
+            # symbols without a bar are marked at 0.0
+            price_vec = np.where(np.isnan(close_vec), 0.0, close_vec)
+            eq_rows[n_rec] = idx
+            eq_vals[n_rec] = self.portfolio.total_equity_array(price_vec)
+            n_rec += 1
             # 5. progress
-            if (idx + 1) % self.progress_interval == 0:
-                print(f"Progress: {idx+1}/{len(self.dates)}")
-        return pd.DataFrame(equity_curve).set_index("time")
+            if (idx + 1) % progress_interval == 0:
+                logger.info("Progress: {}/{}", idx + 1, n_bars)
+        index = self._index[eq_rows[:n_rec]].rename("time")
+        return pd.DataFrame({"equity": eq_vals[:n_rec]}, index=index)
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
 
 from src.strategies.signal import SignalType
 
+_BUY = SignalType.BUY  # hoisted: member access is a per-fill descriptor lookup
+
 
 @dataclass(slots=True)
 class MarketEvent:
     symbol: str
     time: datetime
     price: float
-    row: dict[str, Any]
+    row: dict[str, Any] | None = None
 
 
 @dataclass(slots=True)
@@ -40,3 +46,192 @@ class FillEvent:
     quantity: int
     price: float
     commission: float = 0.0
+    # +1 BUY / -1 SELL, resolved once so position updates skip enum compares
+    direction: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.direction = 1 if self.fill_type == _BUY else -1
+
+
+# ---------------------------------------------------------------------------
+# Columnar fill storage
+# ---------------------------------------------------------------------------
+
+FILL_DTYPE = np.dtype(
+    [
+        ("sym_idx", "i4"),
+        ("time", "datetime64[ns]"),
+        ("side", "i1"),  # +1 BUY, -1 SELL
+        ("qty", "i8"),
+        ("price", "f8"),
+        ("commission", "f8"),
+    ]
+)
+
+
+class FillLog(Sequence[FillEvent]):
+    """Append-only fill history stored as a ``FILL_DTYPE`` structured array.
+
+    Behaves like a read-only ``list[FillEvent]`` (``len``, indexing,
+    iteration build ``FillEvent`` views on demand) while numeric consumers
+    can work on :attr:`records` directly.
+    """
+
+    def __init__(self, symbols: Iterable[str] = (), capacity: int = 1024) -> None:
+        self.symbols: List[str] = []
+        self._sym_index: Dict[str, int] = {}
+        for sym in symbols:
+            self._intern(sym)
+        self._buf = np.empty(capacity, dtype=FILL_DTYPE)
+        self._n = 0
+        self._tz: Any = None  # tz of the stored timestamps (kept as UTC in ``_buf``)
+
+    @classmethod
+    def from_fills(cls, fills: Iterable[FillEvent]) -> "FillLog":
+        log = cls()
+        for fill in fills:
+            log.append(fill)
+        return log
+
+    # ------------------------------------------------------------------
+    def _intern(self, symbol: str) -> int:
+        idx = self._sym_index.get(symbol)
+        if idx is None:
+            idx = len(self.symbols)
+            self._sym_index[symbol] = idx
+            self.symbols.append(symbol)
+        return idx
+
+    def _reserve(self, extra: int) -> None:
+        need = self._n + extra
+        if need > len(self._buf):
+            grown = np.empty(max(need, 2 * len(self._buf)), dtype=FILL_DTYPE)
+            grown[: self._n] = self._buf[: self._n]
+            self._buf = grown
+
+    def _to_datetime64(self, time: datetime) -> np.datetime64:
+        ts = pd.Timestamp(time)
+        if self._n == 0:
+            self._tz = ts.tz
+        if ts.tz is not None:
+            ts = ts.tz_convert(None)
+        return ts.as_unit("ns").to_datetime64()
+
+    def _to_datetime64_many(self, times: Sequence[datetime]) -> np.ndarray:
+        try:
+            index = pd.DatetimeIndex(times)
+        except (TypeError, ValueError):  # mixed zones: convert one by one
+            tz = pd.Timestamp(times[0]).tz if self._n == 0 else self._tz
+            out = np.array([self._to_datetime64(t) for t in times], dtype="datetime64[ns]")
+            self._tz = tz
+            return out
+        if self._n == 0:
+            self._tz = index.tz
+        if index.tz is not None:
+            index = index.tz_convert(None)
+        return index.as_unit("ns").to_numpy()
+
+    def append(self, fill: FillEvent) -> None:
+        self._reserve(1)
+        row = self._buf[self._n]
+        row["time"] = self._to_datetime64(fill.time)
+        row["sym_idx"] = self._intern(fill.symbol)
+        row["side"] = fill.direction
+        row["qty"] = fill.quantity
+        row["price"] = fill.price
+        row["commission"] = fill.commission
+        self._n += 1
+
+    def extend_arrays(
+        self,
+        time: datetime | Sequence[datetime],
+        sym_idx: np.ndarray,
+        side: np.ndarray,
+        qty: np.ndarray,
+        price: np.ndarray,
+        commission: float | np.ndarray = 0.0,
+    ) -> None:
+        """Append fills given as parallel columns; ``sym_idx`` indexes :attr:`symbols`.
+
+        *time* is one timestamp shared by every fill or one per fill, and
+        *commission* a scalar or per-fill array.  Same result as
+        :meth:`append` per fill.
+        """
+
+        n = len(sym_idx)
+        if n == 0:
+            return
+        self._reserve(n)
+        rows = self._buf[self._n : self._n + n]
+        rows["time"] = self._to_datetime64(time) if isinstance(time, datetime) else self._to_datetime64_many(time)
+        rows["sym_idx"] = sym_idx
+        rows["side"] = side
+        rows["qty"] = qty
+        rows["price"] = price
+        rows["commission"] = commission
+        self._n += n
+
+    # ------------------------------------------------------------------
+    @property
+    def records(self) -> np.ndarray:
+        """Filled prefix of the underlying structured array (a view)."""
+
+        return self._buf[: self._n]
+
+    @property
+    def times(self) -> pd.DatetimeIndex:
+        """Fill timestamps in their original timezone (vectorised ``time``)."""
+
+        idx = pd.DatetimeIndex(self.records["time"])
+        if self._tz is not None:
+            idx = idx.tz_localize("UTC").tz_convert(self._tz)
+        return idx
+
+    def as_frame(self) -> pd.DataFrame:
+        """Fills as a DataFrame, one row per fill (for reports/exports).
+
+        Columns: ``time``, ``symbol`` (categorical), ``side`` (+1/-1),
+        ``qty``, ``price`` and ``commission``; no ``FillEvent`` is built.
+        """
+
+        rec = self.records
+        return pd.DataFrame(
+            {
+                "time": self.times,
+                "symbol": pd.Categorical.from_codes(rec["sym_idx"], categories=self.symbols),
+                "side": rec["side"],
+                "qty": rec["qty"],
+                "price": rec["price"],
+                "commission": rec["commission"],
+            }
+        )
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _event(self, i: int) -> FillEvent:
+        row = self._buf[i]
+        time = pd.Timestamp(row["time"])
+        if self._tz is not None:
+            time = time.tz_localize("UTC").tz_convert(self._tz)
+        return FillEvent(
+            symbol=self.symbols[int(row["sym_idx"])],
+            time=time,
+            fill_type=SignalType.BUY if row["side"] > 0 else SignalType.SELL,
+            quantity=int(row["qty"]),
+            price=float(row["price"]),
+            commission=float(row["commission"]),
+        )
+
+    def __getitem__(self, i):  # type: ignore[override]
+        if isinstance(i, slice):
+            return [self._event(k) for k in range(*i.indices(self._n))]
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError("fill index out of range")
+        return self._event(i)
+
+    def __iter__(self) -> Iterator[FillEvent]:
+        for i in range(self._n):
+            yield self._event(i)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Dict, Optional, List
+from typing import Optional, List, Sequence
 
-from src.backtesting.events import FillEvent
-from src.strategies.signal import SignalType
+from src.backtesting.events import FillEvent, FillLog
+from src.utils.jit import njit
 
 import numpy as np
 import pandas as pd
@@ -13,7 +15,7 @@ import pandas as pd
 TRADING_DAYS = 252
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class PerformanceSummary:
     total_return: float
     annualized_return: float
@@ -41,6 +43,60 @@ def _returns(equity: pd.Series) -> pd.Series:  # noqa: D401
     return equity.pct_change(fill_method=None).dropna()
 
 
+def _returns_array(equity: pd.Series | np.ndarray) -> np.ndarray:
+    """NumPy counterpart of :func:`_returns` (no index, missing values dropped).
+
+    Used by the scalar metrics, which never need the index; alignment-aware
+    callers (rolling windows, benchmark beta) keep using :func:`_returns`.
+    """
+    values = np.asarray(equity, dtype=np.float64)
+    ret = np.diff(values) / values[:-1]
+    return ret[~np.isnan(ret)]
+
+
+@njit(cache=True)
+def _bar_return(cur: float, prev: float) -> float:
+    """``(cur - prev) / prev`` with NumPy's ±inf/NaN result for ``prev == 0``.
+
+    Compiled (and plain Python) float division raises on a zero divisor
+    instead, e.g. for an equity curve that touches 0.
+    """
+
+    diff = cur - prev
+    if prev == 0:
+        if diff == 0 or diff != diff:
+            return np.nan
+        return np.copysign(np.inf, diff) * np.copysign(1.0, prev)
+    return diff / prev
+
+
+@njit(cache=True)
+def _return_moments(values: np.ndarray) -> tuple[int, float, float]:
+    """Count, mean and population std of :func:`_returns_array` (*values*).
+
+    Two passes over the prices (mean, then squared deviations) recompute
+    each return instead of storing it, so no returns array or temporaries
+    are built.  Mean/std are NaN when there are no returns.
+    """
+
+    count = 0
+    total = 0.0
+    for i in range(1, values.shape[0]):
+        r = _bar_return(values[i], values[i - 1])
+        if r == r:  # NaN returns are dropped, as in ``_returns``
+            count += 1
+            total += r
+    if count == 0:
+        return 0, np.nan, np.nan
+    mean = total / count
+    acc = 0.0
+    for i in range(1, values.shape[0]):
+        r = _bar_return(values[i], values[i - 1])
+        if r == r:
+            acc += (r - mean) * (r - mean)
+    return count, mean, np.sqrt(acc / count)
+
+
 # ---------------------------------------------------------------------------
 
 def total_return(equity: pd.Series) -> float:  # noqa: D401
@@ -52,55 +108,88 @@ def annualized_return(equity: pd.Series) -> float:  # noqa: D401
     return (equity.iloc[-1] / equity.iloc[0]) ** (TRADING_DAYS / n) - 1
 
 
-def volatility(equity: pd.Series) -> float:  # noqa: D401
-    ret = _returns(equity)
-    if ret.empty:
+def volatility(equity: pd.Series, ret: Optional[pd.Series | np.ndarray] = None) -> float:  # noqa: D401
+    """Annualised volatility; pass precomputed ``_returns(equity)`` as *ret* to reuse it."""
+    if ret is None:
+        count, _, sd = _return_moments(np.asarray(equity, dtype=np.float64))
+    else:
+        ret = np.asarray(ret, dtype=np.float64)
+        count, sd = ret.size, ret.std()
+    if count == 0:
         return np.nan
-    sd = ret.std(ddof=0)
     if np.isnan(sd):
         return 0.0
     return sd * np.sqrt(TRADING_DAYS)
 
 
-def sharpe_ratio(equity: pd.Series, risk_free: float = 0.0) -> float:  # noqa: D401
-    ret = _returns(equity) - risk_free / TRADING_DAYS
-    if ret.std(ddof=0) == 0:
+def sharpe_ratio(
+    equity: pd.Series, risk_free: float = 0.0, ret: Optional[pd.Series | np.ndarray] = None
+) -> float:  # noqa: D401
+    """Annualised Sharpe ratio; *ret* as in :func:`volatility`."""
+    ret = _returns_array(equity) if ret is None else np.asarray(ret, dtype=np.float64)
+    if ret.size == 0:
         return np.nan
-    return np.sqrt(TRADING_DAYS) * ret.mean() / ret.std(ddof=0)
+    ret = ret - risk_free / TRADING_DAYS
+    sd = ret.std()
+    if sd == 0:
+        return np.nan
+    return np.sqrt(TRADING_DAYS) * ret.mean() / sd
 
 
-def sortino_ratio(equity: pd.Series, risk_free: float = 0.0) -> float:  # noqa: D401
-    ret = _returns(equity) - risk_free / TRADING_DAYS
+def sortino_ratio(
+    equity: pd.Series, risk_free: float = 0.0, ret: Optional[pd.Series | np.ndarray] = None
+) -> float:  # noqa: D401
+    """Annualised Sortino ratio; *ret* as in :func:`volatility`."""
+    ret = _returns_array(equity) if ret is None else np.asarray(ret, dtype=np.float64)
+    ret = ret - risk_free / TRADING_DAYS
     downside = ret[ret < 0]
-    denom = downside.std(ddof=0)
+    if downside.size == 0:
+        return np.nan
+    denom = downside.std()
     if denom == 0:
         return np.nan
     return np.sqrt(TRADING_DAYS) * ret.mean() / denom
 
 
 def max_drawdown(equity: pd.Series) -> tuple[float, int]:  # noqa: D401
-    roll_max = equity.cummax()
-    drawdown = equity / roll_max - 1.0
-    max_dd = drawdown.min()
-    # duration
-    trough_idx = drawdown.idxmin()
-    post_trough = equity.loc[trough_idx:]
-    recovery_idx = post_trough[post_trough >= roll_max.loc[trough_idx]].first_valid_index()
-    if recovery_idx is None:
-        duration = len(equity) - equity.index.get_loc(trough_idx)
-    else:
-        duration = equity.index.get_loc(recovery_idx) - equity.index.get_loc(trough_idx)
-    return float(max_dd), int(duration)
+    # Reason: positional NumPy scans replace cummax/idxmin plus label lookups
+    # (``get_loc``), which dominated on long equity curves.
+    return EquityStats.from_series(equity).max_drawdown()
+
+
+def _align_values(x: pd.Series, y: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Values of *x* and *y* on their common index labels, in *x*'s order."""
+
+    xi, yi = x.index, y.index
+    if (
+        isinstance(xi, pd.DatetimeIndex)
+        and xi.dtype == yi.dtype
+        and xi.is_monotonic_increasing
+        and yi.is_monotonic_increasing
+        and xi.is_unique
+        and yi.is_unique
+    ):
+        # Reason: sorted unique timestamps (the usual case) can be matched on
+        # their int64 representation without any pandas alignment machinery.
+        xa, ya = xi.asi8, yi.asi8
+        common = np.intersect1d(xa, ya, assume_unique=True)
+        a = x.to_numpy(dtype=np.float64)[np.searchsorted(xa, common)]
+        b = y.to_numpy(dtype=np.float64)[np.searchsorted(ya, common)]
+        return a, b
+    idx = xi.intersection(yi, sort=False)
+    return x.reindex(idx).to_numpy(dtype=np.float64), y.reindex(idx).to_numpy(dtype=np.float64)
 
 
 def beta_vs_benchmark(equity: pd.Series, benchmark: pd.Series) -> float:  # noqa: D401
     ret = _returns(equity)
     bench_ret = _returns(benchmark)
-    aligned = pd.concat([ret, bench_ret], axis=1, join="inner").dropna()
-    if aligned.empty:
+    a, b = _align_values(ret, bench_ret)
+    mask = ~(np.isnan(a) | np.isnan(b))
+    a, b = a[mask], b[mask]
+    if a.size == 0:
         return np.nan
-    cov = np.cov(aligned.iloc[:, 0], aligned.iloc[:, 1])[0, 1]
-    var = aligned.iloc[:, 1].var(ddof=0)
+    cov = np.cov(a, b)[0, 1]
+    var = b.var()
     if var == 0:
         return np.nan
     return cov / var
@@ -109,43 +198,71 @@ def beta_vs_benchmark(equity: pd.Series, benchmark: pd.Series) -> float:  # noqa
 # ---------------------------------------------------------------------------
 
 
-def win_loss_ratio(trades: List[FillEvent] | None) -> float:
+@njit(cache=True)
+def _pair_round_trips(
+    sym_idx: np.ndarray, side: np.ndarray, n_syms: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Row indices ``(entries, exits)`` of closed round trips, in exit order."""
+
+    open_row = np.full(n_syms, -1, dtype=np.int64)
+    entries = np.empty(sym_idx.shape[0], dtype=np.int64)
+    exits = np.empty(sym_idx.shape[0], dtype=np.int64)
+    n = 0
+    for k in range(sym_idx.shape[0]):
+        s = sym_idx[k]
+        if side[k] > 0:
+            open_row[s] = k
+        elif open_row[s] >= 0:
+            entries[n] = open_row[s]
+            exits[n] = k
+            n += 1
+            open_row[s] = -1
+    return entries[:n], exits[:n]
+
+
+def round_trips(trades: Sequence[FillEvent]) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(entries, exits)`` fill records of closed round trips.
+
+    A SELL closes the most recent BUY in the same symbol, unless another SELL
+    has already closed it.
+    """
+
+    log = trades if isinstance(trades, FillLog) else FillLog.from_fills(trades)
+    rec = log.records
+    entries, exits = _pair_round_trips(rec["sym_idx"], rec["side"], len(log.symbols))
+    return rec[entries], rec[exits]
+
+
+def round_trip_pnls(trades: Sequence[FillEvent]) -> np.ndarray:
+    """Gross P&L of each closed round trip, in exit order."""
+
+    entries, exits = round_trips(trades)
+    return (exits["price"] - entries["price"]) * entries["qty"]
+
+
+def win_loss_ratio(trades: Sequence[FillEvent] | None) -> float:
     """Win/loss ratio for round-trip trades.
 
     Returns NaN if no closed trades.
     """
     if not trades:
         return np.nan
-    wins = 0
-    losses = 0
-    open_pos: Dict[str, FillEvent] = {}
-    for fill in trades:
-        if fill.fill_type == SignalType.BUY:
-            open_pos[fill.symbol] = fill
-        elif fill.fill_type == SignalType.SELL and fill.symbol in open_pos:
-            entry = open_pos.pop(fill.symbol)
-            pnl = (fill.price - entry.price) * entry.quantity
-            if pnl > 0:
-                wins += 1
-            else:
-                losses += 1
-    total = wins + losses
-    return np.nan if total == 0 else wins / total
-
-
-def average_trade_duration(trades: List[FillEvent] | None) -> float:
+    pnl = round_trip_pnls(trades)
+    if pnl.size == 0:
+        return np.nan
+    return int((pnl > 0).sum()) / pnl.size
+
+
+def average_trade_duration(trades: Sequence[FillEvent] | None) -> float:
     """Average holding period (days) between buy and sell fills."""
     if not trades:
         return np.nan
-    durations: List[int] = []
-    open_pos: Dict[str, FillEvent] = {}
-    for fill in trades:
-        if fill.fill_type == SignalType.BUY:
-            open_pos[fill.symbol] = fill
-        elif fill.fill_type == SignalType.SELL and fill.symbol in open_pos:
-            entry = open_pos.pop(fill.symbol)
-            durations.append((fill.time - entry.time).days)
-    return np.nan if not durations else float(np.mean(durations))
+    entries, exits = round_trips(trades)
+    if len(exits) == 0:
+        return np.nan
+    # floor division matches ``timedelta.days``
+    durations = (exits["time"] - entries["time"]) // np.timedelta64(1, "D")
+    return float(np.mean(durations))
 
 # ---------------------------------------------------------------------------
 
@@ -153,22 +270,55 @@ def average_trade_duration(trades: List[FillEvent] | None) -> float:
 def calmar_ratio(equity: pd.Series) -> float:  # noqa: D401
     """Calmar ratio: annualized return divided by absolute max drawdown."""
     ret = annualized_return(equity)
-    dd = equity / equity.cummax() - 1.0
-    max_dd = dd.min()
+    dd = EquityStats.from_series(equity).drawdown
+    # fmin skips NaN like ``Series.min`` (without nanmin's all-NaN warning)
+    max_dd = np.fmin.reduce(dd) if dd.size else np.nan
     if max_dd == 0:
         return np.nan
     return ret / abs(max_dd)
 
 
+@njit(cache=True)
+def _rolling_sharpe(r: np.ndarray, window: int, ann: float) -> np.ndarray:
+    """Rolling ``ann * mean / std`` (population std) over *window* bars.
+
+    Running sums make this O(n) in the window length.  A window whose values
+    are all identical is NaN, detected exactly by counting changes between
+    consecutive values rather than trusting the (residue-prone) variance.
+    """
+
+    n = r.shape[0]
+    out = np.full(n, np.nan)
+    s = 0.0
+    s2 = 0.0
+    changes = 0  # r[k] != r[k - 1] for k in the window, excluding its first bar
+    for i in range(n):
+        x = r[i]
+        s += x
+        s2 += x * x
+        if i > 0 and x != r[i - 1]:
+            changes += 1
+        if i >= window:
+            y = r[i - window]
+            s -= y
+            s2 -= y * y
+            if r[i - window + 1] != y:
+                changes -= 1
+        if i >= window - 1 and changes > 0:
+            m = s / window
+            v = s2 / window - m * m
+            if v > 0.0:
+                out[i] = ann * m / np.sqrt(v)
+    return out
+
+
 def rolling_sharpe_ratio(
     equity: pd.Series, window: int = 126, risk_free: float = 0.0
 ) -> pd.Series:  # noqa: D401
     """Compute rolling Sharpe ratio using a lookback window (default ~6 months)."""
     returns = _returns(equity) - risk_free / TRADING_DAYS
-    def _sharpe(x):
-        sd = x.std(ddof=0)
-        return np.nan if sd == 0 else np.sqrt(TRADING_DAYS) * x.mean() / sd
-    return returns.rolling(window=window).apply(_sharpe, raw=False)
+    out = _rolling_sharpe(returns.to_numpy(dtype=np.float64), window, np.sqrt(TRADING_DAYS))
+    return pd.Series(out, index=returns.index)
 
 
 def performance_report(
@@ -182,19 +332,122 @@ def performance_report(
 
 # ---------------------------------------------------------------------------
 
+@dataclass(slots=True)
+class EquityStats:
+    """Intermediates derived once from an equity curve and shared by metrics.
+
+    ``returns`` are simple bar returns with missing values dropped (as
+    :func:`_returns`); ``mean_ret`` / ``std_ret`` are their population
+    moments (NaN when there are none).
+    """
+
+    values: np.ndarray
+    returns: np.ndarray
+    roll_max: np.ndarray
+    drawdown: np.ndarray
+    mean_ret: float
+    std_ret: float
+
+    @classmethod
+    def from_series(cls, equity: pd.Series) -> "EquityStats":
+        values = equity.to_numpy(dtype=np.float64)
+        ret = _returns_array(values)
+        # fmax skips missing values like ``cummax`` does
+        roll_max = np.fmax.accumulate(values)
+        drawdown = values / roll_max - 1.0
+        if ret.size:
+            mean, std = float(ret.mean()), float(ret.std())
+        else:
+            mean = std = np.nan
+        return cls(values, ret, roll_max, drawdown, mean, std)
+
+    def max_drawdown(self) -> tuple[float, int]:
+        """Max drawdown and its duration (in bars)."""
+
+        # nanargmin skips missing values like ``idxmin`` does
+        trough = int(np.nanargmin(self.drawdown))
+        # argmax on the mask stops at the first recovery bar without
+        # materialising the index of every later one
+        recovered = self.values[trough:] >= self.roll_max[trough]
+        rec = int(recovered.argmax())
+        duration = rec if recovered[rec] else len(self.values) - trough
+        return float(self.drawdown[trough]), duration
+
+
 def summary(equity: pd.Series, benchmark: Optional[pd.Series] = None, trades: Optional[List[FillEvent]] = None) -> PerformanceSummary:  # noqa: D401
-    max_dd, dd_duration = max_drawdown(equity)
+    # Reason: every metric derives from the same equity values, returns and
+    # drawdown, so they are computed once instead of one pandas pass per helper.
+    stats = EquityStats.from_series(equity)
+    values, ret = stats.values, stats.returns
+
+    growth = values[-1] / values[0]
+    ann_return = growth ** (TRADING_DAYS / values.size) - 1
+    mean, std = stats.mean_ret, stats.std_ret
+    if ret.size:
+        downside = ret[ret < 0]
+        downside_std = downside.std() if downside.size else np.nan
+        vol = 0.0 if np.isnan(std) else std * np.sqrt(TRADING_DAYS)
+    else:
+        downside_std = vol = np.nan
+    sharpe = np.nan if std == 0 else np.sqrt(TRADING_DAYS) * mean / std
+    sortino = np.nan if downside_std == 0 else np.sqrt(TRADING_DAYS) * mean / downside_std
+
+    max_dd, dd_duration = stats.max_drawdown()
+    calmar = np.nan if max_dd == 0 else ann_return / abs(max_dd)
     beta = beta_vs_benchmark(equity, benchmark) if benchmark is not None else None
     return PerformanceSummary(
-        total_return=total_return(equity),
-        annualized_return=annualized_return(equity),
-        sharpe_ratio=sharpe_ratio(equity),
-        sortino_ratio=sortino_ratio(equity),
+        total_return=growth - 1,
+        annualized_return=ann_return,
+        sharpe_ratio=sharpe,
+        sortino_ratio=sortino,
         max_drawdown=max_dd,
         max_drawdown_duration=dd_duration,
-        volatility=volatility(equity),
-        calmar_ratio=calmar_ratio(equity),
+        volatility=vol,
+        calmar_ratio=calmar,
         win_loss_ratio=win_loss_ratio(trades) if trades is not None else None,
         avg_trade_duration=average_trade_duration(trades) if trades is not None else None,
         beta=beta,
     )
+
+
+# ---------------------------------------------------------------------------
+# Memoised summary -----------------------------------------------------------
+
+_SUMMARY_CACHE_SIZE = 128
+_summary_cache: "OrderedDict[tuple, PerformanceSummary]" = OrderedDict()
+
+
+def _fingerprint(series: pd.Series) -> tuple:
+    """Cheap content key for *series*: length, endpoints and a digest of values + index."""
+
+    values = series.to_numpy(dtype=np.float64)
+    digest = hashlib.blake2b(values.tobytes(), digest_size=16)
+    if isinstance(series.index, pd.DatetimeIndex):
+        digest.update(series.index.asi8.tobytes())
+    else:
+        digest.update(repr(tuple(series.index)).encode())
+    first = float(values[0]) if values.size else np.nan
+    last = float(values[-1]) if values.size else np.nan
+    return len(values), first, last, digest.hexdigest()
+
+
+def summary_cached(equity: pd.Series, benchmark: Optional[pd.Series] = None) -> PerformanceSummary:
+    """:func:`summary` memoised on the content of *equity* (and *benchmark*).
+
+    Repeated HTML/PDF/comparison rendering of the same curve reuses the
+    result.  Trade-based fields are not computed (``trades`` is not part of
+    the key); call :func:`summary` directly when they are needed.  Holds at
+    most ``_SUMMARY_CACHE_SIZE`` entries (LRU).  Summaries are immutable, so
+    cache hits return the stored instance itself.
+    """
+
+    key = (_fingerprint(equity), None if benchmark is None else _fingerprint(benchmark))
+    cached = _summary_cache.get(key)
+    if cached is None:
+        cached = summary(equity, benchmark)
+        _summary_cache[key] = cached
+        if len(_summary_cache) > _SUMMARY_CACHE_SIZE:
+            _summary_cache.popitem(last=False)
+    else:
+        _summary_cache.move_to_end(key)
+    return cached
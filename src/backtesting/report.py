@@ -11,6 +11,7 @@ Designed to integrate with BacktestEngine results.
 from __future__ import annotations
 
 from dataclasses import asdict
+from html import escape
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -24,14 +25,56 @@ except ModuleNotFoundError:  # pragma: no cover
     make_subplots = None  # type: ignore
 
 from src.backtesting.events import FillEvent
-from src.backtesting.metrics import PerformanceSummary, rolling_sharpe_ratio
+from src.backtesting.metrics import EquityStats, PerformanceSummary, round_trip_pnls, rolling_sharpe_ratio
 
 # ---------------------------------------------------------------------------
 
+# Line traces at least this long render with WebGL (``Scattergl``); browsers
+# slow down badly drawing SVG paths of tens of thousands of points.
+_WEBGL_MIN_POINTS = 10_000
+
+
+def _line(series: pd.Series, name: str, **kwargs) -> "go.Scatter":
+    """Line trace for *series*, using WebGL for long series."""
+
+    trace = go.Scattergl if len(series) >= _WEBGL_MIN_POINTS else go.Scatter
+    return trace(x=series.index, y=series, name=name, **kwargs)
+
+
+def _write_pdf(fig: "go.Figure", output_path: Path) -> None:
+    """Write *fig* to *output_path* as PDF via Kaleido.
+
+    The first export runs one-shot, so a missing Chrome still surfaces
+    plotly's error; after a successful one kaleido's sync server is started
+    and later exports reuse its browser instead of launching a new one.
+    """
+    fig.write_image(str(output_path), format="pdf")
+    try:  # already imported by plotly at this point
+        from kaleido import start_sync_server  # type: ignore[import-not-found]
+    except ImportError:  # pragma: no cover - kaleido < 1.1
+        return
+    start_sync_server(silence_warnings=True)  # no-op once running
+
 
 def _drawdown_series(equity: pd.Series) -> pd.Series:
     """Percentage drawdown series."""
-    return equity / equity.cummax() - 1.0
+    return pd.Series(EquityStats.from_series(equity).drawdown, index=equity.index)
+
+
+def _metrics_table_html(summary: PerformanceSummary) -> str:
+    """Render *summary* as a two-column HTML table (floats to 4 d.p.)."""
+
+    rows = "".join(
+        f"<tr><th>{escape(name)}</th><td>{value:.4f}</td></tr>"
+        if isinstance(value, float)
+        else f"<tr><th>{escape(name)}</th><td>{escape(str(value))}</td></tr>"
+        for name, value in asdict(summary).items()
+    )
+    return (
+        "<table border='1' class='dataframe'>"
+        "<thead><tr><th></th><th>Value</th></tr></thead>"
+        f"<tbody>{rows}</tbody></table>"
+    )
 
 
 class ReportGenerator:
@@ -61,26 +104,25 @@ class ReportGenerator:
         fig = make_subplots(rows=rows, cols=1, shared_xaxes=True, vertical_spacing=0.06, subplot_titles=subplot_titles)
 
         # Equity curve
-        fig.add_trace(go.Scatter(x=self.equity.index, y=self.equity, name="Equity"), row=1, col=1)
+        traces, trace_rows = [_line(self.equity, "Equity")], [1]
         if self.benchmark is not None:
-            fig.add_trace(go.Scatter(x=self.benchmark.index, y=self.benchmark, name="Benchmark"), row=1, col=1)
+            traces.append(_line(self.benchmark, "Benchmark"))
+            trace_rows.append(1)
 
         # Drawdown
         dd = _drawdown_series(self.equity) * 100.0  # percentage
-        fig.add_trace(go.Scatter(x=dd.index, y=dd, name="Drawdown", line=dict(color="firebrick")), row=2, col=1)
+        traces.append(_line(dd, "Drawdown", line=dict(color="firebrick")))
+        trace_rows.append(2)
 
         # Trade distribution
         if self.trades:
-            pnls = []
-            open_pos: Dict[str, FillEvent] = {}
-            for f in self.trades:
-                if f.fill_type.name == "BUY":
-                    open_pos[f.symbol] = f
-                elif f.fill_type.name == "SELL" and f.symbol in open_pos:
-                    entry = open_pos.pop(f.symbol)
-                    pnls.append((f.price - entry.price) * entry.quantity)
-            if pnls:
-                fig.add_trace(go.Histogram(x=pnls, name="Trade P&L", marker_color="royalblue"), row=3, col=1)
+            pnls = round_trip_pnls(self.trades)
+            if pnls.size:
+                traces.append(go.Histogram(x=pnls, name="Trade P&L", marker_color="royalblue"))
+                trace_rows.append(3)
+
+        # One call places every trace (no per-trace figure update)
+        fig.add_traces(traces, rows=trace_rows, cols=[1] * len(traces))
 
         fig.update_layout(height=600 + (rows - 2) * 200, title="Backtest Report", showlegend=True)
         fig.update_yaxes(ticksuffix="%", row=2, col=1)
@@ -94,10 +136,10 @@ class ReportGenerator:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         fig = self.build_figure()
 
-        # Append metrics summary as HTML table under the graph
-        metrics_table = pd.DataFrame([asdict(self.summary)]).T
-        metrics_table.columns = ["Value"]
-        table_html = metrics_table.to_html(float_format=lambda x: f"{x:.4f}" if isinstance(x, float) else x)
+        # Append metrics summary as HTML table under the graph.
+        # Reason: a direct join over the summary fields avoids building a
+        # DataFrame and pandas' per-cell float_format callback.
+        table_html = _metrics_table_html(self.summary)
 
         html = fig.to_html(full_html=False, include_plotlyjs="cdn")
         full_html = f"""
@@ -108,7 +150,9 @@ class ReportGenerator:
         {table_html}
         </body></html>
         """
-        output_path.write_text(full_html)
+        # Encode once and write in a single call; the page declares UTF-8, so
+        # don't depend on the platform's default text encoding.
+        output_path.write_bytes(full_html.encode("utf-8"))
         return output_path
 
     # ------------------------------------------------------------------
@@ -117,8 +161,7 @@ class ReportGenerator:
         """Save report as PDF (static image of charts). Requires 'kaleido'."""
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        fig = self.build_figure()
-        fig.write_image(str(output_path), format="pdf")
+        _write_pdf(self.build_figure(), output_path)
         return output_path
 
 
@@ -154,9 +197,7 @@ def generate_pdf_report(
 
 def comparison_equity_chart(equity_curves: Dict[str, pd.Series]) -> go.Figure:  # noqa: D401
     """Return a Plotly figure comparing multiple strategy equity curves."""
-    fig = go.Figure()
-    for name, series in equity_curves.items():
-        fig.add_trace(go.Scatter(x=series.index, y=series, name=name))
+    fig = go.Figure([_line(series, name) for name, series in equity_curves.items()])
     fig.update_layout(
         title="Strategy Equity Curve Comparison",
         yaxis_title="Equity",
@@ -177,6 +218,5 @@ def save_comparison_chart_html(equity_curves: Dict[str, pd.Series], output_path:
 def save_comparison_chart_pdf(equity_curves: Dict[str, pd.Series], output_path: str | Path) -> Path:
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig = comparison_equity_chart(equity_curves)
-    fig.write_image(str(output_path), format="pdf")
+    _write_pdf(comparison_equity_chart(equity_curves), output_path)
     return output_path
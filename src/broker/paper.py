@@ -5,23 +5,29 @@ price ticks.  Supports latency, slippage, and leverages the existing
 ``OrderBook`` + ``PortfolioManager`` infrastructure.
 """
 
-from collections import deque
+import heapq
 from datetime import datetime, timedelta
-from typing import Deque, Dict, List, Tuple, Union
+from itertools import count
+from typing import Dict, List, Tuple, Union
 
 from pathlib import Path
 from src.backtesting.events import FillEvent
-from src.orders.order import Order
+from src.orders.order import Order, to_ns
 from src.orders.order_book import OrderBook
 from src.portfolio.manager import PortfolioManager
-from src.strategies.signal import SignalType
+from src.strategies.signal import SIGNAL_CODES
 
+import numpy as np
 import pandas as pd
-from src.backtesting.metrics import summary
+from src.backtesting.metrics import summary_cached
 from src.backtesting.report import generate_html_report
 
 __all__ = ["PaperBroker"]
 
+# Ticks between authoritative equity recomputations (guards float drift and
+# external edits to ``portfolio``).
+_EQUITY_RESYNC_TICKS = 256
+
 
 class PaperBroker:
     """Simulated broker for live/paper trading.
@@ -41,12 +47,27 @@ class PaperBroker:
     ) -> None:
         self.latency = latency
         self.slippage_pct = slippage_pct
-        self._delay_queue: Deque[Tuple[datetime, Order]] = deque()
+        self.starting_cash = starting_cash
+        # Orders waiting out the latency window: ``_delay_queue`` maps order id
+        # -> (seq, order) in submission order; ``_release_heap`` holds
+        # (release_ns, seq, order id) so each tick pops only due orders even
+        # when submissions arrive out of time order.  Cancelled entries stay
+        # in the heap and are skipped when their seq no longer matches.
+        self._delay_queue: Dict[str, Tuple[int, Order]] = {}
+        self._release_heap: List[Tuple[int, int, str]] = []
+        self._seq = count()
         self.order_book = OrderBook(max_qty_per_fill=max_qty_per_fill)
         self.portfolio = PortfolioManager(starting_cash)
         self.fills: List[FillEvent] = []
-        self._equity_curve: List[Tuple[datetime, float]] = []
+        # Equity snapshots as parallel, geometrically grown arrays (UTC ns)
+        self._eq_times = np.empty(1024, dtype=np.int64)
+        self._eq_vals = np.empty(1024, dtype=np.float64)
+        self._eq_n = 0
+        self._eq_tz = None
         self._last_prices: Dict[str, float] = {}
+        # Running equity, updated incrementally per tick (see ``on_price_tick``)
+        self._equity_running = float(starting_cash)
+        self._ticks_since_sync = 0
 
     # ---------------------------------------------------------------------
     # Order submission ------------------------------------------------------
@@ -54,15 +75,14 @@ class PaperBroker:
         """Queue *order* for execution.  It will enter the book after *latency*."""
 
         ts = now or datetime.utcnow()
-        ready_ts = ts + self.latency
-        self._delay_queue.append((ready_ts, order))
+        seq = next(self._seq)
+        self._delay_queue[order.id] = (seq, order)
+        heapq.heappush(self._release_heap, (to_ns(ts + self.latency), seq, order.id))
 
     def cancel_order(self, order_id: str) -> bool:
         # Try pending queue first
-        for idx, (_, o) in enumerate(self._delay_queue):
-            if o.id == order_id:
-                del self._delay_queue[idx]
-                return True
+        if self._delay_queue.pop(order_id, None) is not None:
+            return True
         # Else active book
         return self.order_book.cancel_order(order_id)
 
@@ -81,12 +101,22 @@ class PaperBroker:
         """Process a price tick (OHLC).  Returns list of *new* fills."""
 
         # Track last prices
+        prev_price = self._last_prices.get(symbol, price)
         self._last_prices[symbol] = price
+        held = self.portfolio.quantity(symbol)
+        cash_before = self.portfolio.cash
 
         # Flush any queued orders that have cleared latency window
-        while self._delay_queue and self._delay_queue[0][0] <= time:
-            _, order = self._delay_queue.popleft()
-            self.order_book.add_order(order)
+        heap = self._release_heap
+        if heap:
+            now_ns = to_ns(time)
+            while heap and heap[0][0] <= now_ns:
+                _, seq, oid = heapq.heappop(heap)
+                entry = self._delay_queue.get(oid)
+                if entry is None or entry[0] != seq:  # cancelled / resubmitted
+                    continue
+                del self._delay_queue[oid]
+                self.order_book.add_order(entry[1])
 
         # Let the order-book attempt fills for this bar
         fills = self.order_book.process_bar(
@@ -101,19 +131,43 @@ class PaperBroker:
         # Apply slippage then update portfolio
         for f in fills:
             if self.slippage_pct:
-                if f.fill_type == SignalType.BUY:
-                    f.price *= 1 + self.slippage_pct
-                else:
-                    f.price *= 1 - self.slippage_pct
+                # BUY pays up (+1), SELL receives less (-1)
+                f.price *= 1 + SIGNAL_CODES[f.fill_type] * self.slippage_pct
             self.portfolio.apply_fill(f)
         if fills:
             self.fills.extend(fills)
 
-        # Record equity after processing this bar
-        equity = self.portfolio.total_equity(self._last_prices)
-        self._equity_curve.append((time, equity))
+        # Record equity after processing this bar.  Only *symbol* moved, so
+        # mark its old position to the new price and add the cash/qty change
+        # from this bar's fills instead of revaluing every position.
+        self._ticks_since_sync += 1
+        if self._ticks_since_sync >= _EQUITY_RESYNC_TICKS:
+            self._sync_equity()
+        else:
+            self._equity_running += held * (price - prev_price)
+            if fills:
+                self._equity_running += (self.portfolio.cash - cash_before) + (
+                    self.portfolio.quantity(symbol) - held
+                ) * price
+        self._record_equity(time, self._equity_running)
         return fills
 
+    def _sync_equity(self) -> None:
+        self._equity_running = self.portfolio.total_equity(self._last_prices)
+        self._ticks_since_sync = 0
+
+    def _record_equity(self, time: datetime, equity: float) -> None:
+        n = self._eq_n
+        if n == len(self._eq_times):
+            self._eq_times = np.resize(self._eq_times, 2 * n)
+            self._eq_vals = np.resize(self._eq_vals, 2 * n)
+        ts = pd.Timestamp(time)
+        if n == 0:
+            self._eq_tz = ts.tz
+        self._eq_times[n] = ts.value
+        self._eq_vals[n] = equity
+        self._eq_n = n + 1
+
     # ---------------------------------------------------------------------
     # Reporting / control ---------------------------------------------------
     def equity(self, prices: Dict[str, float]) -> float:  # noqa: D401
@@ -121,6 +175,17 @@ class PaperBroker:
 
         return self.portfolio.total_equity(prices)
 
+    def equity_curve(self) -> pd.Series:
+        """Recorded equity snapshots (one per tick) as a Series named ``equity``."""
+
+        n = self._eq_n
+        # Reason: the int64 buffer already holds epoch ns, so a dtype view
+        # builds the index in one pass with no per-element inference or copy.
+        index = pd.DatetimeIndex(self._eq_times[:n].view("datetime64[ns]"), copy=False)
+        if self._eq_tz is not None:
+            index = index.tz_localize("UTC").tz_convert(self._eq_tz)
+        return pd.Series(self._eq_vals[:n].copy(), index=index, name="equity")
+
     # ---------------------------------------------------------------------
     # Performance report ----------------------------------------------------
     def generate_performance_report(self, output_path: Union[str, Path]) -> Path:
@@ -132,23 +197,31 @@ class PaperBroker:
         Returns:
             Path to the generated HTML file.
         """
-        if not self._equity_curve:
+        if not self._eq_n:
             raise ValueError("No equity data recorded – run on_price_tick first")
-        times, equities = zip(*self._equity_curve)
-        series = pd.Series(equities, index=pd.to_datetime(times), name="equity")
-        perf_summary = summary(series)
+        series = self.equity_curve()
+        perf_summary = summary_cached(series)
         return generate_html_report(series, perf_summary, output_path, trades=self.fills)
 
     def reset(self) -> None:
-        """Reset internal state (orders, fills, cash/positions)."""
+        """Reset internal state (orders, fills, cash/positions, equity curve).
+
+        Afterwards the broker behaves like a freshly constructed one with the
+        same settings.
+        """
 
         self._delay_queue.clear()
+        self._release_heap.clear()
         self.order_book = OrderBook(self.order_book._max_qty_per_fill)
-        self.portfolio = PortfolioManager(self.portfolio.cash + self.portfolio.margin_used)
+        self.portfolio = PortfolioManager(self.starting_cash)
         self.fills.clear()
+        self._eq_n = 0
+        self._eq_tz = None
+        self._last_prices.clear()
+        self._sync_equity()
 
     # Convenience -----------------------------------------------------------
     def pending_orders(self) -> List[Order]:  # noqa: D401
-        return [o for _, o in self._delay_queue] + [
-            o for lst in self.order_book._orders.values() for o in lst if o.is_open()
-        ]
+        # Reason: the book drops orders as they fill or expire, so this is
+        # proportional to the open orders rather than every order submitted.
+        return [o for _, o in self._delay_queue.values()] + self.order_book.open_orders
@@ -1,10 +1,20 @@
+import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple, Type, get_origin
 
 import yaml
 from pydantic import BaseModel, Field, ValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from src.core.exceptions import ConfigError
+
+try:  # libyaml C backend when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 class AppSettings(BaseModel):
     """Application-wide settings loaded from YAML.
@@ -47,11 +57,38 @@ class StrategySettings(BaseModel):
 
 
 
+@lru_cache(maxsize=None)
+def _env_override_paths(model: Type[BaseModel]) -> Tuple[Tuple[Tuple[str, ...], bool], ...]:
+    """Field paths of *model* that may be overridden by ``A__B`` env vars.
+
+    Nested sub-models are walked recursively, e.g. ``("app", "env")`` for
+    ``APP__ENV``.  Each path comes with a flag marking ``dict`` fields, whose
+    keys are open-ended (``STRATEGY__PARAMETERS__FAST_WINDOW``).
+    """
+
+    paths = []
+    for name, field in model.model_fields.items():
+        ann = field.annotation
+        if isinstance(ann, type) and issubclass(ann, BaseModel):
+            paths.extend(((name, *sub), is_map) for sub, is_map in _env_override_paths(ann))
+        else:
+            paths.append(((name,), ann is dict or get_origin(ann) is dict))
+    return tuple(paths)
+
+
+def _set_path(raw: Dict[str, Any], parts: Tuple[str, ...] | list[str], value: Any) -> None:
+    current = raw
+    for part in parts[:-1]:
+        current = current.setdefault(part, {})
+    current[parts[-1]] = value
+
+
 class Config(BaseSettings):
     """Root configuration object.
 
     This class loads a YAML file and validates it using pydantic. Environment
-    variables override YAML values automatically via `BaseSettings`.
+    variables (``SECTION__FIELD``) override YAML values; :meth:`load` merges
+    them before validation.
 
     Args:
         path (str | Path): Path to a YAML config file.
@@ -66,6 +103,8 @@ class Config(BaseSettings):
         extra="forbid",
         env_nested_delimiter="__",
         case_sensitive=False,
+        validate_default=False,
+        revalidate_instances="never",
     )
 
     @classmethod
@@ -77,6 +116,9 @@ class Config(BaseSettings):
 
         Returns:
             Config: Validated configuration instance.
+
+        Raises:
+            ConfigError: If the merged configuration fails validation.
         """
 
         path = Path(path)
@@ -84,21 +126,38 @@ class Config(BaseSettings):
             raise FileNotFoundError(f"Config file not found: {path}")
 
         with path.open("r", encoding="utf-8") as f:
-            raw: Dict[str, Any] = yaml.safe_load(f) or {}
-
-        # Apply environment variable overrides manually so they take precedence
-        import os
-
-        for env_key, env_val in os.environ.items():
-            if "__" not in env_key:
-                continue
-            parts = env_key.lower().split("__")  # e.g., APP__ENV -> ["app", "env"]
-            current: Dict[str, Any] = raw
-            for part in parts[:-1]:
-                current = current.setdefault(part, {})  # type: ignore[assignment]
-            current[parts[-1]] = env_val
-
+            raw: Dict[str, Any] = yaml.load(f, Loader=_YamlLoader) or {}
+
+        # Apply environment variable overrides manually so they take precedence.
+        # Names match case-insensitively; only declared fields (and keys
+        # under ``dict`` fields) are applied, so unrelated ``X__Y`` variables
+        # cannot trip ``extra="forbid"``.
+        env = {key.lower(): val for key, val in os.environ.items() if "__" in key}
+        if env:
+            for parts, is_map in _env_override_paths(cls):
+                if len(parts) < 2:
+                    continue
+                name = "__".join(parts)
+                env_val = env.get(name)
+                if env_val is not None:
+                    if is_map:
+                        try:  # a whole mapping, as JSON
+                            env_val = json.loads(env_val)
+                        except ValueError:
+                            pass  # validation reports the non-dict value
+                    _set_path(raw, parts, env_val)
+                if is_map:
+                    prefix = name + "__"
+                    for key, val in env.items():
+                        if key.startswith(prefix):
+                            _set_path(raw, [*parts, *key[len(prefix):].split("__")], val)
+
+        # Reason: ``model_validate`` skips BaseSettings' own env-source pass,
+        # which would redo the override merge above.
         try:
-            return cls(**raw)  # type: ignore[arg-type]
+            return cls.model_validate(raw)
         except ValidationError as err:
-            raise ValueError(f"Invalid configuration:\n{err}") from err
+            details = "; ".join(
+                f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in err.errors()
+            )
+            raise ConfigError(f"Invalid configuration: {details}") from err
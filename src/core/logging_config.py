@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import sys
+from contextlib import contextmanager
 from functools import wraps
 from pathlib import Path
-from time import perf_counter
-from typing import Callable, Iterable
+from time import perf_counter_ns
+from typing import Callable, Iterable, Iterator
 import uuid
 import contextvars
 
@@ -29,11 +31,40 @@ def get_correlation_id() -> str | None:
     return _correlation_id_ctx.get()
 
 
-def _inject_correlation_id(record: dict) -> bool:
-    """Loguru filter to inject correlation_id into each record."""
+_cid_get = _correlation_id_ctx.get
 
-    record["extra"]["correlation_id"] = get_correlation_id() or "-"
-    return True
+
+def _inject_correlation_id(record: dict) -> None:
+    """Loguru patcher to inject correlation_id into each record."""
+
+    cid = _cid_get()
+    record["extra"]["correlation_id"] = "-" if cid is None else cid
+
+
+# Reason: with ``lazy=True`` the message and its ``extra`` payload are only
+# built once loguru has found a sink accepting INFO records.
+_lazy_logger = logger.opt(lazy=True)
+
+
+def _log_duration(name: str, start_ns: int) -> None:
+    duration_ms = (perf_counter_ns() - start_ns) / 1e6
+    _lazy_logger.info(
+        "{} executed in {:.2f} ms",
+        lambda: name,
+        lambda: duration_ms,
+        extra=lambda: {"metric": "timing", "duration_ms": duration_ms},
+    )
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Context manager that logs the execution time of its block at INFO."""
+
+    start = perf_counter_ns()
+    try:
+        yield
+    finally:
+        _log_duration(name, start)
 
 
 def log_timing(name: str | None = None) -> Callable[[Callable[..., T]], Callable[..., T]]:
@@ -44,17 +75,15 @@ def log_timing(name: str | None = None) -> Callable[[Callable[..., T]], Callable
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        label = name or func.__name__
+
         @wraps(func)
         def wrapper(*args, **kwargs):  # type: ignore[no-any-unbound]
-            start = perf_counter()
+            start = perf_counter_ns()
             try:
                 return func(*args, **kwargs)
             finally:
-                duration_ms = (perf_counter() - start) * 1000
-                logger.info(
-                    f"{name or func.__name__} executed in {duration_ms:.2f} ms",
-                    extra={"metric": "timing", "duration_ms": duration_ms},
-                )
+                _log_duration(label, start)
 
         return wrapper  # type: ignore[return-value]
 
@@ -78,15 +107,19 @@ def setup_logging(log_dir: str | Path = "logs", level: str = "INFO") -> None:
 
     # Remove default handler to avoid duplicate logs
     logger.remove()
+    # Reason: a patcher runs once per record; a sink filter would repeat the
+    # ContextVar lookup for every handler.
+    logger.configure(patcher=_inject_correlation_id)
 
     fmt = "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level:^8} | {extra[correlation_id]} | {message}"
 
-    # Console handler
+    # Console handler; like the file sink, records are written from loguru's
+    # background thread so callers never block on terminal I/O.
     logger.add(
-        lambda msg: print(msg, end=""),
+        sys.stderr,
         level=level,
         format=fmt,
-        filter=_inject_correlation_id,
+        enqueue=True,
     )
 
     # File handler with rotation and retention
@@ -94,7 +127,6 @@ def setup_logging(log_dir: str | Path = "logs", level: str = "INFO") -> None:
         log_file,
         level=level,
         format=fmt,
-        filter=_inject_correlation_id,
         rotation="10 MB",
         retention="10 days",
         compression="zip",
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Dict, List
@@ -14,6 +15,13 @@ class DataProvider(ABC):
     ) -> pd.DataFrame:
         """Fetch historical OHLCV data for a single symbol."""
 
+    async def get_historical_data_async(
+        self, symbol: str, start_date: datetime, end_date: datetime
+    ) -> pd.DataFrame:
+        """Awaitable :meth:`get_historical_data`; runs it in a worker thread by default."""
+
+        return await asyncio.to_thread(self.get_historical_data, symbol, start_date, end_date)
+
     @abstractmethod
     def get_real_time_quote(self, symbol: str) -> Dict[str, float]:
         """Fetch current quote for a single symbol."""
@@ -1,21 +1,34 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 import yfinance as yf
 
+import json
+import mmap
 import os
 import pickle
-import time
 from pathlib import Path
 import re
 
+try:  # parquet engine for the on-disk cache
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    _PARQUET = True
+except ModuleNotFoundError:  # pragma: no cover
+    _PARQUET = False
+
 from ...core.exceptions import DataProviderError
-from ...utils import is_valid_symbol
+from ...utils import TokenBucket, is_valid_symbol
 from .base import DataProvider
 
+# Concurrent ``Ticker.fast_info`` lookups in :meth:`YahooFinanceProvider.get_multiple_quotes`
+_QUOTE_WORKERS = 16
+
 
 class YahooFinanceProvider(DataProvider):
     """Yahoo Finance data provider using yfinance library.
@@ -23,16 +36,24 @@ class YahooFinanceProvider(DataProvider):
     Args:
         cache (bool): Enable file-based caching of historical data.
         cache_dir (str | Path): Directory to store cached files.
-        min_interval (float): Minimum seconds between API calls (rate limiting).
+        min_interval (float): Average seconds between API calls (rate limiting).
+        burst (int): API calls allowed back-to-back before pacing applies.
     """
 
-    def __init__(self, cache: bool = False, cache_dir: str | Path = "data/cache", min_interval: float = 1.0) -> None:
+    def __init__(
+        self,
+        cache: bool = False,
+        cache_dir: str | Path = "data/cache",
+        min_interval: float = 1.0,
+        burst: int = 1,
+    ) -> None:
         self.cache = cache
         self.cache_dir = Path(cache_dir)
         if self.cache:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.min_interval = min_interval
-        self._last_call_ts: float = 0.0
+        # Shared by every worker thread the pipeline fetches from
+        self._limiter = TokenBucket(1.0 / min_interval, burst) if min_interval > 0 else None
 
     # ------------------------ internal helpers ---------------------
 
@@ -44,41 +65,200 @@ class YahooFinanceProvider(DataProvider):
         return df
 
     def _rate_limit(self) -> None:
-        now = time.time()
-        elapsed = now - self._last_call_ts
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        self._last_call_ts = time.time()
+        if self._limiter is not None and self.min_interval > 0:
+            self._limiter.acquire()
 
-    def _cache_path(self, ticker: str, start: datetime, end: datetime) -> Path:
-        key = f"{ticker}_{start:%Y%m%d}_{end:%Y%m%d}.pkl"
-        return self.cache_dir / key
+    # yfinance's default bar size; part of the cache file name so intraday
+    # pulls never mix with daily ones.
+    interval: str = "1d"
 
-    def _fetch(self, ticker: str, start: datetime, end: datetime) -> pd.DataFrame:
-        # Try cache first
-        if self.cache:
-            pth = self._cache_path(ticker, start, end)
-            if pth.is_file():
-                with pth.open("rb") as f:
-                    return pickle.load(f)
+    def _cache_path(self, ticker: str) -> Path:
+        # One file per (ticker, interval); requests for any sub-range of the
+        # span it covers are served by slicing (see ``_read_coverage``).
+        suffix = ".parquet" if _PARQUET else ".pkl"
+        return self.cache_dir / f"{ticker}_{self.interval}{suffix}"
 
-        # Rate limiting
-        self._rate_limit()
+    @staticmethod
+    def _meta_path(pth: Path) -> Path:
+        return pth.with_name(pth.stem + ".meta.json")
+
+    @staticmethod
+    def _read_cache(pth: Path) -> pd.DataFrame:
+        # Reason: deserialise straight from the kernel's page cache via a
+        # memory map instead of copying the file into a userspace buffer.
+        if pth.suffix == ".parquet":
+            table = pq.read_table(pa.memory_map(str(pth), "r"))
+            return table.to_pandas(self_destruct=True, split_blocks=True)
+        with pth.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return pickle.loads(mm)
+
+    @staticmethod
+    def _write_cache(pth: Path, data: pd.DataFrame) -> None:
+        # Write to a temp file first so an interrupted run never leaves a
+        # truncated cache entry behind.
+        tmp = pth.with_name(pth.name + ".tmp")
+        if pth.suffix == ".parquet":
+            # Column statistics let readers skip row groups outside a range
+            pq.write_table(
+                pa.Table.from_pandas(data),
+                str(tmp),
+                compression="zstd",
+                use_dictionary=True,
+                write_statistics=True,
+            )
+        else:
+            with tmp.open("wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, pth)
+
+    @classmethod
+    def _read_coverage(cls, pth: Path) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """Requested ``[start, end)`` span the cache file at *pth* holds."""
 
+        meta = cls._meta_path(pth)
+        if not (pth.is_file() and meta.is_file()):
+            return None
+        span = json.loads(meta.read_text())
+        return pd.Timestamp(span["start"]), pd.Timestamp(span["end"])
+
+    @classmethod
+    def _write_coverage(cls, pth: Path, start: pd.Timestamp, end: pd.Timestamp) -> None:
+        meta = cls._meta_path(pth)
+        tmp = meta.with_name(meta.name + ".tmp")
+        tmp.write_text(json.dumps({"start": start.isoformat(), "end": end.isoformat()}))
+        os.replace(tmp, meta)
+
+    @staticmethod
+    def _bound(ts: datetime) -> pd.Timestamp:
+        """Comparable form of a range bound: tz-aware values become naive UTC."""
+
+        ts = pd.Timestamp(ts)
+        return ts.tz_convert(None) if ts.tz is not None else ts
+
+    @staticmethod
+    def _slice(data: pd.DataFrame, start: datetime, end: datetime) -> pd.DataFrame:
+        """Rows of *data* in ``[start, end)`` (yfinance's end is exclusive)."""
+
+        lo, hi = pd.Timestamp(start), pd.Timestamp(end)
+        index = pd.DatetimeIndex(data.index)
+        if index.tz is not None:
+            # Naive bounds are read as wall-clock time in the data's zone
+            lo = lo.tz_localize(index.tz) if lo.tz is None else lo
+            hi = hi.tz_localize(index.tz) if hi.tz is None else hi
+        elif lo.tz is not None or hi.tz is not None:
+            lo = lo.tz_convert(None) if lo.tz is not None else lo
+            hi = hi.tz_convert(None) if hi.tz is not None else hi
+        return data[(index >= lo) & (index < hi)]
+
+    def _download(self, ticker: str, start: datetime, end: datetime) -> pd.DataFrame:
+        self._rate_limit()
         data = yf.download(ticker, start=start, end=end, progress=False)
-        if data.empty:
-            raise DataProviderError(f"No data returned for ticker: {ticker}")
         data.index.name = "date"
-        data = self._clean(data)
+        return self._clean(data)
 
-        if self.cache:
-            with self._cache_path(ticker, start, end).open("wb") as f:
-                pickle.dump(data, f)
+    def _fetch(self, ticker: str, start: datetime, end: datetime) -> pd.DataFrame:
+        if not self.cache:
+            return self._checked(ticker, self._download(ticker, start, end))
+
+        pth = self._cache_path(ticker)
+        lo, hi = self._bound(start), self._bound(end)
+        coverage = self._read_coverage(pth)
+        if coverage is None:
+            data = self._checked(ticker, self._download(ticker, start, end))
+            span = (lo, hi)
+        else:
+            c_lo, c_hi = coverage
+            data = self._read_cache(pth)
+            if c_lo <= lo and hi <= c_hi:
+                return self._checked(ticker, self._slice(data, start, end))
+            # Only download the missing edges.  The new span is the union of
+            # both ranges, so keep it contiguous by bridging any gap.
+            span = (min(lo, c_lo), max(hi, c_hi))
+            pieces = [data]
+            if span[0] < c_lo:
+                pieces.append(self._download(ticker, span[0], c_lo))
+            if c_hi < span[1]:
+                pieces.append(self._download(ticker, c_hi, span[1]))
+            data = pd.concat(pieces)
+            data = data[~data.index.duplicated(keep="last")].sort_index()
+
+        self._write_cache(pth, data)
+        self._write_coverage(pth, *span)
+        return self._checked(ticker, self._slice(data, start, end))
+
+    @staticmethod
+    def _checked(ticker: str, data: pd.DataFrame) -> pd.DataFrame:
+        if data.empty:
+            raise DataProviderError(f"No data returned for ticker: {ticker}")
         return data
 
+    def get_historical_data_batch(
+        self, symbols: List[str], start_date: datetime, end_date: datetime
+    ) -> Dict[str, pd.DataFrame]:
+        """Fetch several symbols, downloading uncached ones in one request.
+
+        Returns a mapping of symbol -> OHLCV frame; symbols without data
+        are omitted.
+        """
+
+        self._check_symbols(symbols)
+
+        out: Dict[str, pd.DataFrame] = {}
+        pending: List[str] = []
+        for sym in symbols:
+            if self.cache and self._read_coverage(self._cache_path(sym)) is not None:
+                # Cached span: slice it, downloading only missing edges
+                try:
+                    out[sym] = self._fetch(sym, start_date, end_date)
+                except DataProviderError:
+                    pass
+            else:
+                pending.append(sym)
+        if not pending:
+            return out
+
+        self._rate_limit()
+        raw = yf.download(
+            " ".join(pending),
+            start=start_date,
+            end=end_date,
+            group_by="ticker",
+            threads=True,
+            progress=False,
+        )
+        grouped = isinstance(raw.columns, pd.MultiIndex)
+        tickers = set(raw.columns.get_level_values(0)) if grouped else set()
+        span = (self._bound(start_date), self._bound(end_date))
+        for sym in pending:
+            if grouped:
+                if sym not in tickers:
+                    continue
+                data = raw[sym].dropna(how="all")
+            else:  # older yfinance flattens single-ticker results
+                data = raw
+            data.index.name = "date"
+            data = self._clean(data)
+            if data.empty:
+                continue
+            if self.cache:
+                pth = self._cache_path(sym)
+                self._write_cache(pth, data)
+                self._write_coverage(pth, *span)
+            data = self._slice(data, start_date, end_date)
+            if not data.empty:
+                out[sym] = data
+        return out
+
     def validate_symbol(self, symbol: str) -> bool:  # type: ignore[override]
         return is_valid_symbol(symbol)
 
+    def _check_symbols(self, symbols: List[str]) -> None:
+        # Stops at the first bad symbol; the full list is only built to
+        # report the error.
+        if not all(map(self.validate_symbol, symbols)):
+            invalid = [s for s in symbols if not self.validate_symbol(s)]
+            raise DataProviderError(f"Invalid symbol(s): {', '.join(invalid)}")
+
     def get_historical_data(
         self, symbol: str, start_date: datetime, end_date: datetime
     ) -> pd.DataFrame:
@@ -86,28 +266,38 @@ class YahooFinanceProvider(DataProvider):
             raise DataProviderError(f"Invalid symbol: {symbol}")
         return self._fetch(symbol, start_date, end_date)
 
+    @staticmethod
+    def _last_price(ticker: Any) -> Optional[float]:
+        """Latest price of *ticker*, preferring the lightweight ``fast_info``."""
+
+        # Reason: ``Ticker.info`` scrapes and parses the full quote summary
+        # (~100KB) for one number; ``fast_info`` only fetches price fields.
+        try:
+            return ticker.fast_info["last_price"]
+        except KeyError:
+            return ticker.info.get("regularMarketPrice")
+
     def get_real_time_quote(self, symbol: str) -> Dict[str, float]:
         if not self.validate_symbol(symbol):
             raise DataProviderError(f"Invalid symbol: {symbol}")
         self._rate_limit()
         ticker = yf.Ticker(symbol)
-        price = ticker.info.get("regularMarketPrice")
+        price = self._last_price(ticker)
         if price is None:
             raise DataProviderError(f"Unable to fetch quote for {symbol}")
         return {"price": price}
 
     def get_multiple_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, float]]:
-        invalid = [s for s in symbols if not self.validate_symbol(s)]
-        if invalid:
-            raise DataProviderError(f"Invalid symbol(s): {', '.join(invalid)}")
+        self._check_symbols(symbols)
         self._rate_limit()
         tickers = yf.Tickers(" ".join(symbols))
-        quotes: Dict[str, Dict[str, float]] = {}
-        for sym in symbols:
-            price = tickers.tickers[sym].info.get("regularMarketPrice")
-            if price is None:
-                continue
-            quotes[sym] = {"price": price}
+        # Reason: each ``fast_info`` lookup is its own blocking HTTPS round trip,
+        # so overlap them on a small thread pool instead of one after another.
+        with ThreadPoolExecutor(max_workers=max(1, min(_QUOTE_WORKERS, len(symbols)))) as pool:
+            prices = pool.map(lambda sym: self._last_price(tickers.tickers[sym]), symbols)
+            quotes: Dict[str, Dict[str, float]] = {
+                sym: {"price": price} for sym, price in zip(symbols, prices) if price is not None
+            }
         if not quotes:
             raise DataProviderError("No quotes retrieved for provided symbols")
         return quotes
@@ -1,16 +1,36 @@
 from __future__ import annotations
 
+import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Any, Dict, Generator, Optional
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import QueuePool, StaticPool
 
 _DEFAULT_DB_PATH = Path("data/market_data.db")
 
+# Applied to every new SQLite connection: WAL lets readers proceed while a
+# writer commits, and synchronous=NORMAL only fsyncs at WAL checkpoints.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-65536",  # 64 MiB
+)
+
+
+def _set_sqlite_pragmas(dbapi_conn, _connection_record) -> None:  # noqa: ANN001
+    cur = dbapi_conn.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cur.execute(pragma)
+    finally:
+        cur.close()
+
 
 def _build_db_url(db_path: Path | str | None = None) -> str:
     if db_path is None:
@@ -21,6 +41,19 @@ def _build_db_url(db_path: Path | str | None = None) -> str:
     return f"sqlite:///{db_path.as_posix()}"
 
 
+def _executemany_options(db_url: str) -> Dict[str, Any]:
+    """Driver options for fast multi-row writes (``session.execute(stmt, rows)``).
+
+    sqlite3's ``executemany`` already reuses one prepared statement, so only
+    psycopg2 needs batching turned on.
+    """
+
+    url = make_url(db_url)
+    if url.get_backend_name() == "postgresql" and url.get_driver_name() == "psycopg2":
+        return {"executemany_mode": "values_plus_batch", "insertmanyvalues_page_size": 1000}
+    return {}
+
+
 def get_engine(db_url: Optional[str] = None, pool_size: int = 5) -> Engine:
     """Return a SQLAlchemy engine with connection pooling."""
 
@@ -32,31 +65,113 @@ def get_engine(db_url: Optional[str] = None, pool_size: int = 5) -> Engine:
         poolclass=QueuePool,
         pool_size=pool_size,
         connect_args=connect_args,
+        **_executemany_options(db_url),
     )
+    if engine.url.get_backend_name() == "sqlite":
+        event.listen(engine, "connect", _set_sqlite_pragmas)
     return engine
 
 
-# Lazy global engine for convenience
+def get_writer_engine(db_url: Optional[str] = None) -> Engine:
+    """Return an engine whose pool holds exactly one connection for writes.
+
+    SQLite allows one writer at a time, so funnelling writes through one
+    connection avoids BUSY retries between pooled writers. The pool hands
+    that connection to one session at a time; other threads wait for it
+    (up to ``pool_timeout``) instead of sharing its transaction.
+
+    An in-memory database lives only as long as its connection, so it gets
+    a ``StaticPool`` (one connection shared by all sessions) instead.
+    """
+
+    db_url = db_url or _build_db_url(None)
+    if not db_url.startswith("sqlite"):
+        return get_engine(db_url)
+    if _is_memory_db(db_url):
+        engine = create_engine(
+            db_url, echo=False, poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        return engine
+    engine = create_engine(
+        db_url,
+        echo=False,
+        poolclass=QueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=30,
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+def get_reader_engine(db_url: Optional[str] = None, pool_size: int = 5) -> Engine:
+    """Return a pooled engine for read-only sessions (concurrent under WAL)."""
+
+    return get_engine(db_url, pool_size=pool_size)
+
+
+def _is_memory_db(db_url: str) -> bool:
+    return db_url.startswith("sqlite") and (db_url.endswith(":memory:") or db_url.rstrip("/") == "sqlite:")
+
+
+# Lazy global engines for convenience: ``_ENGINE`` is the writer.
 _ENGINE: Optional[Engine] = None
+_READ_ENGINE: Optional[Engine] = None
 _SessionLocal: Optional[sessionmaker] = None
+_ReadSessionLocal: Optional[sessionmaker] = None
+# True when ``_ENGINE`` pools a single write connection (file-backed SQLite):
+# a second writer session on the same thread would wait on itself.
+_EXCLUSIVE_WRITER = False
+_writer_local = threading.local()
 
 
 def init_engine(db_url: Optional[str] = None) -> Engine:
-    global _ENGINE, _SessionLocal  # noqa: PLW0603
+    """Create the global writer/reader engines (once) and return the writer."""
+
+    global _ENGINE, _READ_ENGINE, _SessionLocal, _ReadSessionLocal, _EXCLUSIVE_WRITER  # noqa: PLW0603
     if _ENGINE is None:
-        _ENGINE = get_engine(db_url)
+        db_url = db_url or _build_db_url(None)
+        _ENGINE = get_writer_engine(db_url)
+        _EXCLUSIVE_WRITER = db_url.startswith("sqlite") and not _is_memory_db(db_url)
+        # Reason: every connection to an in-memory database is a separate
+        # database, and non-SQLite backends handle concurrent writers
+        # themselves, so only file-backed SQLite gets a separate reader pool.
+        if _is_memory_db(db_url) or not db_url.startswith("sqlite"):
+            _READ_ENGINE = _ENGINE
+        else:
+            _READ_ENGINE = get_reader_engine(db_url)
         _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_ENGINE)
+        _ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_READ_ENGINE)
     return _ENGINE
 
 
 @contextmanager
-def get_session() -> Generator[Session, None, None]:
-    """Provide a transactional scope around a series of operations."""
+def get_session(readonly: bool = False) -> Generator[Session, None, None]:
+    """Provide a transactional scope around a series of operations.
+
+    Args:
+        readonly: Bind to the pooled reader engine instead of the single
+            writer connection. Use for queries such as ``load_historical_df``.
+
+    Raises:
+        RuntimeError: On a writer session nested inside another on the same
+            thread while the single writer connection is checked out.
+    """
 
     if _ENGINE is None or _SessionLocal is None:
         init_engine()
-    assert _SessionLocal is not None  # Guard for mypy
-    session: Session = _SessionLocal()
+    factory = _ReadSessionLocal if readonly else _SessionLocal
+    assert factory is not None  # Guard for mypy
+    guard = _EXCLUSIVE_WRITER and not readonly
+    if guard:
+        # Reason: fail fast instead of blocking for ``pool_timeout`` on a
+        # connection this thread already holds.
+        if getattr(_writer_local, "active", False):
+            raise RuntimeError("Nested writer session on the same thread; reuse the open session")
+        _writer_local.active = True
+    session: Session = factory()
     try:
         yield session
         session.commit()
@@ -65,3 +180,5 @@ def get_session() -> Generator[Session, None, None]:
         raise
     finally:
         session.close()
+        if guard:
+            _writer_local.active = False
@@ -3,45 +3,52 @@ from __future__ import annotations
 from typing import Callable, Dict
 
 from sqlalchemy import text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
 
 from .models import Base
 
 # Define migration callbacks keyed by version number
-MIGRATIONS: Dict[int, Callable[[Engine], None]] = {}
+MIGRATIONS: Dict[int, Callable[[Connection], None]] = {}
 
 
-def _migration_1(engine: Engine) -> None:
+def _migration_1(conn: Connection) -> None:
     """Initial schema creation."""
 
-    Base.metadata.create_all(engine)
+    Base.metadata.create_all(conn)
+
+
+def _migration_2(conn: Connection) -> None:
+    """Drop single-column indexes made redundant by the (symbol, date) unique index."""
+
+    conn.execute(text("DROP INDEX IF EXISTS ix_market_data_symbol"))
+    conn.execute(text("DROP INDEX IF EXISTS ix_market_data_date"))
 
 
 # Register migration functions
 MIGRATIONS[1] = _migration_1
+MIGRATIONS[2] = _migration_2
 
 
-def get_current_version(engine: Engine) -> int:
-    with engine.begin() as conn:
-        conn.execute(
-            text(
-                "CREATE TABLE IF NOT EXISTS schema_version (version INTEGER PRIMARY KEY)"
-            )
+def get_current_version(conn: Connection) -> int:
+    conn.execute(
+        text(
+            "CREATE TABLE IF NOT EXISTS schema_version (version INTEGER PRIMARY KEY)"
         )
-        val = conn.execute(text("SELECT MAX(version) FROM schema_version")).scalar()
-        return int(val or 0)
+    )
+    val = conn.execute(text("SELECT MAX(version) FROM schema_version")).scalar()
+    return int(val or 0)
 
 
-def set_version(engine: Engine, version: int) -> None:
-    with engine.begin() as conn:
-        conn.execute(text("INSERT INTO schema_version (version) VALUES (:v)"), {"v": version})
+def set_version(conn: Connection, version: int) -> None:
+    conn.execute(text("INSERT INTO schema_version (version) VALUES (:v)"), {"v": version})
 
 
 def run_migrations(engine: Engine) -> None:
-    """Apply any outstanding migrations in order."""
+    """Apply any outstanding migrations in order, in a single transaction."""
 
-    current = get_current_version(engine)
-    for ver in sorted(MIGRATIONS):
-        if ver > current:
-            MIGRATIONS[ver](engine)
-            set_version(engine, ver)
+    with engine.begin() as conn:
+        current = get_current_version(conn)
+        for ver in sorted(MIGRATIONS):
+            if ver > current:
+                MIGRATIONS[ver](conn)
+                set_version(conn, ver)
@@ -13,14 +13,17 @@ class MarketData(Base):
 
     __tablename__ = "market_data"
     id = Column(Integer, primary_key=True, autoincrement=True)
-    symbol = Column(String(10), nullable=False, index=True)
-    date = Column(Date, nullable=False, index=True)
+    symbol = Column(String(10), nullable=False)
+    date = Column(Date, nullable=False)
     open = Column(Float, nullable=False)
     high = Column(Float, nullable=False)
     low = Column(Float, nullable=False)
     close = Column(Float, nullable=False)
     volume = Column(BigInteger, nullable=False)
 
+    # The unique constraint's (symbol, date) index serves every lookup
+    # (``symbol = ? AND date BETWEEN ? AND ? ORDER BY date``) without a sort,
+    # so no separate single-column indexes are kept.
     __table_args__ = (
         UniqueConstraint("symbol", "date", name="uq_symbol_date"),
     )
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import List
 
+import numpy as np
 import pandas as pd
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from .models import MarketData
@@ -12,41 +14,144 @@ from .models import MarketData
 
 # ------------------ insertion utilities ------------------
 
+_OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+_OHLCV_FRAME_COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+_INSERTS = {"sqlite": sqlite_insert, "postgresql": pg_insert}
+
+
+def prepare_for_insert(symbol: str, df: pd.DataFrame) -> tuple[list[dict], int]:
+    """Validate *df* and build ``MarketData`` upsert rows in a single pass.
+
+    Column names are matched case-insensitively (as ``normalize_ohlcv``) and
+    rows with a missing OHLCV value are dropped.
+
+    Returns:
+        ``(records, n_dropped)``.
+
+    Raises:
+        ValueError: If an OHLCV column is missing.
+    """
+
+    cols = {str(c).capitalize(): c for c in df.columns}
+    missing = [c for c in _OHLCV_FRAME_COLUMNS if c not in cols]
+    if missing:
+        raise ValueError(f"Missing OHLCV columns: {', '.join(missing)}")
+
+    # Cast each column once; ``tolist`` yields native Python floats/ints so
+    # the DBAPI needs no per-value NumPy scalar conversion.
+    ohlc = df[[cols[c] for c in _OHLCV_FRAME_COLUMNS[:4]]].to_numpy(dtype=np.float64)
+    volume = df[cols["Volume"]].to_numpy(dtype=np.float64)
+    keep = ~(np.isnan(ohlc).any(axis=1) | np.isnan(volume))
+    dates = pd.to_datetime(df.index).date  # calendar dates, as stored
+    n_dropped = int(keep.size - keep.sum())
+    if n_dropped:
+        ohlc, volume, dates = ohlc[keep], volume[keep], dates[keep]
+
+    sym = symbol.upper()
+    records = [
+        {"symbol": sym, "date": d, "open": o, "high": h, "low": lo, "close": c, "volume": v}
+        for d, (o, h, lo, c), v in zip(dates, ohlc.tolist(), volume.astype(np.int64).tolist())
+    ]
+    return records, n_dropped
+
+
+def upsert_records(records: list[dict], session: Session) -> None:
+    """Insert or update rows built by :func:`prepare_for_insert`.
+
+    Pass a writer session (``get_session()``).
+    """
+
+    if not records:
+        return
+    # Reason: ON CONFLICT DO UPDATE cannot touch one row twice in a statement
+    # (PostgreSQL rejects a batched page repeating a key); keep the last
+    # record per key, as sequential upserts would.
+    by_key = {(r["symbol"], r["date"]): r for r in records}
+    if len(by_key) < len(records):
+        records = list(by_key.values())
+
+    dialect_insert = _INSERTS.get(session.get_bind().dialect.name)
+    if dialect_insert is None:
+        _upsert_portable(records, session)
+        return
+
+    # Reason: one INSERT ... ON CONFLICT statement executed over all rows
+    # instead of a SELECT+INSERT per row.  sqlite3 runs it as an executemany
+    # of the single-row statement (one prepared statement); psycopg2 in
+    # ``values_plus_batch`` mode pages it into multi-row VALUES (see
+    # ``database._executemany_options``).  Targeting the Table (not the
+    # mapped class) keeps this a Core executemany and skips the ORM
+    # bulk-insert pass over every row dict.
+    stmt = dialect_insert(MarketData.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["symbol", "date"],
+        set_={c: stmt.excluded[c] for c in _OHLCV_COLUMNS},
+    )
+    session.execute(stmt, records)
+
+
+def _upsert_portable(records: list[dict], session: Session) -> None:
+    """Upsert for dialects without ``ON CONFLICT``: look up keys, then bulk write.
+
+    One SELECT fetches the ids of rows already stored for the batch's
+    symbols and date span; the rest are inserted in one executemany and the
+    matches updated in one bulk UPDATE by primary key.
+    """
+
+    by_key = {(r["symbol"], r["date"]): r for r in records}  # already unique
+    dates = [d for _, d in by_key]
+    existing = {
+        (sym, d): pk
+        for pk, sym, d in session.execute(
+            select(MarketData.id, MarketData.symbol, MarketData.date).where(
+                MarketData.symbol.in_({sym for sym, _ in by_key}),
+                MarketData.date >= min(dates),
+                MarketData.date <= max(dates),
+            )
+        )
+    }
+    new = [r for key, r in by_key.items() if key not in existing]
+    changed = [
+        {"id": existing[key], **{c: r[c] for c in _OHLCV_COLUMNS}}
+        for key, r in by_key.items()
+        if key in existing
+    ]
+    if new:
+        session.execute(insert(MarketData.__table__), new)
+    if changed:
+        session.execute(update(MarketData), changed)
+
+
 def upsert_historical_df(symbol: str, df: pd.DataFrame, session: Session) -> None:
     """Insert or update historical data from *df* for *symbol*.
 
     The DataFrame must have its index named "date" and contain Open/High/Low/Close/Volume columns.
+    Pass a writer session (``get_session()``).
     """
 
     if df.empty:
         return
-
-    df = df.copy()
-    # Ensure the index holds python datetime (normalize) for flexibility
-    df.index = pd.to_datetime(df.index).normalize()
-    df.index.name = "date"
-    df["symbol"] = symbol.upper()
-    records = df.reset_index().to_dict(orient="records")
-
-    for rec in records:
-        obj = MarketData(
-            symbol=rec["symbol"],
-            date=pd.to_datetime(rec["date"]).date(),
-            open=float(rec["Open"]),
-            high=float(rec["High"]),
-            low=float(rec["Low"]),
-            close=float(rec["Close"]),
-            volume=int(rec["Volume"]),
-        )
-        session.merge(obj)
-    session.flush()
+    records, _ = prepare_for_insert(symbol, df)
+    upsert_records(records, session)
 
 
 # ------------------ retrieval utilities ------------------
 
 def load_historical_df(symbol: str, start: date, end: date, session: Session) -> pd.DataFrame:
+    """Return stored OHLCV rows for *symbol* in ``[start, end]``, indexed by date.
+
+    A read-only session (``get_session(readonly=True)``) is sufficient.
+    """
+
     stmt = (
-        select(MarketData)
+        select(
+            MarketData.date,
+            MarketData.open.label("Open"),
+            MarketData.high.label("High"),
+            MarketData.low.label("Low"),
+            MarketData.close.label("Close"),
+            MarketData.volume.label("Volume"),
+        )
         .where(
             MarketData.symbol == symbol.upper(),
             MarketData.date >= start,
@@ -54,18 +159,11 @@ def load_historical_df(symbol: str, start: date, end: date, session: Session) ->
         )
         .order_by(MarketData.date)
     )
-    rows: List[MarketData] = session.scalars(stmt).all()  # type: ignore[arg-type]
-    if not rows:
+    # Reason: a Core select read straight into columns skips ORM hydration
+    # and the per-attribute Python loops over ``MarketData`` objects.
+    df = pd.read_sql_query(stmt, session.connection(), index_col="date")
+    if df.empty:
         return pd.DataFrame()
-    data = {
-        "date": [r.date for r in rows],
-        "Open": [r.open for r in rows],
-        "High": [r.high for r in rows],
-        "Low": [r.low for r in rows],
-        "Close": [r.close for r in rows],
-        "Volume": [r.volume for r in rows],
-    }
-    df = pd.DataFrame(data).set_index("date")
     return df
 
 
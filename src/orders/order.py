@@ -1,16 +1,31 @@
 from __future__ import annotations
 
 """Core order object used by the order-management system."""
-from dataclasses import dataclass, field
+import time
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime, timedelta
 from typing import List, Optional
 from uuid import uuid4
 
+import pandas as pd
+
 from src.backtesting.events import FillEvent
 from src.strategies.signal import SignalType
 
 from .types import OrderStatus, OrderType
 
+_US = timedelta(microseconds=1)
+_EPOCH = datetime(1970, 1, 1)
+# Reason: enum member access is a descriptor lookup (~70ns on 3.11);
+# ``is_open`` runs per order per bar, so test against a prebuilt set.
+_OPEN_STATUSES = frozenset((OrderStatus.PENDING, OrderStatus.PARTIALLY_FILLED))
+
+
+def to_ns(ts: datetime) -> int:
+    """Epoch nanoseconds of *ts* (naive timestamps are taken as UTC)."""
+
+    return pd.Timestamp(ts).value
+
 
 @dataclass(slots=True)
 class Order:
@@ -27,7 +42,11 @@ class Order:
     quantity: int
     limit_price: Optional[float] = None
     stop_price: Optional[float] = None
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    # Reason: ``created_at`` keeps its original positional slot for callers
+    # passing a datetime; it is folded into ``created_ns`` (keyword-only) and
+    # exposed as a property below the class.
+    created_at: InitVar[Optional[datetime]] = None
+    created_ns: int = field(default_factory=time.time_ns, kw_only=True)  # epoch ns, UTC
     timeout: Optional[timedelta] = None  # auto-cancel after this duration
 
     # Internal / auto-filled fields ------------------------------------------------
@@ -37,7 +56,9 @@ class Order:
     fills: List[FillEvent] = field(default_factory=list, init=False)
 
     # -------------------------------------------------------------------------
-    def __post_init__(self) -> None:  # pragma: no cover
+    def __post_init__(self, created_at: Optional[datetime]) -> None:  # pragma: no cover
+        if created_at is not None:
+            self.created_ns = to_ns(created_at)
         if self.quantity <= 0:
             raise ValueError("quantity must be positive")
         if self.order_type == OrderType.LIMIT and self.limit_price is None:
@@ -54,11 +75,27 @@ class Order:
 
         return self.quantity - self.filled_qty
 
+    def _get_created_at(self) -> datetime:
+        """Creation time as a naive UTC ``datetime`` (derived from ``created_ns``)."""
+
+        return _EPOCH + timedelta(microseconds=self.created_ns // 1000)
+
+    def _set_created_at(self, value: datetime) -> None:
+        self.created_ns = to_ns(value)
+
+    @property
+    def deadline_ns(self) -> Optional[int]:
+        """Expiry time in epoch nanoseconds, or ``None`` without a timeout."""
+
+        if self.timeout is None:
+            return None
+        return self.created_ns + (self.timeout // _US) * 1000
+
     # ---------------------------------------------------------------------
     def is_open(self) -> bool:
         """True if the order can still be executed/finalised."""
 
-        return self.status in (OrderStatus.PENDING, OrderStatus.PARTIALLY_FILLED)
+        return self.status in _OPEN_STATUSES
 
     # ---------------------------------------------------------------------
     def _record_fill(self, fill: FillEvent) -> None:
@@ -72,12 +109,16 @@ class Order:
             self.status = OrderStatus.PARTIALLY_FILLED
 
     # ---------------------------------------------------------------------
-    def maybe_timeout(self, now: datetime) -> None:
-        """Expire an order if its timeout has elapsed."""
+    def maybe_timeout(self, now: datetime | int) -> None:
+        """Expire an order if its timeout has elapsed.
 
-        if self.timeout is None or not self.is_open():
+        *now* may be a ``datetime`` or epoch nanoseconds (see :func:`to_ns`).
+        """
+
+        deadline = self.deadline_ns
+        if deadline is None or not self.is_open():
             return
-        if now - self.created_at > self.timeout:
+        if (now if isinstance(now, int) else to_ns(now)) > deadline:
             self.status = OrderStatus.EXPIRED
 
     # ---------------------------------------------------------------------
@@ -86,3 +127,8 @@ class Order:
 
         if self.is_open():
             self.status = OrderStatus.CANCELLED
+
+
+# Bound after the dataclass is built so the ``created_at`` init argument keeps
+# ``None`` as its default rather than picking up the property object.
+Order.created_at = property(Order._get_created_at, Order._set_created_at)  # type: ignore[assignment]
@@ -1,16 +1,151 @@
 from __future__ import annotations
 
 """Simple in-memory limit order book for backtesting purposes."""
-from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List
+from typing import Any, Dict, List
+
+import numpy as np
 
 from src.backtesting.events import FillEvent
-from src.strategies.signal import SignalType
+from src.strategies.signal import SIGNAL_CODES
+from src.utils.jit import njit
 
-from .order import Order
+from .order import Order, to_ns
 from .types import OrderType
 
+_MARKET, _LIMIT, _STOP = 0, 1, 2
+_KIND_CODES = {OrderType.MARKET: _MARKET, OrderType.LIMIT: _LIMIT, OrderType.STOP: _STOP}
+_NO_DEADLINE = np.iinfo(np.int64).max
+
+
+@njit(cache=True)
+def _match_bar(
+    side: np.ndarray,
+    kind: np.ndarray,
+    limit: np.ndarray,
+    stop: np.ndarray,
+    deadline: np.ndarray,
+    remaining: np.ndarray,
+    filled: np.ndarray,
+    is_open: np.ndarray,
+    price: float,
+    high: float,
+    low: float,
+    now_ns: int,
+    cap: int,
+    expired: np.ndarray,
+    fill_qty: np.ndarray,
+    fill_price: np.ndarray,
+) -> None:
+    """Decide one bar's outcome for every order row.
+
+    Writes ``expired[i]`` for open orders past their deadline, otherwise the
+    quantity (0 = no fill) and price each order fills at.  LIMIT orders fill
+    at their limit or better, MARKET and triggered STOP orders at *price*.
+    ``cap < 0`` means no liquidity cap; the cap only applies to an order's
+    first fill.  NaN levels compare false, so they never trigger.
+    """
+
+    for i in range(side.shape[0]):
+        expired[i] = False
+        fill_qty[i] = 0
+        if not is_open[i]:
+            continue
+        if deadline[i] < now_ns:
+            expired[i] = True
+            continue
+        buy = side[i] > 0
+        k = kind[i]
+        px = price
+        if k == _LIMIT:
+            lim = limit[i]
+            if buy and low <= lim:
+                px = min(lim, price)
+            elif not buy and high >= lim:
+                px = max(lim, price)
+            else:
+                continue
+        elif k == _STOP:
+            if not ((buy and high >= stop[i]) or (not buy and low <= stop[i])):
+                continue
+        qty = remaining[i]
+        if cap >= 0 and filled[i] == 0 and cap < qty:
+            qty = cap
+        fill_qty[i] = qty
+        fill_price[i] = px
+
+
+class _SymbolOrders:
+    """Struct-of-arrays view of one symbol's orders, in submission order.
+
+    Row ``i`` of every array describes ``orders[i]``.  ``open``, ``remaining``
+    and ``filled`` mirror the order's state for changes made by the book
+    (fills only happen here, cancels through the book close their row at
+    once); orders closed elsewhere (``Order.cancel()``) are caught when they
+    next become eligible.  ``side`` through ``deadline`` are snapshots taken
+    when the order is added; :meth:`OrderBook.amend_order` rewrites them.
+    """
+
+    __slots__ = (
+        "orders", "rows", "side", "kind", "limit", "stop", "deadline", "remaining", "filled",
+        "open", "n",
+    )
+    _COLUMNS = ("side", "kind", "limit", "stop", "deadline", "remaining", "filled", "open")
+
+    def __init__(self, capacity: int = 8) -> None:
+        self.orders: List[Order] = []
+        self.rows: Dict[str, int] = {}  # order id -> row, for O(1) closes
+        self.side = np.empty(capacity, dtype=np.int8)  # +1 BUY / -1 SELL
+        self.kind = np.empty(capacity, dtype=np.int8)
+        self.limit = np.empty(capacity, dtype=np.float64)
+        self.stop = np.empty(capacity, dtype=np.float64)
+        self.deadline = np.empty(capacity, dtype=np.int64)  # expiry, epoch ns
+        self.remaining = np.empty(capacity, dtype=np.int64)
+        self.filled = np.empty(capacity, dtype=np.int64)
+        self.open = np.empty(capacity, dtype=bool)
+        self.n = 0
+
+    def append(self, order: Order) -> None:
+        n = self.n
+        if n == len(self.side):
+            for name in self._COLUMNS:
+                setattr(self, name, np.resize(getattr(self, name), 2 * n))
+        self.orders.append(order)
+        self.rows[order.id] = n
+        self.write(n, order)
+        self.n = n + 1
+
+    def write(self, n: int, order: Order) -> None:
+        """(Re)fill row *n* from *order*'s current fields."""
+
+        self.side[n] = SIGNAL_CODES[order.side]
+        self.kind[n] = _KIND_CODES[order.order_type]
+        self.limit[n] = np.nan if order.limit_price is None else order.limit_price
+        self.stop[n] = np.nan if order.stop_price is None else order.stop_price
+        deadline = order.deadline_ns
+        self.deadline[n] = _NO_DEADLINE if deadline is None else deadline
+        self.remaining[n] = order.remaining
+        self.filled[n] = order.filled_qty
+        self.open[n] = order.is_open()
+
+    def close(self, order_id: str) -> None:
+        """Mark the row of *order_id* closed so matching skips it."""
+
+        row = self.rows.pop(order_id, None)
+        if row is not None:
+            self.open[row] = False
+
+    def compact(self) -> None:
+        """Drop closed rows, keeping the remaining orders' relative order."""
+
+        keep = np.flatnonzero(self.open[: self.n])
+        self.orders = [self.orders[i] for i in keep]
+        self.rows = {order.id: i for i, order in enumerate(self.orders)}
+        for name in self._COLUMNS:
+            arr = getattr(self, name)
+            arr[: keep.size] = arr[keep]
+        self.n = keep.size
+
 
 class OrderBook:
     """Very lightweight order-book suitable for backtesting.
@@ -29,27 +164,67 @@ class OrderBook:
                 value allows backtests to simulate *partial* fills when order
                 size exceeds available liquidity.
         """
-        self._orders: Dict[str, List[Order]] = defaultdict(list)  # active orders keyed by symbol
+        self._books: Dict[str, _SymbolOrders] = {}  # active orders keyed by symbol
+        # id -> order for O(1) cancels; pruned as orders close in ``process_bar``
+        self._by_id: Dict[str, Order] = {}
         self.history: List[Order] = []  # audit trail of all orders (active + completed)
         self._max_qty_per_fill = max_qty_per_fill
 
     # -----------------------------------------------------------------
     def add_order(self, order: Order) -> None:
-        """Register a new order with the book."""
+        """Register a new order with the book.
+
+        The book copies the order's side, type, price levels and deadline
+        into its matching arrays, so those fields are fixed once added:
+        change them through :meth:`amend_order`, not on the ``Order``.
+        """
 
-        self._orders[order.symbol].append(order)
+        book = self._books.get(order.symbol)
+        if book is None:
+            book = self._books[order.symbol] = _SymbolOrders()
+        book.append(order)
+        self._by_id[order.id] = order
         self.history.append(order)
 
+    # -----------------------------------------------------------------
+    @property
+    def open_orders(self) -> List[Order]:
+        """Orders still open in the book, in submission order.
+
+        Fills, expiries and book cancels drop orders from the id map as they
+        happen, so this only visits open (or directly cancelled) orders.
+        """
+
+        return [order for order in self._by_id.values() if order.is_open()]
+
+    # -----------------------------------------------------------------
+    def amend_order(self, order_id: str, **changes: Any) -> bool:
+        """Update fields of an open order and the book's copy of them.
+
+        *changes* are ``Order`` attributes, e.g. ``limit_price``,
+        ``stop_price``, ``timeout`` or ``created_at``.  Returns False if the
+        order is unknown or no longer open.
+        """
+
+        order = self._by_id.get(order_id)
+        if order is None or not order.is_open():
+            return False
+        for name, value in changes.items():
+            setattr(order, name, value)
+        book = self._books[order.symbol]
+        book.write(book.rows[order_id], order)
+        return True
+
     # -----------------------------------------------------------------
     def cancel_order(self, order_id: str) -> bool:
         """Cancel an order by its ID. Returns True if cancelled."""
 
-        for orders in self._orders.values():
-            for o in orders:
-                if o.id == order_id and o.is_open():
-                    o.cancel()
-                    return True
-        return False
+        order = self._by_id.pop(order_id, None)
+        if order is None or not order.is_open():
+            return False
+        order.cancel()
+        self._books[order.symbol].close(order_id)
+        return True
 
     # -----------------------------------------------------------------
     def process_bar(
@@ -69,66 +244,61 @@ class OrderBook:
         """
 
         fills: List[FillEvent] = []
-        if symbol not in self._orders:
+        book = self._books.get(symbol)
+        if book is None or book.n == 0:
             return fills
 
-        for order in list(self._orders[symbol]):
-            if not order.is_open():
-                continue
+        n = book.n
+        is_open = book.open[:n]
+        remaining, filled = book.remaining[:n], book.filled[:n]
+        # Honour the *max_qty_per_fill* argument if provided, otherwise fall
+        # back to the order-book default.
+        effective_cap = max_qty_per_fill if max_qty_per_fill is not None else self._max_qty_per_fill
+        expired = np.empty(n, dtype=bool)
+        fill_qty = np.empty(n, dtype=np.int64)
+        fill_price = np.empty(n, dtype=np.float64)
+        now_ns = to_ns(time)  # the only datetime conversion per bar
+        # Reason: expiry, trigger tests and fill sizing for every order run in
+        # one compiled pass; Python only touches orders that change this bar.
+        _match_bar(
+            book.side[:n], book.kind[:n], book.limit[:n], book.stop[:n], book.deadline[:n],
+            remaining, filled, is_open,
+            float(price), float(high), float(low), now_ns,
+            -1 if effective_cap is None else int(effective_cap),
+            expired, fill_qty, fill_price,
+        )
 
-            # Handle timeouts first
-            order.maybe_timeout(time)
+        # Handle timeouts first
+        for i in np.flatnonzero(expired).tolist():
+            order = book.orders[i]
+            order.maybe_timeout(now_ns)
             if not order.is_open():
-                continue
+                is_open[i] = False
+                self._by_id.pop(order.id, None)
 
-            # ----------------------------------------------------------------
-            # MARKET orders are filled immediately at the close price
-            if order.order_type == OrderType.MARKET:
-                fill_price = price
-
-            # ----------------------------------------------------------------
-            # LIMIT orders are filled if the limit is reached
-            elif order.order_type == OrderType.LIMIT:
-                if order.side == SignalType.BUY and low <= order.limit_price:
-                    fill_price = min(order.limit_price, price)
-                elif order.side == SignalType.SELL and high >= order.limit_price:
-                    fill_price = max(order.limit_price, price)
-                else:
-                    continue  # Not eligible this bar
-
-            # ----------------------------------------------------------------
-            # STOP orders convert to market once stop level is hit
-            elif order.order_type == OrderType.STOP:
-                triggered = (
-                    (order.side == SignalType.BUY and high >= order.stop_price)
-                    or (order.side == SignalType.SELL and low <= order.stop_price)
-                )
-                if not triggered:
-                    continue
-                fill_price = price  # treat as market once triggered
-
-            else:  # pragma: no cover – unreachable with current enum
+        rows = np.flatnonzero(fill_qty)
+        for i, qty, px in zip(rows.tolist(), fill_qty[rows].tolist(), fill_price[rows].tolist()):
+            order = book.orders[i]
+            if not order.is_open():  # closed outside the book
+                is_open[i] = False
+                self._by_id.pop(order.id, None)
                 continue
-
-            # ----------------------------------------------------------------
-            # Determine how much of the order we can fill this bar.  Honour the
-            # *max_qty_per_fill* argument if provided, otherwise fall back to
-            # the order-book default.
-            effective_cap = max_qty_per_fill if max_qty_per_fill is not None else self._max_qty_per_fill
-            if effective_cap is None or order.filled_qty > 0:
-                # No liquidity cap after the first fill to keep things simple
-                qty = order.remaining
-            else:
-                qty = min(order.remaining, effective_cap)
             fill = FillEvent(
                 symbol=symbol,
                 time=time,
                 fill_type=order.side,
                 quantity=qty,
-                price=fill_price,
+                price=px,
                 commission=commission,
             )
             order._record_fill(fill)
             fills.append(fill)
+            remaining[i] -= qty
+            filled[i] += qty
+            if remaining[i] <= 0:
+                is_open[i] = False
+                self._by_id.pop(order.id, None)
 
+        if 2 * int(is_open.sum()) < n:
+            book.compact()
         return fills
@@ -0,0 +1,86 @@
+"""On-disk cache of fetched OHLCV frames for :class:`DataPipeline`.
+
+One file per ``(symbol, start, end)`` request under the pipeline's
+``cache_dir``: Parquet when pyarrow is installed, pickle otherwise.  Only
+closed ranges are cached (see :func:`cacheable`), so entries never go stale.
+"""
+from __future__ import annotations
+
+import os
+import pickle
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Optional
+
+import pandas as pd
+
+try:  # parquet engine for the on-disk cache
+    import pyarrow  # noqa: F401
+
+    _PARQUET = True
+except ModuleNotFoundError:  # pragma: no cover
+    _PARQUET = False
+
+
+def _day(value: date) -> date:
+    # DataPipeline accepts datetimes too; compare and name files by calendar day.
+    return value.date() if isinstance(value, datetime) else value
+
+
+def cacheable(end: date) -> bool:
+    """True if bars up to *end* (a ``date`` or ``datetime``) are final (the range ends before today)."""
+
+    return _day(end) < date.today()
+
+
+def _path(cache_dir: Path, symbol: str, start: date, end: date) -> Path:
+    suffix = ".parquet" if _PARQUET else ".pkl"
+    return cache_dir / f"{symbol}_{_day(start).isoformat()}_{_day(end).isoformat()}{suffix}"
+
+
+def load(cache_dir: Path, symbol: str, start: date, end: date) -> Optional[pd.DataFrame]:
+    """Cached frame for the request, or ``None`` on a miss/unreadable entry."""
+
+    pth = _path(cache_dir, symbol, start, end)
+    if not pth.is_file():
+        return None
+    try:
+        if pth.suffix == ".parquet":
+            return pd.read_parquet(pth)
+        with pth.open("rb") as f:
+            return pickle.load(f)
+    except Exception:  # noqa: BLE001 - a corrupt entry is just a miss
+        return None
+
+
+def store(cache_dir: Path, symbol: str, start: date, end: date, df: pd.DataFrame) -> None:
+    """Write *df* for the request (atomically, via a temp file)."""
+
+    pth = _path(cache_dir, symbol, start, end)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = pth.with_name(pth.name + ".tmp")
+    if pth.suffix == ".parquet":
+        df.to_parquet(tmp, compression="zstd")
+    else:
+        with tmp.open("wb") as f:
+            pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, pth)
+
+
+def load_many(
+    cache_dir: Path, symbols: Iterable[str], start: date, end: date
+) -> Dict[str, pd.DataFrame]:
+    """Cached frames for the *symbols* that hit."""
+
+    frames = {s: load(cache_dir, s, start, end) for s in symbols}
+    return {s: df for s, df in frames.items() if df is not None}
+
+
+def store_many(
+    cache_dir: Path, frames: Mapping[str, Optional[pd.DataFrame]], start: date, end: date
+) -> None:
+    """Store every non-empty frame of *frames*."""
+
+    for symbol, df in frames.items():
+        if df is not None and not df.empty:
+            store(cache_dir, symbol, start, end, df)
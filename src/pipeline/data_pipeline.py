@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from typing import Iterable, List
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
 
 import pandas as pd
 
@@ -12,12 +15,19 @@ from ..core.logging_config import logger, log_timing, new_correlation_id
 from ..data.providers.base import DataProvider
 from ..data.storage import get_session, run_migrations
 from ..data.storage.database import init_engine
-from ..data.storage.repository import upsert_historical_df
-from ..utils.transform import normalize_ohlcv
+from ..data.storage.repository import prepare_for_insert, upsert_records
+from . import _cache
+
+_T = TypeVar("_T")
 
 
 class DataPipeline:
-    """Orchestrates data fetching, validation, transformation, and storage."""
+    """Orchestrates data fetching, validation, transformation, and storage.
+
+    With *cache_dir* set, fetched frames for ranges ending before today are
+    kept on disk so re-running the pipeline skips the provider.  Providers
+    with their own cache (``provider.cache`` truthy) are not double-cached.
+    """
 
     def __init__(
         self,
@@ -27,51 +37,134 @@ class DataPipeline:
         end: date,
         *,
         max_concurrency: int = 5,
+        cache_dir: str | Path | None = None,
     ) -> None:
         self.provider = provider
         self.symbols: List[str] = list(symbols)
         self.start = start
         self.end = end
+        self.max_concurrency = max_concurrency
         self.semaphore = asyncio.Semaphore(max_concurrency)
+        # Provider-call threads for the running ``collect`` (see ``_run_blocking``)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.cache_dir = (
+            Path(cache_dir)
+            if cache_dir is not None
+            and not getattr(provider, "cache", False)
+            and _cache.cacheable(end)
+            else None
+        )
 
         # Ensure DB initialized
         engine = init_engine()
         run_migrations(engine)
 
-    # -------------------------------------------------------
-    async def _fetch_symbol(self, symbol: str) -> tuple[str, pd.DataFrame | None]:
-        """Fetch symbol data with quality checks; returns (symbol, df or None)."""
+    # Symbols per request for providers exposing ``get_historical_data_batch``
+    batch_size: int = 50
 
+    # -------------------------------------------------------
+    def _bounds(self) -> tuple[datetime, datetime]:
+        return (
+            datetime.combine(self.start, datetime.min.time()),
+            datetime.combine(self.end, datetime.min.time()),
+        )
+
+    def _quality_check(self, symbol: str, df: pd.DataFrame | None) -> tuple[str, list[dict] | None]:
+        """Validate fetched data into upsert rows; returns (symbol, rows or None)."""
+
+        if df is None or df.empty:
+            logger.warning(f"No data for {symbol} between {self.start} and {self.end}")
+            return symbol, None
+        try:
+            records, n_dropped = prepare_for_insert(symbol, df)
+        except ValueError as exc:
+            logger.error(f"Data quality failure for {symbol}: {exc}")
+            return symbol, None
+        if n_dropped:
+            logger.warning(f"NaNs found in data for {symbol}; dropping")
+        return symbol, records
+
+    async def _run_blocking(self, fn: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking provider call off the event loop.
+
+        Like :func:`asyncio.to_thread` (context variables such as the
+        correlation id carry over), but on ``collect``'s own pool sized to
+        ``max_concurrency`` rather than the loop's default executor, which is
+        capped at ``min(32, cpu_count + 4)`` threads.
+        """
+
+        if self._executor is None:
+            return await asyncio.to_thread(fn, *args)
+        ctx = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(self._executor, ctx.run, fn, *args)
+
+    async def _load_cached(self, symbols: List[str]) -> dict[str, pd.DataFrame]:
+        if self.cache_dir is None:
+            return {}
+        return await asyncio.to_thread(_cache.load_many, self.cache_dir, symbols, self.start, self.end)
+
+    async def _store_cached(self, frames: dict[str, pd.DataFrame | None]) -> None:
+        if self.cache_dir is not None:
+            await asyncio.to_thread(_cache.store_many, self.cache_dir, frames, self.start, self.end)
+
+    async def _fetch_symbol(self, symbol: str) -> tuple[str, list[dict] | None]:
+        """Fetch symbol data with quality checks; returns (symbol, rows or None)."""
+
+        cached = await self._load_cached([symbol])
+        if symbol in cached:
+            return self._quality_check(symbol, cached[symbol])
         async with self.semaphore:
-            loop = asyncio.get_running_loop()
+            start, end = self._bounds()
+            # Reason: the inherited DataProvider hook just wraps the blocking
+            # call in asyncio.to_thread; only natively async overrides are
+            # awaited, the rest run on ``collect``'s own pool.
+            fetch_async = getattr(type(self.provider), "get_historical_data_async", None)
+            native_async = fetch_async not in (None, DataProvider.get_historical_data_async)
             try:
-                df: pd.DataFrame = await loop.run_in_executor(
-                    None,
-                    self.provider.get_historical_data,
-                    symbol,
-                    datetime.combine(self.start, datetime.min.time()),
-                    datetime.combine(self.end, datetime.min.time()),
-                )
+                if native_async:
+                    df: pd.DataFrame = await self.provider.get_historical_data_async(symbol, start, end)
+                else:
+                    df = await self._run_blocking(self.provider.get_historical_data, symbol, start, end)
             except DataProviderError as exc:
                 logger.error(f"Provider error for {symbol}: {exc}")
                 return symbol, None
             except Exception as exc:  # noqa: BLE001
                 logger.exception(f"Unexpected error fetching {symbol}: {exc}")
                 return symbol, None
+        await self._store_cached({symbol: df})
+        return self._quality_check(symbol, df)
 
-            # Data quality check
-            if df.empty:
-                logger.warning(f"No data for {symbol} between {self.start} and {self.end}")
-                return symbol, None
-            if df.isna().any().any():
-                logger.warning(f"NaNs found in data for {symbol}; dropping")
-                df = df.dropna()
+    async def _fetch_batch(self, symbols: List[str]) -> List[tuple[str, list[dict] | None]]:
+        """Fetch *symbols* in one provider request, then quality-check each.
+
+        If the provider rejects the whole request (``DataProviderError``,
+        e.g. one invalid symbol), the uncached symbols are refetched one by
+        one so a single bad symbol does not fail the rest of the chunk.
+        """
+
+        cached = await self._load_cached(symbols)
+        missing = [s for s in symbols if s not in cached]
+        if not missing:
+            return [self._quality_check(s, cached[s]) for s in symbols]
+        async with self.semaphore:
+            start, end = self._bounds()
             try:
-                df = normalize_ohlcv(df)
-            except ValueError as exc:
-                logger.error(f"Data quality failure for {symbol}: {exc}")
-                return symbol, None
-            return symbol, df
+                frames = await self._run_blocking(
+                    self.provider.get_historical_data_batch, missing, start, end
+                )
+            except DataProviderError as exc:
+                logger.warning(f"Batch request for {len(missing)} symbols failed ({exc}); fetching individually")
+                frames = None
+            except Exception as exc:  # noqa: BLE001
+                logger.exception(f"Unexpected error fetching {', '.join(missing)}: {exc}")
+                return [self._quality_check(s, cached[s]) if s in cached else (s, None) for s in symbols]
+        if frames is None:
+            # Reason: outside the semaphore, which each _fetch_symbol acquires.
+            fetched = dict(await asyncio.gather(*(self._fetch_symbol(s) for s in missing)))
+            return [(s, fetched[s]) if s in fetched else self._quality_check(s, cached[s]) for s in symbols]
+        await self._store_cached(frames)
+        frames = {**frames, **cached}
+        return [self._quality_check(s, frames.get(s)) for s in symbols]
 
     # -------------------------------------------------------
     @log_timing()
@@ -81,14 +174,25 @@ class DataPipeline:
         cid = new_correlation_id()
         logger.info(f"Starting data collection cid={cid} for {len(self.symbols)} symbols")
 
-        results = await asyncio.gather(*(self._fetch_symbol(s) for s in self.symbols))
-
-        # Store
+        with ThreadPoolExecutor(self.max_concurrency, thread_name_prefix="pipeline") as pool:
+            self._executor = pool
+            try:
+                if hasattr(self.provider, "get_historical_data_batch"):
+                    chunks = [
+                        self.symbols[i : i + self.batch_size]
+                        for i in range(0, len(self.symbols), self.batch_size)
+                    ]
+                    batches = await asyncio.gather(*(self._fetch_batch(c) for c in chunks))
+                    results = [r for batch in batches for r in batch]
+                else:
+                    results = await asyncio.gather(*(self._fetch_symbol(s) for s in self.symbols))
+            finally:
+                self._executor = None
+
+        # Store every symbol's rows with one upsert
+        records = [rec for _, rows in results if rows for rec in rows]
         with get_session() as sess:
-            for symbol, df in results:
-                if df is None:
-                    continue
-                upsert_historical_df(symbol, df, sess)
+            upsert_records(records, sess)
         logger.info("Data collection finished")
 
     # -------------------------------------------------------
@@ -1,6 +1,7 @@
-from .manager import PortfolioManager, Position
+from .manager import PortfolioManager, Position, PositionsView
 
 __all__ = [
     "PortfolioManager",
     "Position",
+    "PositionsView",
 ]
@@ -6,15 +6,27 @@ Tracks cash, positions, calculates real-time metrics and provides helper
 utilities for sizing, rebalancing and risk monitoring.
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, MutableMapping
+from typing import Dict, Iterator, List, Mapping, Sequence
 
 import json
 
-from src.backtesting.events import FillEvent
+import numpy as np
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+from src.backtesting.events import FillEvent, FillLog
 from src.strategies.signal import SignalType
+from src.utils.jit import njit
+
+
+# Column order of each row in the ``"trades"`` list written by ``save``.
+_TRADE_FIELDS = ("symbol", "time", "fill_type", "quantity", "price", "commission")
 
 
 @dataclass(slots=True)
@@ -31,6 +43,90 @@ class Position:
         return (price - self.avg_price) * self.quantity
 
 
+@njit(cache=True)
+def _apply_fill(
+    qty: np.ndarray,
+    avg_price: np.ndarray,
+    idx: int,
+    direction: int,
+    fill_qty: int,
+    fill_price: float,
+    commission: float,
+) -> float:
+    """Update position *idx* in place for one fill; return the cash delta."""
+
+    old_qty = qty[idx]
+    new_qty = old_qty + direction * fill_qty
+    if new_qty == 0:
+        avg_price[idx] = 0.0
+    else:
+        avg_price[idx] = (avg_price[idx] * abs(old_qty) + fill_price * fill_qty) / abs(new_qty)
+    qty[idx] = new_qty
+    # BUY decreases cash, SELL increases cash
+    return -direction * (fill_price * fill_qty + commission)
+
+
+@njit(cache=True)
+def _apply_fills(
+    qty: np.ndarray,
+    avg_price: np.ndarray,
+    cash: float,
+    sym_idx: np.ndarray,
+    direction: np.ndarray,
+    fill_qty: np.ndarray,
+    fill_price: np.ndarray,
+    commission: np.ndarray,
+) -> float:
+    """Apply a batch of fills in order; return the resulting cash balance."""
+
+    for k in range(sym_idx.shape[0]):
+        cash += _apply_fill(
+            qty, avg_price, sym_idx[k], direction[k], fill_qty[k], fill_price[k], commission[k]
+        )
+    return cash
+
+
+def _rebalance_deltas(
+    equity: float,
+    weight_vec: np.ndarray,
+    qty_vec: np.ndarray,
+    price_vec: np.ndarray,
+    divisor: np.ndarray,
+) -> np.ndarray:
+    """Whole-share deltas ``(equity * w - q * p) // divisor`` (0 if divisor <= 0)."""
+
+    tradable = divisor > 0
+    diff = (equity * weight_vec - qty_vec * price_vec) // np.where(tradable, divisor, 1.0)
+    return np.where(tradable, diff, 0.0).astype(np.int64)
+
+
+class PositionsView(Mapping[str, Position]):
+    """Live read-only ``symbol -> Position`` view over the position arrays.
+
+    ``Position`` objects are built on lookup; only symbols that have traded
+    are listed.  Change positions through :class:`PortfolioManager` fills.
+    """
+
+    __slots__ = ("_pm",)
+
+    def __init__(self, pm: "PortfolioManager") -> None:
+        self._pm = pm
+
+    def __getitem__(self, symbol: str) -> Position:
+        pm = self._pm
+        idx = pm._sym_index.get(symbol)
+        if idx is None or not pm._active[idx]:
+            raise KeyError(symbol)
+        return Position(int(pm._qty[idx]), float(pm._avg_price[idx]))
+
+    def __iter__(self) -> Iterator[str]:
+        active = self._pm._active
+        return (sym for sym, i in self._pm._sym_index.items() if active[i])
+
+    def __len__(self) -> int:
+        return int(self._pm._active[: len(self._pm._sym_index)].sum())
+
+
 class PortfolioManager:
     """Keeps track of cash, positions and P&L in real time."""
 
@@ -39,6 +135,7 @@ class PortfolioManager:
         starting_cash: float = 100_000.0,
         *,
         max_leverage: float = 2.0,
+        symbols: Sequence[str] = (),
     ) -> None:  # noqa: D401
         """Create a portfolio manager.
 
@@ -46,37 +143,172 @@ class PortfolioManager:
             starting_cash: Initial cash balance.
             max_leverage: Maximum allowable leverage (equity / net_liquidation).
                 E.g. 2.0 means cash can go negative up to the value of equity.
+            symbols: Symbols to pre-allocate position rows for, in order, so
+                callers can address them by index in :meth:`apply_fills`.
         """
         self.cash: float = starting_cash
         self.max_leverage = max_leverage
-        self._positions: MutableMapping[str, Position] = {}
-        self.trade_history: List[FillEvent] = []
+        # Struct-of-arrays position store: row ``_sym_index[sym]`` of ``_qty``
+        # and ``_avg_price`` holds that symbol's position.  The arrays are
+        # over-allocated; only the first ``len(_sym_index)`` rows are live.
+        self._sym_index: Dict[str, int] = {}
+        self._qty = np.zeros(0, dtype=np.int64)
+        self._avg_price = np.zeros(0, dtype=np.float64)
+        # Rows that have seen a fill; pre-allocated rows stay hidden until then.
+        self._active = np.zeros(0, dtype=bool)
+        # Columnar fill log; its symbol table is kept in lockstep with
+        # ``_sym_index`` so row indices are shared (see ``_intern``).
+        self.trade_history = FillLog()
         self._equity_history: List[tuple[datetime, float]] = []  # (time, equity)
+        self._peak_equity: float = float("-inf")  # running max of _equity_history
+        for sym in symbols:
+            self._intern(sym)
 
     # ------------------------------------------------------------------
     @property
-    def positions(self) -> Dict[str, Position]:  # noqa: D401
-        return dict(self._positions)
+    def positions(self) -> PositionsView:  # noqa: D401
+        # Reason: a view instead of a fresh dict of every position per access.
+        return PositionsView(self)
+
+    def quantity(self, symbol: str) -> int:
+        """Shares currently held in *symbol* (0 if never traded)."""
+
+        idx = self._sym_index.get(symbol)
+        return 0 if idx is None else int(self._qty[idx])
+
+    def _intern(self, symbol: str) -> int:
+        """Return the array row for *symbol*, allocating one if new."""
+
+        idx = self._sym_index.get(symbol)
+        if idx is None:
+            idx = len(self._sym_index)
+            if idx == self._qty.shape[0]:
+                self._grow(max(8, 2 * idx))
+            self._sym_index[symbol] = idx
+            self.trade_history._intern(symbol)
+        return idx
+
+    def _grow(self, capacity: int) -> None:
+        """Resize the position arrays to *capacity* rows (new rows zeroed)."""
+
+        # Reason: geometric growth keeps interning N symbols O(N) overall,
+        # where appending one row at a time copied every array per symbol.
+        n = len(self._sym_index)
+        for name in ("_qty", "_avg_price", "_active"):
+            arr = np.resize(getattr(self, name), capacity)
+            arr[n:] = 0
+            setattr(self, name, arr)
+
+    def _price_vector(self, prices: Dict[str, float]) -> np.ndarray:
+        """Prices aligned with the position arrays (missing → 0.0)."""
+
+        return np.fromiter(
+            (prices.get(sym, 0.0) for sym in self._sym_index),
+            dtype=np.float64,
+            count=len(self._sym_index),
+        )
 
     # ------------------------------------------------------------------
     def apply_fill(self, fill: FillEvent) -> None:
         """Update portfolio state with an executed trade (FillEvent)."""
 
-        pos = self._positions.setdefault(fill.symbol, Position())
-        direction = 1 if fill.fill_type == SignalType.BUY else -1
-        new_qty = pos.quantity + direction * fill.quantity
+        idx = self._intern(fill.symbol)
+        direction = fill.direction
+        self.cash += _apply_fill(
+            self._qty,
+            self._avg_price,
+            idx,
+            direction,
+            int(fill.quantity),
+            float(fill.price),
+            float(fill.commission),
+        )
+        self._active[idx] = True
+        self.trade_history.append(fill)
 
-        if new_qty == 0:
-            pos.avg_price = 0.0
-        else:
-            pos.avg_price = (
-                (pos.avg_price * abs(pos.quantity) + fill.price * fill.quantity) / abs(new_qty)
-            )
-        pos.quantity = new_qty
+    def apply_fills(
+        self,
+        time: datetime,
+        sym_idx: np.ndarray,
+        direction: np.ndarray,
+        quantity: np.ndarray,
+        price: np.ndarray,
+        commission: float = 0.0,
+    ) -> None:
+        """Apply a batch of fills given as parallel arrays.
+
+        ``sym_idx`` addresses rows in the order passed as ``symbols`` to the
+        constructor; ``direction`` is +1 for BUY and -1 for SELL. Fills are
+        applied in array order, exactly as repeated :meth:`apply_fill` would.
+
+        Raises:
+            IndexError: If a ``sym_idx`` entry is not an allocated row (nothing
+                is applied).
+        """
 
-        trade_cost = fill.price * fill.quantity + fill.commission
-        self.cash -= direction * trade_cost  # BUY decreases cash, SELL increases cash
-        self.trade_history.append(fill)
+        if len(sym_idx) == 0:
+            return
+        # Reason: the compiled kernel does no bounds checks, so a bad row
+        # would corrupt memory or cash before NumPy indexing noticed.
+        if int(sym_idx.min()) < 0 or int(sym_idx.max()) >= len(self._sym_index):
+            raise IndexError(f"sym_idx out of range for {len(self._sym_index)} symbols")
+        commissions = np.full(len(sym_idx), commission, dtype=np.float64)
+        self._apply_rows(time, sym_idx, direction, quantity, price, commissions)
+
+    def _apply_rows(
+        self,
+        time: datetime | Sequence[datetime],
+        sym_idx: np.ndarray,
+        direction: np.ndarray,
+        quantity: np.ndarray,
+        price: np.ndarray,
+        commission: np.ndarray,
+    ) -> None:
+        """Apply fills addressed by (valid) position row; the one array entry point.
+
+        *time* is shared by every fill or given per fill (see
+        :meth:`FillLog.extend_arrays`).
+        """
+
+        self.cash = _apply_fills(
+            self._qty, self._avg_price, float(self.cash), sym_idx, direction, quantity, price, commission
+        )
+        self._active[sym_idx] = True
+        # Rows follow interning order, so they index the log's symbols too.
+        self.trade_history.extend_arrays(time, sym_idx, direction, quantity, price, commission)
+
+    def apply_fills_batch(self, fills: Sequence[FillEvent]) -> None:
+        """Apply *fills* in order, e.g. when replaying a trade log.
+
+        Equivalent to calling :meth:`apply_fill` for each fill, but the
+        position/cash updates run in one compiled pass over arrays.
+        """
+
+        n = len(fills)
+        if n == 0:
+            return
+        sym_idx = np.fromiter((self._intern(f.symbol) for f in fills), dtype=np.int64, count=n)
+        direction = np.fromiter((f.direction for f in fills), dtype=np.int64, count=n)
+        quantity = np.fromiter((f.quantity for f in fills), dtype=np.int64, count=n)
+        price = np.fromiter((f.price for f in fills), dtype=np.float64, count=n)
+        commission = np.fromiter((f.commission for f in fills), dtype=np.float64, count=n)
+        self._apply_rows([f.time for f in fills], sym_idx, direction, quantity, price, commission)
+
+    def apply_fill_log(self, log: FillLog) -> None:
+        """Apply every fill recorded in *log*, in order.
+
+        Replays another portfolio's ``trade_history`` (or any columnar log)
+        straight from its structured records, without building FillEvents.
+        """
+
+        rec = log.records
+        if len(rec) == 0:
+            return
+        # Map the log's symbol indices onto this portfolio's rows
+        rows = np.fromiter((self._intern(s) for s in log.symbols), dtype=np.int64, count=len(log.symbols))
+        sym_idx = rows[rec["sym_idx"]]
+        direction = rec["side"].astype(np.int64)
+        self._apply_rows(log.times, sym_idx, direction, rec["qty"], rec["price"], rec["commission"])
 
     # Backward-compat alias
     def update_with_fill(self, fill: FillEvent) -> None:  # noqa: D401
@@ -96,14 +328,25 @@ class PortfolioManager:
 
     # ------------------------------------------------------------------
     def market_value(self, prices: Dict[str, float]) -> float:
-        return sum(pos.market_value(prices.get(sym, 0.0)) for sym, pos in self._positions.items())
+        n = len(self._sym_index)
+        return float(self._qty[:n] @ self._price_vector(prices))
 
     def unrealised_pnl(self, prices: Dict[str, float]) -> float:  # noqa: D401
-        return sum(pos.unrealised_pnl(prices.get(sym, 0.0)) for sym, pos in self._positions.items())
+        n = len(self._sym_index)
+        return float(((self._price_vector(prices) - self._avg_price[:n]) * self._qty[:n]).sum())
 
     def total_equity(self, prices: Dict[str, float]) -> float:  # noqa: D401
         return self.cash + self.market_value(prices)
 
+    def total_equity_array(self, price_vec: np.ndarray) -> float:
+        """Equity given prices already aligned with the position rows.
+
+        Array counterpart of :meth:`total_equity` for callers that allocated
+        rows via ``symbols`` (e.g. the backtest engine's close matrix rows).
+        """
+
+        return self.cash + float(self._qty[: len(self._sym_index)] @ price_vec)
+
     # ------------------------------------------------------------------
     # Position sizing helpers -------------------------------------------------
     def size_for_risk(self, price: float, cash_risk_pct: float) -> int:
@@ -126,47 +369,97 @@ class PortfolioManager:
         Output maps symbol → delta quantity (positive = buy, negative = sell).
         """
 
-        equity = self.total_equity(prices)
-        deltas: Dict[str, int] = {}
-        for sym, target_w in target_weights.items():
-            target_dollars = equity * target_w
-            current_qty = self._positions.get(sym, Position()).quantity
-            current_dollars = current_qty * prices.get(sym, 0.0)
-            diff_qty = int((target_dollars - current_dollars) // prices.get(sym, 1.0))
-            if diff_qty != 0:
-                deltas[sym] = diff_qty
-        return deltas
+        if not target_weights:
+            return {}
+        syms = list(target_weights)
+        k = len(syms)
+        n = len(self._sym_index)
+        weight_vec = np.fromiter(target_weights.values(), dtype=np.float64, count=k)
+        price_vec = np.fromiter((prices.get(s, 0.0) for s in syms), dtype=np.float64, count=k)
+        # Missing prices divide by 1.0 (as before); a zero price cannot be sized.
+        divisor = np.fromiter((prices.get(s, 1.0) for s in syms), dtype=np.float64, count=k)
+        # Unknown symbols map to -1, i.e. the trailing zero-quantity row.
+        rows = np.fromiter((self._sym_index.get(s, -1) for s in syms), dtype=np.int64, count=k)
+        qty_vec = np.append(self._qty[:n], 0)[rows]
+
+        diff_qty = _rebalance_deltas(self.total_equity(prices), weight_vec, qty_vec, price_vec, divisor)
+        return {sym: int(q) for sym, q in zip(syms, diff_qty.tolist()) if q != 0}
+
+    def rebalance_array(self, weight_vec: np.ndarray, price_vec: np.ndarray) -> np.ndarray:
+        """Array counterpart of :meth:`rebalance_to_target_weights`.
+
+        *weight_vec* and *price_vec* are aligned with the position rows (the
+        ``symbols`` order, like :meth:`total_equity_array`).  Returns the
+        ``int64`` share delta per row; rows with a non-positive price get 0.
+        """
+
+        qty_vec = self._qty[: len(self._sym_index)]
+        equity = self.total_equity_array(price_vec)
+        return _rebalance_deltas(equity, weight_vec, qty_vec, price_vec, price_vec)
 
     # ------------------------------------------------------------------
     # Simple risk monitoring --------------------------------------------------
-    def check_drawdown(self, prices: Dict[str, float], threshold_pct: float) -> bool:
-        """Return True if drawdown exceeds *threshold_pct* of peak equity."""
+    def check_drawdown(
+        self, prices: Dict[str, float], threshold_pct: float, when: datetime | None = None
+    ) -> bool:
+        """Return True if drawdown exceeds *threshold_pct* of peak equity.
+
+        *when* timestamps the recorded equity point (e.g. the current bar's
+        time); the wall clock is only read when it is omitted.
+        """
 
         equity = self.total_equity(prices)
-        self._equity_history.append((datetime.utcnow(), equity))
-        peak = max(e for _, e in self._equity_history)
+        self._equity_history.append((datetime.utcnow() if when is None else when, equity))
+        # Reason: track the peak as we go; rescanning the history made a
+        # backtest that checks every bar quadratic.
+        if equity > self._peak_equity:
+            self._peak_equity = equity
+        peak = self._peak_equity
         drawdown = (peak - equity) / peak if peak else 0.0
         return drawdown >= threshold_pct
 
     # ------------------------------------------------------------------
     # Persistence -------------------------------------------------------------
     def save(self, path: Path) -> None:  # noqa: D401
+        log = self.trade_history
+        rec = log.records
         data = {
             "cash": self.cash,
             "positions": {
                 sym: {"qty": pos.quantity, "avg_price": pos.avg_price}
-                for sym, pos in self._positions.items()
+                for sym, pos in self.positions.items()
             },
-            "trades": [dict(asdict(fill), time=fill.time.isoformat()) for fill in self.trade_history],
+            # Reason: one flat row per fill, read column-wise from the fill log
+            # rather than building (and ``asdict``-ing) a FillEvent per fill;
+            # ``trade_fields`` names the columns.
+            "trade_fields": list(_TRADE_FIELDS),
+            # Times stay ``datetime`` objects: orjson writes them natively and
+            # the json fallback calls ``isoformat`` (same text either way).
+            "trades": list(
+                zip(
+                    [log.symbols[i] for i in rec["sym_idx"].tolist()],
+                    log.times.to_pydatetime().tolist(),
+                    np.where(rec["side"] > 0, SignalType.BUY.value, SignalType.SELL.value).tolist(),
+                    rec["qty"].tolist(),
+                    rec["price"].tolist(),
+                    rec["commission"].tolist(),
+                )
+            ),
         }
-        path.write_text(json.dumps(data, indent=2))
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            path.write_text(json.dumps(data, indent=2, default=datetime.isoformat))
 
     @classmethod
     def load(cls, path: Path) -> "PortfolioManager":  # noqa: D401
         obj = cls()
-        data = json.loads(path.read_text())
+        data = orjson.loads(path.read_bytes()) if orjson is not None else json.loads(path.read_text())
         obj.cash = data["cash"]
         for sym, info in data["positions"].items():
-            obj._positions[sym] = Position(info["qty"], info["avg_price"])
+            idx = obj._intern(sym)
+            obj._qty[idx] = info["qty"]
+            obj._avg_price[idx] = info["avg_price"]
+            obj._active[idx] = True
         # trade history not reconstructed for brevity
         return obj
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Sequence, Type
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, ValidationError
 
@@ -14,6 +15,11 @@ class Strategy(ABC):
 
     Subclasses should define an inner ``ParamModel`` (pydantic ``BaseModel``)
     describing their parameters. If absent, parameters are unchecked.
+    The parsed model is cached on ``_param_obj``; change parameters through
+    :meth:`update_parameters` so it stays in sync.
+
+    Strategies whose per-bar signal only depends on the trailing ``lookback``
+    Close prices can also be fed one price at a time via :meth:`update`.
     """
 
     name: str = "BaseStrategy"
@@ -21,12 +27,21 @@ class Strategy(ABC):
 
     # --- parameter schema -------------------------------------------------
     ParamModel: Optional[Type[BaseModel]] = None  # to be defined by subclasses
+    # Trailing Close prices ``update`` needs (set by ``_bind_parameters``);
+    # ``None`` means the strategy does not support streaming updates.
+    # Strategies that set it implement ``_signals_for_close(close, keys)``:
+    # per-bar signals from a Close array, where *keys* identifies the previous
+    # and current bar (``None`` from ``generate_signals``).
+    _lookback: Optional[int] = None
 
     # --- lifecyle ---------------------------------------------------------
     def __init__(self, parameters: Dict[str, Any] | None = None):
         self.parameters: Dict[str, Any] = parameters or {}
         self._param_obj: Optional[BaseModel] = None
         self.state: Dict[str, Any] = {}
+        self._tail = np.empty(0, dtype=np.float64)  # streamed Close prices
+        self._tail_n = 0
+        self._ticks = 0
         self.validate_parameters()
 
     # --------------------- main API ---------------------------------------
@@ -38,10 +53,88 @@ class Strategy(ABC):
             Dict mapping symbol -> ``Signal``
         """
 
+    def generate_signals_vectorized(self, data: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Generate signals for *every* bar of *data* in a single pass.
+
+        Row ``t`` of the result must match what ``generate_signals`` returns
+        when called on ``data.loc[:t]``.  Values are integer codes from
+        :data:`~src.strategies.signal.SIGNAL_CODES` (0 = HOLD / no signal).
+
+        Returns:
+            DataFrame indexed like *data* with one column per symbol, or
+            ``None`` if the strategy only supports per-bar evaluation.
+        """
+
+        return None
+
+    def generate_signals_batch(self, data: pd.DataFrame) -> Optional[np.ndarray]:
+        """Signal codes for every bar of *data* as a 1-D ``int8`` array.
+
+        The array primitive behind ``generate_signals_vectorized`` for
+        single-symbol strategies: element ``t`` is the code for the
+        strategy's symbol at row ``t`` (0 = HOLD).
+
+        Returns:
+            ``int8`` array of ``len(data)`` codes, or ``None`` if unsupported.
+        """
+
+        return None
+
+    # --------------------- streaming API ----------------------------------
+    @property
+    def lookback(self) -> Optional[int]:
+        """Close prices :meth:`update` keeps, or ``None`` if unsupported."""
+
+        return self._lookback
+
+    def seed(self, closes: Sequence[float] | np.ndarray) -> None:
+        """Replace the streamed history with *closes* (oldest first)."""
+
+        self._require_streaming()
+        tail = np.asarray(closes, dtype=np.float64)[-self._lookback :]
+        self._tail = np.empty(2 * self._lookback, dtype=np.float64)
+        self._tail[: len(tail)] = tail
+        self._tail_n = len(tail)
+        self._ticks += 1  # any per-tick cache no longer follows on
+
+    def update(self, price: float) -> Dict[str, Signal]:
+        """Append one Close *price* and return the signals for the new bar.
+
+        Equivalent to ``generate_signals`` on every price seeded/streamed so
+        far, but only the trailing ``lookback`` prices are kept, so each call
+        costs O(window) however long the session runs.  Changing parameters
+        clears the streamed history.
+        """
+
+        self._require_streaming()
+        n, tail = self._tail_n, self._tail
+        if n == len(tail):
+            if n == 0:
+                tail = self._tail = np.empty(2 * self._lookback, dtype=np.float64)
+            else:  # keep the trailing window, amortised O(1) per tick
+                keep = self._lookback - 1
+                tail[:keep] = tail[n - keep : n]
+                n = keep
+        tail[n] = price
+        self._tail_n = n + 1
+        self._ticks += 1
+        return self._signals_for_close(tail[: n + 1], (self._ticks - 1, self._ticks))
+
+    def _require_streaming(self) -> None:
+        if self._lookback is None:
+            raise NotImplementedError(f"{self.name} does not support streaming updates")
+
     # --------------------- helpers ----------------------------------------
     def update_parameters(self, params: Dict[str, Any]) -> None:
-        """Merge *params* into existing and re-validate."""
+        """Merge *params* into existing and re-validate.
+
+        Updates that change nothing skip validation (the parsed model stays).
+        """
 
+        if self._param_obj is not None and all(
+            k in self.parameters and self.parameters[k] == v for k, v in params.items()
+        ):
+            return
         self.parameters.update(params)
         self.validate_parameters()
 
@@ -51,13 +144,25 @@ class Strategy(ABC):
         if self.ParamModel is None:
             return True
         try:
-            self._param_obj = self.ParamModel(**self.parameters)
+            self._param_obj = self.ParamModel.model_validate(self.parameters)
         except ValidationError as exc:
             raise ValueError(f"Invalid parameters for {self.name}:\n{exc}") from exc
         # replace with parsed data
         self.parameters = self._param_obj.model_dump()
+        self._bind_parameters()
+        # the streamed window may no longer be long enough (or sized right);
+        # ``update`` reallocates for the new lookback
+        self._tail = np.empty(0, dtype=np.float64)
+        self._tail_n = 0
         return True
 
+    def _bind_parameters(self) -> None:
+        """Hook run after each successful validation.
+
+        Subclasses may copy hot fields of ``_param_obj`` onto plain instance
+        attributes here so per-bar code avoids repeated model lookups.
+        """
+
     # ---------------------------------------------------------------------
     def get_required_indicators(self) -> List[str]:  # noqa: D401
         """Return list of data columns needed. Default OHLCV."""
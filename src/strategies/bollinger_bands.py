@@ -2,11 +2,13 @@ from __future__ import annotations
 
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, Field
 
 from .base import Strategy
-from .signal import Signal, SignalType
+from .kernels import bollinger_codes, window_mean, window_std
+from .signal import CODE_SIGNALS, Signal, SignalType
 
 
 class BBParams(BaseModel):
@@ -24,27 +26,48 @@ class BollingerBandsStrategy(Strategy):
     name = "BollingerBands"
     ParamModel = BBParams
 
+    def _bind_parameters(self) -> None:  # noqa: D401
+        p: BBParams = self._param_obj  # type: ignore[assignment]
+        self._symbol, self._window, self._num_std = p.symbol, p.window, p.num_std
+        self._lookback = p.window
+
     def generate_signals(self, data: pd.DataFrame) -> Dict[str, Signal]:  # noqa: D401
         if data.empty or "Close" not in data.columns:
             return {}
-        p = BBParams(**self.parameters)  # type: ignore[arg-type]
-        close = data["Close"].astype(float)
-        ma = close.rolling(window=p.window).mean()
-        std = close.rolling(window=p.window).std(ddof=0)
-        upper = ma + p.num_std * std
-        lower = ma - p.num_std * std
-        if len(close) < p.window:
+        return self._signals_for_close(data["Close"].to_numpy(dtype=np.float64, copy=False))
+
+    def _signals_for_close(self, close: np.ndarray, keys=None) -> Dict[str, Signal]:  # noqa: D401
+        window, num_std = self._window, self._num_std
+        if len(close) < window:
             return {}
-        price = close.iloc[-1]
-        up = upper.iloc[-1]
-        lo = lower.iloc[-1]
-        action = SignalType.HOLD
-        if price < lo:
-            action = SignalType.BUY
-        elif price > up:
-            action = SignalType.SELL
-        sig = Signal(type=action, confidence=1.0, metadata={"price": price, "upper": up, "lower": lo})
-        return {p.symbol: sig}
+        # Reason: only the latest band is used, so reduce the trailing window
+        # (same kernels as the vectorised path) instead of materialising
+        # full-length rolling series on every call.
+        n = len(close)
+        ma = window_mean(close, n, window)
+        std = window_std(close, n, window, ma)
+        price = close[-1]
+        up = ma + num_std * std
+        lo = ma - num_std * std
+        # The bands never overlap, so at most one side fires (NaN -> HOLD).
+        action = CODE_SIGNALS[int(price < lo) - int(price > up)]
+        meta = None if action is SignalType.HOLD else {"price": price, "upper": up, "lower": lo}
+        sig = Signal(type=action, confidence=1.0, metadata=meta)
+        return {self._symbol: sig}
+
+    def generate_signals_vectorized(self, data: pd.DataFrame) -> pd.DataFrame:  # noqa: D401
+        if data.empty or "Close" not in data.columns:
+            return pd.DataFrame(index=data.index)
+        return pd.DataFrame({self._symbol: self.generate_signals_batch(data)}, index=data.index)
+
+    def generate_signals_batch(self, data: pd.DataFrame) -> np.ndarray:  # noqa: D401
+        if "Close" not in data.columns:
+            return np.zeros(len(data), dtype=np.int8)
+        p: BBParams = self._param_obj  # type: ignore[assignment]
+        price = data["Close"].to_numpy(dtype=np.float64, copy=False)[:, None]
+        codes = np.empty(price.shape, dtype=np.int8)
+        bollinger_codes(price, p.window, float(p.num_std), codes)
+        return codes[:, 0]
 
     def get_required_indicators(self):  # noqa: D401
         return ["Close"]
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 
 from .base import Strategy
-from .signal import Signal, SignalType
+from .signal import SIGNAL_CODES, Signal, SignalType
 
 
 class BuyAndHoldStrategy(Strategy):
@@ -23,3 +24,11 @@ class BuyAndHoldStrategy(Strategy):
         first_price = data.iloc[0]["Close"]
         signal = Signal(type=SignalType.BUY, confidence=1.0, metadata={"price": first_price, "date": first_date})
         return {"AAPL": signal}
+
+    def generate_signals_vectorized(self, data: pd.DataFrame) -> pd.DataFrame:  # noqa: D401
+        if data.empty:
+            return pd.DataFrame(index=data.index)
+        return pd.DataFrame({"AAPL": self.generate_signals_batch(data)}, index=data.index)
+
+    def generate_signals_batch(self, data: pd.DataFrame) -> np.ndarray:  # noqa: D401
+        return np.full(len(data), SIGNAL_CODES[SignalType.BUY], dtype=np.int8)
@@ -0,0 +1,213 @@
+"""Numeric signal kernels shared by the built-in strategies.
+
+Every kernel takes 2-D ``float64`` inputs laid out as (time × symbol) and
+writes :data:`~src.strategies.signal.SIGNAL_CODES` values into an ``int8``
+array of the same shape.  Symbols are independent, so the outer loop runs in
+parallel under Numba.  Without Numba the public names are bound to NumPy
+equivalents instead (see the end of the module), which do the same
+arithmetic in the same order and so return identical values.
+
+Windowed means/standard deviations are computed here too (``window_mean``,
+``rolling_mean``, ...) so the per-bar ``generate_signals`` paths, which only
+need the latest window, produce bit-identical values to the vectorised ones.
+Other indicators (RSI, ...) are computed with pandas by the strategies.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from src.utils.jit import NUMBA_AVAILABLE, njit, prange
+
+from .signal import SIGNAL_CODES, SignalType
+
+_BUY = SIGNAL_CODES[SignalType.BUY]
+_SELL = SIGNAL_CODES[SignalType.SELL]
+_HOLD = SIGNAL_CODES[SignalType.HOLD]
+
+
+@njit(cache=True)
+def window_mean(x: np.ndarray, end: int, window: int) -> float:
+    """Mean of ``x[end - window:end]`` (NaN if any value is NaN).
+
+    Deviations are summed relative to the window's first value, so a flat
+    window yields its value exactly instead of a rounding residue that could
+    fake a crossover.
+    """
+
+    base = x[end - window]
+    acc = 0.0
+    for i in range(end - window, end):
+        acc += x[i] - base
+    return base + acc / window
+
+
+@njit(cache=True)
+def window_std(x: np.ndarray, end: int, window: int, mean: float) -> float:
+    """Population std (``ddof=0``) of ``x[end - window:end]`` about *mean*."""
+
+    acc = 0.0
+    for i in range(end - window, end):
+        d = x[i] - mean
+        acc += d * d
+    return np.sqrt(acc / window)
+
+
+@njit(parallel=True, cache=True)
+def rolling_mean(values: np.ndarray, window: int, out: np.ndarray) -> None:
+    """``out[t]`` = :func:`window_mean` of the *window* bars ending at ``t``.
+
+    Bars before ``window - 1`` are NaN, as with pandas ``rolling().mean()``.
+    """
+
+    n_bars, n_syms = values.shape
+    for j in prange(n_syms):
+        col = values[:, j]
+        for t in range(n_bars):
+            out[t, j] = np.nan if t < window - 1 else window_mean(col, t + 1, window)
+
+
+@njit(parallel=True, cache=True)
+def crossover_codes(fast: np.ndarray, slow: np.ndarray, warmup: int, out: np.ndarray) -> None:
+    """BUY when *fast* crosses above *slow*, SELL on the opposite cross.
+
+    Bars before *warmup* are HOLD.  NaN comparisons are false, as in pandas.
+    """
+
+    n_bars, n_syms = fast.shape
+    for j in prange(n_syms):
+        for t in range(n_bars):
+            code = _HOLD
+            if t >= warmup and t > 0:
+                fp, sp = fast[t - 1, j], slow[t - 1, j]
+                fc, sc = fast[t, j], slow[t, j]
+                if fp <= sp and fc > sc:
+                    code = _BUY
+                elif fp >= sp and fc < sc:
+                    code = _SELL
+            out[t, j] = code
+
+
+@njit(parallel=True, cache=True)
+def bollinger_codes(values: np.ndarray, window: int, num_std: float, out: np.ndarray) -> None:
+    """Bollinger signal per bar: BUY below ``mean - num_std*std``, SELL above
+    ``mean + num_std*std`` of the trailing *window* (HOLD while warming up).
+
+    Fuses the band computation with the comparison so no full-length
+    mean/std/band arrays are materialised.
+    """
+
+    n_bars, n_syms = values.shape
+    for j in prange(n_syms):
+        col = values[:, j]
+        for t in range(n_bars):
+            code = _HOLD
+            if t >= window - 1:
+                m = window_mean(col, t + 1, window)
+                s = window_std(col, t + 1, window, m)
+                v = col[t]
+                if v < m - num_std * s:
+                    code = _BUY
+                elif v > m + num_std * s:
+                    code = _SELL
+            out[t, j] = code
+
+
+@njit(parallel=True, cache=True)
+def band_codes(value: np.ndarray, lower: np.ndarray, upper: np.ndarray, out: np.ndarray) -> None:
+    """BUY when *value* is below *lower*, SELL when above *upper*."""
+
+    n_bars, n_syms = value.shape
+    for j in prange(n_syms):
+        for t in range(n_bars):
+            v = value[t, j]
+            if v < lower[t, j]:
+                out[t, j] = _BUY
+            elif v > upper[t, j]:
+                out[t, j] = _SELL
+            else:
+                out[t, j] = _HOLD
+
+
+# ---------------------------------------------------------------------------
+# NumPy fallbacks --------------------------------------------------------------
+# Run per element in plain Python the loops above cost O(bars * window)
+# interpreter steps.  These add one window offset at a time across all bars
+# (or use ``np.add.accumulate``), both strictly left to right like the loops,
+# so each result is bit-identical to its compiled counterpart.
+
+
+def _window_mean_np(x: np.ndarray, end: int, window: int) -> float:
+    seg = x[end - window : end]
+    return float(seg[0] + np.add.accumulate(seg - seg[0])[-1] / window)
+
+
+def _window_std_np(x: np.ndarray, end: int, window: int, mean: float) -> float:
+    d = x[end - window : end] - mean
+    return float(np.sqrt(np.add.accumulate(d * d)[-1] / window))
+
+
+def _rolling_mean_np(values: np.ndarray, window: int, out: np.ndarray) -> None:
+    m = values.shape[0] - window + 1  # bars with a full window
+    out[: max(window - 1, 0)] = np.nan
+    if m <= 0:
+        out[:] = np.nan
+        return
+    base = values[:m]
+    acc = np.zeros(base.shape)
+    for k in range(window):
+        acc += values[k : k + m] - base
+    out[window - 1 :] = base + acc / window
+
+
+def _bollinger_codes_np(values: np.ndarray, window: int, num_std: float, out: np.ndarray) -> None:
+    mean = np.empty(values.shape)
+    _rolling_mean_np(values, window, mean)
+    out[:] = _HOLD
+    m = values.shape[0] - window + 1
+    if m <= 0:
+        return
+    mean = mean[window - 1 :]
+    acc = np.zeros(mean.shape)
+    for k in range(window):
+        d = values[k : k + m] - mean
+        acc += d * d
+    std = np.sqrt(acc / window)
+    v = values[window - 1 :]
+    out[window - 1 :] = np.where(
+        v < mean - num_std * std, _BUY, np.where(v > mean + num_std * std, _SELL, _HOLD)
+    )
+
+
+def _crossover_codes_np(fast: np.ndarray, slow: np.ndarray, warmup: int, out: np.ndarray) -> None:
+    out[:] = _HOLD
+    start = max(warmup, 1)
+    if start >= fast.shape[0]:
+        return
+    fp, sp = fast[start - 1 : -1], slow[start - 1 : -1]
+    fc, sc = fast[start:], slow[start:]
+    out[start:] = np.where(
+        (fp <= sp) & (fc > sc), _BUY, np.where((fp >= sp) & (fc < sc), _SELL, _HOLD)
+    )
+
+
+def _band_codes_np(value: np.ndarray, lower: np.ndarray, upper: np.ndarray, out: np.ndarray) -> None:
+    out[:] = np.where(value < lower, _BUY, np.where(value > upper, _SELL, _HOLD))
+
+
+if not NUMBA_AVAILABLE:  # pragma: no cover - exercised only without numba
+    window_mean = _window_mean_np
+    window_std = _window_std_np
+    rolling_mean = _rolling_mean_np
+    bollinger_codes = _bollinger_codes_np
+    crossover_codes = _crossover_codes_np
+    band_codes = _band_codes_np
+
+
+__all__ = [
+    "band_codes",
+    "bollinger_codes",
+    "crossover_codes",
+    "rolling_mean",
+    "window_mean",
+    "window_std",
+]
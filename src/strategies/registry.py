@@ -9,6 +9,8 @@ from pathlib import Path
 from types import ModuleType
 from typing import Any, Dict, Optional, Type
 
+from loguru import logger
+
 from .base import Strategy
 
 _EXCLUDE_MODULES = {"base", "signal", "registry", "__init__"}
@@ -17,14 +19,25 @@ _EXCLUDE_MODULES = {"base", "signal", "registry", "__init__"}
 class StrategyRegistry:
     """Registry for discovering, validating, and instantiating strategies."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, tracking: bool = True) -> None:
+        """Create an empty registry.
+
+        Args:
+            tracking: Record per-strategy call counts and timings in
+                :meth:`run_and_track`. Disable for hot backtest loops.
+        """
         self._classes: Dict[str, Type[Strategy]] = {}
-        # performance stats keyed by strategy name
-        self._perf: Dict[str, Dict[str, Any]] = defaultdict(lambda: {"calls": 0, "errors": 0, "total_time": 0.0})
+        self._discovered = False  # built-in package scanned (see _ensure_discovered)
+        self.tracking = tracking
+        # performance stats keyed by strategy name; times in integer ns
+        self._perf: Dict[str, Dict[str, int]] = defaultdict(lambda: {"calls": 0, "errors": 0, "total_time_ns": 0})
 
     # ------------------------------------------------------------------
     def register(self, cls: Type[Strategy]) -> None:
-        """Register a *Strategy* subclass after validation."""
+        """Register a *Strategy* subclass.
+
+        Parameters are validated when :meth:`factory` instantiates the class.
+        """
 
         if not inspect.isclass(cls) or not issubclass(cls, Strategy):
             raise TypeError("Only Strategy subclasses can be registered")
@@ -33,15 +46,14 @@ class StrategyRegistry:
         name = cls.name
         if name in self._classes:
             raise ValueError(f"Strategy with name '{name}' already registered")
-        # trigger parameter validation on empty params to catch obvious issues
-        cls()
         self._classes[name] = cls
 
     # ------------------------------------------------------------------
     def discover(self, package: Optional[ModuleType] = None) -> None:
         """Auto-discover strategy classes within the strategies package."""
 
-        if package is None:
+        builtin = package is None
+        if builtin:
             package = importlib.import_module(__package__)  # type: ignore[arg-type]
         pkg_path = Path(package.__file__).parent
         for _, mod_name, is_pkg in pkgutil.iter_modules([str(pkg_path)]):
@@ -50,47 +62,91 @@ class StrategyRegistry:
             full_name = f"{package.__name__}.{mod_name}"
             module = importlib.import_module(full_name)
             self._discover_module(module)
+        if builtin:
+            # Reason: set only after a complete scan so an import error is
+            # raised again (not silently cached) on the next lookup.
+            self._discovered = True
 
     def _discover_module(self, module: ModuleType) -> None:
         for obj in vars(module).values():
-            if inspect.isclass(obj) and issubclass(obj, Strategy):
+            if inspect.isclass(obj) and issubclass(obj, Strategy) and obj is not Strategy:
+                taken = self._classes.get(obj.name)
+                if taken is obj:
+                    continue  # registered explicitly before discovery ran
+                if taken is not None:
+                    logger.warning(
+                        "Skipping discovered strategy {}.{}: name '{}' already registered by {}.{}",
+                        obj.__module__, obj.__qualname__, obj.name, taken.__module__, taken.__qualname__,
+                    )
+                    continue
                 self.register(obj)  # type: ignore[arg-type]
 
+    def _ensure_discovered(self) -> None:
+        """Scan the built-in strategies package on first use."""
+
+        # Reason: importing every strategy module at import time slowed down
+        # tools that only need one strategy (or none).
+        if not self._discovered:
+            self.discover()
+
     # ------------------------------------------------------------------
+    def resolve(self, name: str) -> Type[Strategy]:
+        """Return the class registered as *name* (discovering built-ins on a miss).
+
+        Resolve once and instantiate the class directly when creating many
+        strategies of one kind, e.g. in a parameter sweep.
+        """
+
+        cls = self._classes.get(name)
+        if cls is None:
+            self._ensure_discovered()
+            cls = self._classes.get(name)
+            if cls is None:
+                raise KeyError(f"Strategy '{name}' not registered")
+        return cls
+
     def factory(self, name: str, parameters: Optional[Dict[str, Any]] = None) -> Strategy:
-        """Instantiate strategy *name* with *parameters*."""
+        """Instantiate strategy *name* with *parameters*.
 
-        if name not in self._classes:
-            raise KeyError(f"Strategy '{name}' not registered")
-        cls = self._classes[name]
-        return cls(parameters)
+        Every call returns a new instance: strategies carry per-run state, so
+        instances are never cached or shared.
+        """
+
+        return self.resolve(name)(parameters)
 
     # ------------------------------------------------------------------
-    def run_and_track(self, strategy: Strategy, data) -> Dict[str, Any]:  # pragma: no cover
+    def run_and_track(self, strategy: Strategy, data) -> Dict[str, Any]:
         """Helper to execute *strategy.generate_signals* and track performance."""
 
-        start = time.perf_counter()
+        if not self.tracking:
+            return strategy.generate_signals(data)
+        stats = self._perf[strategy.name]
+        start = time.perf_counter_ns()
         try:
             result = strategy.generate_signals(data)
-            self._perf[strategy.name]["calls"] += 1
-            return result
         except Exception:  # noqa: BLE001
-            self._perf[strategy.name]["errors"] += 1
+            stats["errors"] += 1
+            stats["total_time_ns"] += time.perf_counter_ns() - start
             raise
-        finally:
-            self._perf[strategy.name]["total_time"] += time.perf_counter() - start
+        stats["calls"] += 1
+        stats["total_time_ns"] += time.perf_counter_ns() - start
+        return result
 
     # ------------------------------------------------------------------
     @property
     def registry(self) -> Dict[str, Type[Strategy]]:
+        self._ensure_discovered()
         return dict(self._classes)
 
     @property
     def performance(self) -> Dict[str, Dict[str, Any]]:
-        return self._perf
+        """Per-strategy ``calls``, ``errors`` and ``total_time`` (seconds)."""
+
+        return {
+            name: {"calls": s["calls"], "errors": s["errors"], "total_time": s["total_time_ns"] / 1e9}
+            for name, s in self._perf.items()
+        }
 
 
-# Global singleton
+# Global singleton; built-ins are discovered on first lookup
 registry = StrategyRegistry()
-# Discover built-ins on import
-registry.discover()
@@ -2,11 +2,15 @@ from __future__ import annotations
 
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, Field
 
+from src.utils.jit import NUMBA_AVAILABLE, njit, prange
+
 from .base import Strategy
-from .signal import Signal, SignalType
+from .kernels import band_codes
+from .signal import CODE_SIGNALS, Signal, SignalType
 
 
 class RSIParams(BaseModel):
@@ -16,6 +20,94 @@ class RSIParams(BaseModel):
     overbought: int = Field(70, ge=50, le=99)
 
 
+@njit(cache=True)
+def _rsi_last(close: np.ndarray, window: int) -> float:
+    """Latest value of :meth:`RSIMeanReversionStrategy._rsi` in one pass.
+
+    Only the trailing ``window`` price changes are read; NaN until
+    ``window + 1`` prices exist or if any of them is NaN.
+    """
+
+    n = close.shape[0]
+    if n < window + 1:
+        return np.nan
+    up = 0.0
+    down = 0.0
+    for t in range(n - window, n):
+        delta = close[t] - close[t - 1]
+        if delta != delta:
+            return np.nan
+        if delta > 0:
+            up += delta
+        else:
+            down -= delta
+    if down == 0.0:
+        # pandas: x / 0 -> inf (RSI 100), 0 / 0 -> NaN
+        return 100.0 if up > 0.0 else np.nan
+    return 100.0 - 100.0 / (1.0 + up / down)
+
+
+@njit(parallel=True, cache=True)
+def _rsi_series(close: np.ndarray, window: int, out: np.ndarray) -> None:
+    """``out[t]`` = :func:`_rsi_last` of ``close[:t + 1]`` for every bar.
+
+    Each bar re-sums its own window rather than sliding running sums, so the
+    vectorised path agrees bit-for-bit with the per-bar one.
+    """
+
+    for t in prange(close.shape[0]):
+        out[t] = _rsi_last(close[: t + 1], window)
+
+
+def _rsi_from_sums(up: np.ndarray, down: np.ndarray) -> np.ndarray:
+    """RSI from summed gains/losses, with the kernels' ``down == 0`` cases."""
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 - 100.0 / (1.0 + up / down)
+    return np.where(down == 0.0, np.where(up > 0.0, 100.0, np.nan), rsi)
+
+
+def _rsi_last_np(close: np.ndarray, window: int) -> float:
+    """NumPy :func:`_rsi_last` (same summation order, same result)."""
+
+    n = close.shape[0]
+    if n < window + 1:
+        return np.nan
+    delta = np.diff(close[n - window - 1 :])
+    if np.isnan(delta).any():
+        return np.nan
+    # accumulate sums left to right, exactly like the compiled loop
+    up = np.add.accumulate(np.where(delta > 0, delta, 0.0))[-1:]
+    down = np.add.accumulate(np.where(delta > 0, 0.0, -delta))[-1:]
+    return float(_rsi_from_sums(up, down)[0])
+
+
+def _rsi_series_np(close: np.ndarray, window: int, out: np.ndarray) -> None:
+    """NumPy :func:`_rsi_series`: adds one window offset at a time across all
+    bars (left to right, as the loop does), so values are bit-identical."""
+
+    m = close.shape[0] - window  # bars with ``window`` price changes
+    out[: min(window, close.shape[0])] = np.nan
+    if m <= 0:
+        return
+    delta = np.diff(close)
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta > 0, 0.0, -delta)
+    missing = np.isnan(delta)
+    up, down = np.zeros(m), np.zeros(m)
+    gap = np.zeros(m, dtype=bool)
+    for k in range(window):
+        up += gain[k : k + m]
+        down += loss[k : k + m]
+        gap |= missing[k : k + m]
+    out[window:] = np.where(gap, np.nan, _rsi_from_sums(up, down))
+
+
+if not NUMBA_AVAILABLE:  # pragma: no cover - exercised only without numba
+    # Reason: the loops above would run per element in plain Python.
+    _rsi_last, _rsi_series = _rsi_last_np, _rsi_series_np
+
+
 class RSIMeanReversionStrategy(Strategy):
     """RSI-based mean reversion strategy.
 
@@ -34,21 +126,40 @@ class RSIMeanReversionStrategy(Strategy):
         rs = roll_up / roll_down
         return 100 - (100 / (1 + rs))
 
+    def _bind_parameters(self) -> None:  # noqa: D401
+        p: RSIParams = self._param_obj  # type: ignore[assignment]
+        self._symbol, self._window = p.symbol, p.window
+        self._oversold, self._overbought = p.oversold, p.overbought
+        self._lookback = p.window + 1
+
     def generate_signals(self, data: pd.DataFrame) -> Dict[str, Signal]:  # noqa: D401
         if data.empty or "Close" not in data.columns:
             return {}
-        p = RSIParams(**self.parameters)  # type: ignore[arg-type]
-        rsi_series = self._rsi(data["Close"].astype(float), p.window)
-        if rsi_series.empty:
-            return {}
-        rsi_val = rsi_series.iloc[-1]
-        action = SignalType.HOLD
-        if rsi_val < p.oversold:
-            action = SignalType.BUY
-        elif rsi_val > p.overbought:
-            action = SignalType.SELL
-        sig = Signal(type=action, confidence=1.0, metadata={"rsi": rsi_val})
-        return {p.symbol: sig}
+        return self._signals_for_close(data["Close"].to_numpy(dtype=np.float64, copy=False))
+
+    def _signals_for_close(self, close: np.ndarray, keys=None) -> Dict[str, Signal]:  # noqa: D401
+        rsi_val = _rsi_last(close, self._window)
+        # oversold <= overbought, so at most one side fires (NaN -> HOLD).
+        action = CODE_SIGNALS[int(rsi_val < self._oversold) - int(rsi_val > self._overbought)]
+        meta = None if action is SignalType.HOLD else {"rsi": rsi_val}
+        sig = Signal(type=action, confidence=1.0, metadata=meta)
+        return {self._symbol: sig}
+
+    def generate_signals_vectorized(self, data: pd.DataFrame) -> pd.DataFrame:  # noqa: D401
+        if data.empty or "Close" not in data.columns:
+            return pd.DataFrame(index=data.index)
+        return pd.DataFrame({self._symbol: self.generate_signals_batch(data)}, index=data.index)
+
+    def generate_signals_batch(self, data: pd.DataFrame) -> np.ndarray:  # noqa: D401
+        if "Close" not in data.columns:
+            return np.zeros(len(data), dtype=np.int8)
+        p: RSIParams = self._param_obj  # type: ignore[assignment]
+        close = data["Close"].to_numpy(dtype=np.float64)
+        rsi = np.empty((close.shape[0], 1))
+        _rsi_series(close, p.window, rsi[:, 0])
+        codes = np.empty(rsi.shape, dtype=np.int8)
+        band_codes(rsi, np.full(rsi.shape, p.oversold), np.full(rsi.shape, p.overbought), codes)
+        return codes[:, 0]
 
     def get_required_indicators(self):  # noqa: D401
         return ["Close"]
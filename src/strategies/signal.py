@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from enum import Enum
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Mapping
 
 
 class SignalType(str, Enum):
@@ -11,13 +11,26 @@ class SignalType(str, Enum):
     HOLD = "HOLD"
 
 
+# Compact integer encoding used by the vectorised signal API.
+SIGNAL_CODES: dict[SignalType, int] = {SignalType.SELL: -1, SignalType.HOLD: 0, SignalType.BUY: 1}
+CODE_SIGNALS: dict[int, SignalType] = {code: sig for sig, code in SIGNAL_CODES.items()}
+
+
 @dataclass(slots=True)
 class Signal:
     """Trading signal with confidence and optional metadata."""
 
     type: SignalType
     confidence: float = 1.0
-    metadata: dict[str, Any] = field(default_factory=dict)
+    # Reason: most bars emit HOLD with nothing to attach; ``None`` avoids a
+    # dict allocation per signal.  Read through :attr:`meta`.
+    metadata: dict[str, Any] | None = None
+
+    @property
+    def meta(self) -> Mapping[str, Any]:
+        """Attached metadata, or an empty mapping if there is none."""
+
+        return self.metadata if self.metadata is not None else {}
 
     def __post_init__(self) -> None:  # pragma: no cover
         if not 0 <= self.confidence <= 1:
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 from typing import Dict, Any
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, Field, model_validator
 
 from .base import Strategy
-from .signal import Signal, SignalType
+from .kernels import crossover_codes, rolling_mean, window_mean
+from .signal import CODE_SIGNALS, Signal
 
 
 class SMAParams(BaseModel):
@@ -30,25 +32,62 @@ class SMACrossoverStrategy(Strategy):
     name = "SMACrossover"
     ParamModel = SMAParams
 
+    def _bind_parameters(self) -> None:  # noqa: D401
+        p: SMAParams = self._param_obj  # type: ignore[assignment]
+        self._symbol, self._fast, self._slow = p.symbol, p.fast_window, p.slow_window
+        self._lookback = p.slow_window + 1
+        self.state.pop("sma_last", None)  # cached averages used the old windows
+
     def generate_signals(self, data: pd.DataFrame) -> Dict[str, Signal]:  # noqa: D401
         if data.empty or "Close" not in data.columns:
             return {}
-        p = SMAParams(**self.parameters)  # type: ignore[arg-type]
-        close = data["Close"].astype(float)
-        fast = close.rolling(window=p.fast_window).mean()
-        slow = close.rolling(window=p.slow_window).mean()
+        # Reason: no averages carried over here; a caller's frame may slide or
+        # revise any bar in the window, which no cheap key can rule out.
+        return self._signals_for_close(data["Close"].to_numpy(dtype=np.float64, copy=False))
+
+    def _signals_for_close(self, close: np.ndarray, keys=None) -> Dict[str, Signal]:  # noqa: D401
+        fast, slow = self._fast, self._slow
         # need two points to determine cross
-        if len(close) < p.slow_window + 1:
+        if len(close) < slow + 1:
             return {}
-        fast_curr, fast_prev = fast.iloc[-1], fast.iloc[-2]
-        slow_curr, slow_prev = slow.iloc[-1], slow.iloc[-2]
-        action: SignalType = SignalType.HOLD
-        if fast_prev <= slow_prev and fast_curr > slow_curr:
-            action = SignalType.BUY
-        elif fast_prev >= slow_prev and fast_curr < slow_curr:
-            action = SignalType.SELL
+        # Reason: only the last two averages matter; reduce the trailing
+        # windows (same kernel as the vectorised path) instead of rolling over
+        # the whole history on every call.  When streaming via ``update`` (the
+        # tail is append-only), the previous tick's averages are this one's
+        # "prev" ones.
+        n = len(close)
+        cached = self.state.get("sma_last")
+        if keys is not None and cached is not None and cached[0] == keys[0]:
+            fast_prev, slow_prev = cached[1], cached[2]
+        else:
+            fast_prev, slow_prev = window_mean(close, n - 1, fast), window_mean(close, n - 1, slow)
+        fast_curr, slow_curr = window_mean(close, n, fast), window_mean(close, n, slow)
+        if keys is not None:
+            self.state["sma_last"] = (keys[1], fast_curr, slow_curr)
+        bullish = (fast_prev <= slow_prev) & (fast_curr > slow_curr)
+        bearish = (fast_prev >= slow_prev) & (fast_curr < slow_curr)
+        action = CODE_SIGNALS[int(bullish) - int(bearish)]
         sig = Signal(type=action, confidence=1.0)
-        return {p.symbol: sig}
+        return {self._symbol: sig}
+
+    def generate_signals_vectorized(self, data: pd.DataFrame) -> pd.DataFrame:  # noqa: D401
+        if data.empty or "Close" not in data.columns:
+            return pd.DataFrame(index=data.index)
+        return pd.DataFrame({self._symbol: self.generate_signals_batch(data)}, index=data.index)
+
+    def generate_signals_batch(self, data: pd.DataFrame) -> np.ndarray:  # noqa: D401
+        if "Close" not in data.columns:
+            return np.zeros(len(data), dtype=np.int8)
+        p: SMAParams = self._param_obj  # type: ignore[assignment]
+        close = data["Close"].to_numpy(dtype=np.float64, copy=False)[:, None]
+        fast = np.empty(close.shape)
+        slow = np.empty(close.shape)
+        rolling_mean(close, p.fast_window, fast)
+        rolling_mean(close, p.slow_window, slow)
+        codes = np.empty(close.shape, dtype=np.int8)
+        # Reason: per-bar evaluation emits nothing until slow_window + 1 bars exist
+        crossover_codes(fast, slow, p.slow_window, codes)
+        return codes[:, 0]
 
     def get_required_indicators(self):  # noqa: D401
         return ["Close"]
@@ -1,2 +1,3 @@
 from .validators import is_valid_symbol  # noqa: F401
 from .transform import normalize_ohlcv  # noqa: F401
+from .rate_limit import TokenBucket  # noqa: F401
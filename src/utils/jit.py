@@ -0,0 +1,31 @@
+"""Optional Numba acceleration for numeric kernels.
+
+``njit`` and ``prange`` resolve to Numba's implementations when the package is
+installed.  Without Numba they degrade to a pass-through decorator and the
+builtin ``range`` so the same kernels still run as plain Python/NumPy.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    from numba import njit, prange  # type: ignore[import-not-found]
+
+    NUMBA_AVAILABLE = True
+except ModuleNotFoundError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args: Any, **kwargs: Any) -> Callable[..., Any]:  # type: ignore[no-redef]
+        """No-op stand-in for :func:`numba.njit` (bare or with options)."""
+
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            return func
+
+        return decorator
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit", "prange"]
@@ -0,0 +1,53 @@
+"""Token-bucket rate limiting shared by threads and coroutines."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """Allow *rate* calls per second on average, with bursts of up to *burst*.
+
+    Safe to share between threads (e.g. executor workers) and coroutines:
+    each caller reserves a token under a lock and then waits outside it, so
+    concurrent callers queue fairly instead of all sleeping on one timestamp.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how many seconds to wait until it is due."""
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block the calling thread until a token is available."""
+
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Await a token without blocking the event loop."""
+
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+__all__ = ["TokenBucket"]
@@ -8,8 +8,12 @@ _OHLCV_ORDER = ["Open", "High", "Low", "Close", "Volume"]
 def normalize_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
     """Return *df* with canonical OHLCV column order and capitalized names."""
 
-    df = df.copy()
-    df.columns = [c.capitalize() for c in df.columns]
+    # Reason: ``set_axis`` returns a new frame sharing the data (copy-on-write),
+    # so renaming no longer duplicates every column; already-canonical names
+    # skip the rename entirely.
+    names = [c.capitalize() for c in df.columns]
+    if names != list(df.columns):
+        df = df.set_axis(names, axis=1)
     missing = [c for c in _OHLCV_ORDER if c not in df.columns]
     if missing:
         raise ValueError(f"Missing OHLCV columns: {', '.join(missing)}")
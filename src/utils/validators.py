@@ -1,9 +1,13 @@
 import re
 
-_SYMBOL_REGEX = re.compile(r"^[A-Z][A-Z0-9\.-]{0,9}$")
+# Reason: matching case-insensitively avoids allocating ``symbol.upper()`` on
+# every call; ``re.ASCII`` keeps ``[A-Z]`` from also matching letters such as
+# "ſ" or the Kelvin sign under Unicode case folding.
+_SYMBOL_REGEX = re.compile(r"[A-Z][A-Z0-9\.-]{0,9}", re.IGNORECASE | re.ASCII)
+_match_symbol = _SYMBOL_REGEX.fullmatch
 
 
 def is_valid_symbol(symbol: str) -> bool:
     """Return True if *symbol* looks like a valid ticker."""
 
-    return bool(_SYMBOL_REGEX.fullmatch(symbol.upper()))
+    return _match_symbol(symbol) is not None
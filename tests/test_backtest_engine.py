@@ -1,7 +1,9 @@
 import pandas as pd
 
 from src.backtesting.engine import BacktestEngine
+from src.strategies.base import Strategy
 from src.strategies.buy_and_hold import BuyAndHoldStrategy
+from src.strategies.signal import Signal, SignalType
 
 
 def _dummy_data():
@@ -16,3 +18,46 @@ def test_backtest_runs():
     # Ensure equity curve produced and final equity reasonable
     assert not equity.empty
     assert equity.iloc[-1]["equity"] >= 0
+
+
+class _BuyOnce(Strategy):
+    """Emit a single BUY for AAPL on the very first bar."""
+
+    def generate_signals(self, data):
+        if self.state.get("sent"):
+            return {}
+        self.state["sent"] = True
+        return {"AAPL": Signal(type=SignalType.BUY)}
+
+
+def test_orders_wait_for_symbol_bar():
+    idx = pd.date_range("2022-01-01", periods=6, freq="D")
+    data = {
+        "MSFT": pd.DataFrame({"Close": [50.0] * 6}, index=idx),
+        # AAPL only trades from the third day onward
+        "AAPL": pd.DataFrame({"Close": [100.0, 101.0, 102.0, 103.0]}, index=idx[2:]),
+    }
+    strat = _BuyOnce({"symbol": "AAPL"})
+    engine = BacktestEngine(data, [strat], starting_cash=10000, commission=0.0)
+    engine.run()
+
+    trades = engine.portfolio.trade_history
+    assert len(trades) == 1
+    assert trades[0].symbol == "AAPL"
+    assert trades[0].time == idx[2]
+    assert trades[0].price == 100.0
+    assert engine.portfolio.positions["AAPL"].quantity == 100
+    assert "MSFT" not in engine.portfolio.positions
+
+
+def test_tz_aware_dates_stay_datetime_index():
+    idx = pd.date_range("2022-01-01", periods=10, freq="D", tz="UTC")
+    data = {
+        "AAPL": pd.DataFrame({"Close": range(100, 110)}, index=idx, dtype=float),
+        "MSFT": pd.DataFrame({"Close": range(50, 55)}, index=idx[::2], dtype=float),
+    }
+    engine = BacktestEngine(data, [BuyAndHoldStrategy()], starting_cash=10000)
+    equity = engine.run()
+    assert isinstance(equity.index, pd.DatetimeIndex)
+    assert str(equity.index.tz) == "UTC"
+    assert len(equity) == 10
@@ -1,6 +1,9 @@
 from pathlib import Path
 
+import pytest
+
 from src.core.config import Config
+from src.core.exceptions import ConfigError
 
 
 def test_config_loading(tmp_path: Path) -> None:
@@ -54,3 +57,38 @@ strategy:
     cfg_env = Config.load(cfg_file)
     assert cfg_env.app.env == "prod"
     del os.environ["APP__ENV"]
+
+
+def test_env_override_ignores_undeclared_keys(tmp_path: Path, monkeypatch) -> None:
+    cfg_file = tmp_path / "config.yaml"
+    cfg_file.write_text("app:\n  env: test\n")
+
+    monkeypatch.setenv("BROKER__API_KEY", "FROM_ENV")
+    monkeypatch.setenv("SOME_TOOL__SETTING", "1")  # not a config field
+
+    cfg = Config.load(cfg_file)
+    assert cfg.broker.api_key == "FROM_ENV"
+    assert cfg.app.env == "test"
+
+
+def test_env_overrides_dict_fields_by_key_or_whole(tmp_path: Path, monkeypatch) -> None:
+    cfg_file = tmp_path / "config.yaml"
+    cfg_file.write_text("app:\n  env: test\nstrategy:\n  parameters:\n    slow_window: 50\n")
+
+    monkeypatch.setenv("STRATEGY__PARAMETERS__FAST_WINDOW", "10")
+    monkeypatch.setenv("app__log_level", "DEBUG")  # names match case-insensitively
+    cfg = Config.load(cfg_file)
+    assert cfg.strategy.parameters == {"slow_window": 50, "fast_window": "10"}
+    assert cfg.app.log_level == "DEBUG"
+
+    monkeypatch.setenv("STRATEGY__PARAMETERS", '{"window": 14}')
+    cfg = Config.load(cfg_file)
+    assert cfg.strategy.parameters == {"window": 14, "fast_window": "10"}
+
+
+def test_invalid_config_raises_config_error(tmp_path: Path) -> None:
+    cfg_file = tmp_path / "config.yaml"
+    cfg_file.write_text("app:\n  env: test\nunknown_section: 1\n")
+
+    with pytest.raises(ConfigError, match="unknown_section"):
+        Config.load(cfg_file)
@@ -7,7 +7,8 @@ import pytest
 
 class DummyTicker:
     def __init__(self, price: float):
-        self.info = {"regularMarketPrice": price}
+        self.fast_info = {"last_price": price}
+        self.info = {}  # the heavy quote summary should not be consulted
 
 
 class DummyTickers:
@@ -38,6 +39,8 @@ def provider(tmp_path: Path):
 def test_validate_symbol(provider):
     assert provider.validate_symbol("AAPL")
     assert not provider.validate_symbol("AAP$L")
+    assert provider.validate_symbol("brk.b")  # case-insensitive
+    assert not provider.validate_symbol("ABCDEFGHIJK")
 
 
 def test_caching_and_quotes(monkeypatch, provider, sample_df):
@@ -76,3 +79,80 @@ def test_caching_and_quotes(monkeypatch, provider, sample_df):
     # Multiple quotes
     quotes = provider.get_multiple_quotes(["AAPL", "MSFT"])
     assert quotes["MSFT"]["price"] == 200.0
+
+
+def test_quote_falls_back_to_info_without_fast_price(provider):
+    ticker = DummyTicker(0.0)
+    ticker.fast_info = {}
+    ticker.info = {"regularMarketPrice": 42.0}
+    assert provider._last_price(ticker) == 42.0
+
+
+def test_cache_serves_subranges_and_fetches_missing_edges(monkeypatch, provider):
+    idx = pd.date_range("2022-01-03 09:00", periods=8, freq="h")
+    full = pd.DataFrame({"Open": 1.0, "High": 1.0, "Low": 1.0, "Close": range(8), "Volume": 100}, index=idx)
+    calls = []
+
+    def fake_download(ticker, start, end, progress):  # noqa: D401
+        calls.append((pd.Timestamp(start), pd.Timestamp(end)))
+        return full[(full.index >= start) & (full.index < end)]
+
+    monkeypatch.setattr("yfinance.download", fake_download)
+    provider.min_interval = 0.0
+    day = datetime(2022, 1, 3)
+
+    morning = provider.get_historical_data("AAPL", day.replace(hour=9), day.replace(hour=12))
+    assert morning["Close"].tolist() == [0, 1, 2]
+
+    # Sub-range of the cached span: no download
+    late_morning = provider.get_historical_data("AAPL", day.replace(hour=10), day.replace(hour=12))
+    assert late_morning["Close"].tolist() == [1, 2]
+    assert len(calls) == 1
+
+    # Extending the span downloads only the missing afternoon
+    all_day = provider.get_historical_data("AAPL", day.replace(hour=9), day.replace(hour=16))
+    assert all_day["Close"].tolist() == list(range(7))
+    assert calls[-1] == (pd.Timestamp(day.replace(hour=12)), pd.Timestamp(day.replace(hour=16)))
+    assert len(calls) == 2
+
+
+def test_token_bucket_allows_burst_then_paces():
+    import threading
+    import time
+
+    from src.utils import TokenBucket
+
+    bucket = TokenBucket(rate=20.0, burst=2)
+    t0 = time.monotonic()
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.monotonic() - t0
+    # Two tokens are banked; the other two are paced at 1/20 s each
+    assert 0.09 <= elapsed < 0.5
+
+
+def test_batch_download_splits_tickers_and_uses_cache(monkeypatch, provider, sample_df):
+    calls = []
+
+    def fake_download(tickers, start, end, progress, group_by=None, threads=None):  # noqa: D401
+        calls.append(tickers)
+        frames = {t: sample_df for t in tickers.split()}
+        return pd.concat(frames, axis=1)
+
+    monkeypatch.setattr("yfinance.download", fake_download)
+    provider.min_interval = 0.0
+    start, end = datetime(2022, 1, 1), datetime(2022, 1, 5)
+
+    out = provider.get_historical_data_batch(["AAPL", "MSFT"], start, end)
+    assert calls == ["AAPL MSFT"]
+    assert sorted(out) == ["AAPL", "MSFT"]
+    assert list(out["AAPL"].columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert len(out["MSFT"]) == 4  # end is exclusive
+
+    # Both are now cached: no further downloads
+    again = provider.get_historical_data_batch(["AAPL", "MSFT"], start, end)
+    assert len(calls) == 1
+    assert again["AAPL"].equals(out["AAPL"])
@@ -7,6 +7,7 @@ from src.core.logging_config import (
     log_timing,
     new_correlation_id,
     setup_logging,
+    timed,
 )
 
 
@@ -33,3 +34,31 @@ def test_log_timing_decorator(caplog) -> None:
 
     result = sample()
     assert result == sum(range(1000))
+
+
+def test_timed_skips_logging_above_info(tmp_path: Path) -> None:
+    messages = []
+    setup_logging(log_dir=tmp_path, level="INFO")
+    sink_id = logger.add(messages.append, level="INFO", format="{message}")
+    with timed("block"):
+        pass
+    logger.remove(sink_id)
+    assert any("block executed in" in m for m in messages)
+
+    setup_logging(log_dir=tmp_path, level="WARNING")
+    messages.clear()
+    sink_id = logger.add(messages.append, level="WARNING", format="{message}")
+    with timed("quiet"):
+        pass
+    logger.remove(sink_id)
+    assert messages == []
+
+
+def test_correlation_id_injected_into_records(tmp_path: Path) -> None:
+    setup_logging(log_dir=tmp_path, level="INFO")
+    messages = []
+    sink_id = logger.add(messages.append, format="{extra[correlation_id]}")
+    cid = new_correlation_id()
+    logger.info("tagged")
+    logger.remove(sink_id)
+    assert messages == [f"{cid}\n"]
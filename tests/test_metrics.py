@@ -1,10 +1,12 @@
+import dataclasses
 import math
 from datetime import datetime, timedelta
 
 import pandas as pd
+import pytest
 
 from src.backtesting import metrics
-from src.backtesting.events import FillEvent
+from src.backtesting.events import FillEvent, FillLog
 from src.strategies.signal import SignalType
 
 
@@ -68,3 +70,135 @@ def test_performance_report():
     df = metrics.performance_report(equity)
     assert df.shape == (1, len(df.columns))
     assert "total_return" in df.columns
+
+
+def test_fill_log_matches_event_list():
+    t0 = datetime(2023, 1, 1)
+    fills = [
+        FillEvent("AAPL", t0, SignalType.BUY, 10, 100.0),
+        FillEvent("MSFT", t0, SignalType.BUY, 5, 50.0),
+        FillEvent("AAPL", t0 + timedelta(days=2), SignalType.SELL, 10, 99.0),  # -1
+        FillEvent("MSFT", t0 + timedelta(days=5), SignalType.SELL, 5, 55.0),  # +5
+    ]
+    log = FillLog.from_fills(fills)
+
+    assert len(log) == 4
+    assert list(log) == fills
+    assert log[-1] == fills[-1]
+    assert log.records["price"].tolist() == [100.0, 50.0, 99.0, 55.0]
+    assert metrics.win_loss_ratio(log) == metrics.win_loss_ratio(fills) == 0.5
+    assert metrics.average_trade_duration(log) == 3.5
+    assert list(log.times) == [f.time for f in fills]
+
+
+def test_max_drawdown_duration_with_and_without_recovery():
+    idx = pd.date_range("2023-01-01", periods=6, freq="D")
+    recovered = pd.Series([100, 120, 90, 100, 125, 130], index=idx, dtype=float)
+    assert metrics.max_drawdown(recovered) == (90 / 120 - 1.0, 2)
+
+    underwater = pd.Series([100, 120, 90, 100, 110, 115], index=idx, dtype=float)
+    # never regains the 120 peak: duration runs to the end of the series
+    assert metrics.max_drawdown(underwater) == (90 / 120 - 1.0, 4)
+
+
+def test_ratio_helpers_accept_precomputed_returns():
+    idx = pd.date_range("2023-01-01", periods=50, freq="B")
+    equity = pd.Series([100 + (i % 7) - 0.5 * (i % 3) + 0.2 * i for i in range(50)], index=idx)
+    ret = equity.pct_change(fill_method=None).dropna()
+    # pct_change and the diff-based default agree to rounding
+    assert metrics.volatility(equity, ret=ret) == pytest.approx(metrics.volatility(equity))
+    assert metrics.sharpe_ratio(equity, ret=ret) == pytest.approx(metrics.sharpe_ratio(equity))
+    assert metrics.sortino_ratio(equity, 0.01, ret=ret.to_numpy()) == pytest.approx(
+        metrics.sortino_ratio(equity, 0.01)
+    )
+
+
+def test_rolling_sharpe_flat_and_short_windows():
+    idx = pd.date_range("2023-01-01", periods=8, freq="B")
+    equity = pd.Series([100, 100, 100, 100, 101, 99, 102, 100], index=idx, dtype=float)
+    roll = metrics.rolling_sharpe_ratio(equity, window=3)
+    assert len(roll) == 7
+    assert roll.iloc[:3].isna().all()  # warm-up, then a zero-variance window
+    assert roll.iloc[3:].notna().all()
+    assert metrics.rolling_sharpe_ratio(equity, window=30).isna().all()
+
+
+def test_rolling_sharpe_matches_windowed_moments():
+    idx = pd.date_range("2023-01-01", periods=60, freq="B")
+    equity = pd.Series([100 + 3 * math.sin(i) + 0.1 * i for i in range(60)], index=idx)
+    roll = metrics.rolling_sharpe_ratio(equity, window=10)
+    ret = equity.pct_change().dropna()
+    expected = ret.rolling(10).mean() / ret.rolling(10).std(ddof=0) * math.sqrt(metrics.TRADING_DAYS)
+    assert roll.iloc[9:].tolist() == pytest.approx(expected.iloc[9:].tolist(), rel=1e-9)
+
+
+def test_equity_stats_shared_intermediates():
+    idx = pd.date_range("2023-01-01", periods=5, freq="D")
+    equity = pd.Series([100, 110, 99, 121, 110], index=idx, dtype=float)
+    stats = metrics.EquityStats.from_series(equity)
+    assert stats.roll_max.tolist() == [100, 110, 110, 121, 121]
+    assert stats.drawdown.min() == pytest.approx(99 / 110 - 1.0)
+    assert stats.returns.tolist() == pytest.approx(metrics._returns(equity).tolist())
+    assert stats.max_drawdown() == metrics.max_drawdown(equity)
+
+
+def test_summary_cached_reuses_result(monkeypatch):
+    idx = pd.date_range("2023-01-01", periods=30, freq="D")
+    equity = pd.Series([100 + i + (i % 4) for i in range(30)], index=idx, dtype=float)
+    calls = {"n": 0}
+    real_summary = metrics.summary
+
+    def counting_summary(*args, **kwargs):
+        calls["n"] += 1
+        return real_summary(*args, **kwargs)
+
+    monkeypatch.setattr(metrics, "summary", counting_summary)
+    monkeypatch.setattr(metrics, "_summary_cache", type(metrics._summary_cache)())
+
+    first = metrics.summary_cached(equity)
+    second = metrics.summary_cached(equity.copy())
+    assert calls["n"] == 1
+    assert first is second
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.total_return = 0.0  # type: ignore[misc]
+
+    metrics.summary_cached(equity * 1.01)
+    assert calls["n"] == 2
+
+
+def test_beta_aligns_partially_overlapping_indexes():
+    idx = pd.date_range("2024-01-01", periods=40, freq="D")
+    equity = pd.Series([100 + i + (i % 3) for i in range(40)], index=idx, dtype=float)
+    bench = pd.Series([50 + 0.5 * i + (i % 5) for i in range(40)], index=idx, dtype=float)
+    bench = bench.iloc[5:].iloc[::2]
+
+    ret = equity.pct_change().dropna()
+    bench_ret = bench.pct_change().dropna()
+    joined = pd.concat([ret, bench_ret], axis=1, join="inner").dropna()
+    expected = joined.cov().iloc[0, 1] / joined.iloc[:, 1].var(ddof=0)
+    assert metrics.beta_vs_benchmark(equity, bench) == pytest.approx(expected)
+
+
+def test_return_moments_match_numpy_and_skip_gaps():
+    import numpy as np
+
+    values = np.array([100.0, 101.0, np.nan, 103.0, 102.5, 104.0, 104.0])
+    ret = metrics._returns_array(values)
+    count, mean, std = metrics._return_moments(values)
+    assert count == ret.size
+    assert mean == pytest.approx(ret.mean(), rel=1e-12)
+    assert std == pytest.approx(ret.std(), rel=1e-12)
+    assert math.isnan(metrics._return_moments(np.array([100.0]))[2])
+
+
+def test_equity_touching_zero_matches_numpy_returns():
+    import numpy as np
+
+    equity = pd.Series([100.0, 50.0, 0.0, 10.0, 20.0, 0.0, 0.0, -5.0])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ret = metrics._returns_array(equity)  # holds +/-inf; 0/0 is dropped
+        count, _, _ = metrics._return_moments(equity.to_numpy())
+        assert count == ret.size
+        assert metrics.volatility(equity) == 0.0  # std of returns with inf is NaN
+        assert metrics.volatility(equity, ret=ret) == 0.0
+        assert metrics.summary(equity).volatility == 0.0
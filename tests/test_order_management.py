@@ -1,9 +1,10 @@
 from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 
-from src.orders.order import Order
-from src.orders.order_book import OrderBook
+from src.orders.order import Order, to_ns
+from src.orders.order_book import OrderBook, _match_bar
 from src.orders.types import OrderStatus, OrderType
 from src.strategies.signal import SignalType
 
@@ -55,6 +56,8 @@ def test_order_timeout_expires() -> None:
     ob.process_bar("AAPL", later, price=100.0, high=101.0, low=99.0)
 
     assert order.status == OrderStatus.EXPIRED
+    assert not ob.cancel_order(order.id)
+    assert not ob._by_id
 
 
 def test_partial_fill_handling() -> None:
@@ -76,3 +79,114 @@ def test_partial_fill_handling() -> None:
     assert order.status == OrderStatus.FILLED
     assert order.filled_qty == 120
     assert len(fills2) == 1
+
+
+def test_mixed_orders_fill_in_submission_order() -> None:
+    ob = OrderBook()
+    now = datetime.utcnow()
+    stop_sell = Order(symbol="AAPL", side=SignalType.SELL, order_type=OrderType.STOP, quantity=5, stop_price=99.5)
+    limit_buy = Order(symbol="AAPL", side=SignalType.BUY, order_type=OrderType.LIMIT, quantity=10, limit_price=99.0)
+    far_limit = Order(symbol="AAPL", side=SignalType.SELL, order_type=OrderType.LIMIT, quantity=1, limit_price=110.0)
+    cancelled = Order(symbol="AAPL", side=SignalType.BUY, order_type=OrderType.MARKET, quantity=3)
+    for o in (stop_sell, limit_buy, far_limit, cancelled):
+        ob.add_order(o)
+    cancelled.cancel()  # closed outside the book
+
+    fills = ob.process_bar("AAPL", now, price=100.0, high=101.0, low=98.5)
+
+    assert [(f.quantity, f.price) for f in fills] == [(5, 100.0), (10, 99.0)]
+    assert far_limit.status == OrderStatus.PENDING
+    assert cancelled.status == OrderStatus.CANCELLED
+    assert not ob.cancel_order(limit_buy.id)
+    assert ob.cancel_order(far_limit.id)
+
+
+def test_cancel_closes_row_and_compacts() -> None:
+    ob = OrderBook()
+    now = datetime.utcnow()
+    orders = [
+        Order(symbol="AAPL", side=SignalType.BUY, order_type=OrderType.LIMIT, quantity=1, limit_price=90.0)
+        for _ in range(4)
+    ]
+    for o in orders:
+        ob.add_order(o)
+    for o in orders[:3]:
+        assert ob.cancel_order(o.id)
+    book = ob._books["AAPL"]
+    assert book.open[: book.n].tolist() == [False, False, False, True]
+
+    assert not ob.process_bar("AAPL", now, price=100.0, high=101.0, low=99.0)
+    assert book.orders == [orders[3]] and book.rows == {orders[3].id: 0}
+    assert ob.cancel_order(orders[3].id)
+    assert not book.open[0]
+
+
+def test_match_bar_kernel_caps_first_fill_and_expires() -> None:
+    nan = np.nan
+    # rows: capped market buy, limit sell with NaN limit, expired market, closed
+    side = np.array([1, -1, 1, 1], dtype=np.int8)
+    kind = np.array([0, 1, 0, 0], dtype=np.int8)
+    limit = np.array([nan, nan, nan, nan])
+    stop = np.full(4, nan)
+    deadline = np.array([100, 100, 5, 100], dtype=np.int64)
+    remaining = np.array([50, 10, 10, 10], dtype=np.int64)
+    filled = np.zeros(4, dtype=np.int64)
+    is_open = np.array([True, True, True, False])
+    expired = np.empty(4, dtype=bool)
+    qty = np.empty(4, dtype=np.int64)
+    px = np.empty(4)
+
+    _match_bar(side, kind, limit, stop, deadline, remaining, filled, is_open,
+               10.0, 11.0, 9.0, 10, 20, expired, qty, px)
+
+    assert qty.tolist() == [20, 0, 0, 0]
+    assert px[0] == 10.0
+    assert expired.tolist() == [False, False, True, False]
+
+
+def test_maybe_timeout_accepts_epoch_ns() -> None:
+    created = datetime(2024, 1, 2, 9, 30)
+    order = Order(
+        symbol="AAPL",
+        side=SignalType.SELL,
+        order_type=OrderType.MARKET,
+        quantity=1,
+        created_ns=to_ns(created),
+        timeout=timedelta(minutes=5),
+    )
+    assert order.created_at == created
+    assert order.deadline_ns == to_ns(created + timedelta(minutes=5))
+
+    order.maybe_timeout(order.deadline_ns)  # not strictly past the deadline
+    assert order.status == OrderStatus.PENDING
+    order.maybe_timeout(order.deadline_ns + 1)
+    assert order.status == OrderStatus.EXPIRED
+
+
+def test_order_accepts_created_at_keyword() -> None:
+    created = datetime(2024, 1, 2, 9, 30)
+    order = Order("AAPL", SignalType.BUY, OrderType.MARKET, 1, created_at=created)
+    assert order.created_ns == to_ns(created)
+    assert order.created_at == created
+    assert Order("AAPL", SignalType.BUY, OrderType.MARKET, 1).created_ns > 0
+    # created_at keeps its original (7th) positional slot
+    positional = Order("AAPL", SignalType.BUY, OrderType.MARKET, 1, None, None, created, timedelta(minutes=1))
+    assert positional.created_at == created and positional.timeout == timedelta(minutes=1)
+
+
+def test_amend_order_updates_matching_fields() -> None:
+    ob = OrderBook()
+    created = datetime(2024, 1, 2, 9, 30)
+    limit = Order("AAPL", SignalType.BUY, OrderType.LIMIT, 10, limit_price=90.0, created_at=created)
+    timed = Order("AAPL", SignalType.BUY, OrderType.MARKET, 10, timeout=timedelta(seconds=1))
+    ob.add_order(limit)
+    ob.add_order(timed)
+
+    assert ob.amend_order(limit.id, limit_price=100.0)
+    assert ob.amend_order(timed.id, created_at=created)
+    fills = ob.process_bar("AAPL", created + timedelta(seconds=2), price=100.0, high=101.0, low=99.0)
+
+    assert [f.price for f in fills] == [100.0]
+    assert limit.status == OrderStatus.FILLED
+    assert timed.status == OrderStatus.EXPIRED
+    assert not ob.amend_order(limit.id, limit_price=95.0)  # no longer open
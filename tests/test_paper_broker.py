@@ -60,3 +60,85 @@ def test_reset_clears_state(broker):
     broker.reset()
     assert not broker.fills
     assert not broker.pending_orders()
+    assert broker.portfolio.cash == broker.starting_cash == 100_000
+    assert broker.equity_curve().empty
+    assert broker.equity({}) == 100_000
+
+
+def test_cancel_order_while_in_latency_window(broker):
+    now = datetime(2024, 1, 1, 9, 30)
+    keep = Order(symbol="AAPL", side=SignalType.BUY, order_type=OrderType.MARKET, quantity=5)
+    drop = Order(symbol="AAPL", side=SignalType.BUY, order_type=OrderType.MARKET, quantity=7)
+    broker.submit_order(keep, now)
+    broker.submit_order(drop, now)
+
+    assert broker.cancel_order(drop.id)
+    assert not broker.cancel_order(drop.id)
+    assert broker.pending_orders() == [keep]
+
+    fills = broker.on_price_tick("AAPL", now + timedelta(seconds=61), 100, 101, 99)
+    assert [f.quantity for f in fills] == [5]
+
+
+def test_latency_release_ignores_submission_order(broker):
+    now = datetime(2024, 1, 1, 9, 30)
+    late = Order(symbol="AAPL", side=SignalType.BUY, order_type=OrderType.MARKET, quantity=3)
+    early = Order(symbol="AAPL", side=SignalType.BUY, order_type=OrderType.MARKET, quantity=4)
+    broker.submit_order(late, now + timedelta(minutes=10))
+    broker.submit_order(early, now)
+
+    fills = broker.on_price_tick("AAPL", now + timedelta(seconds=60), 100, 101, 99)
+    assert [f.quantity for f in fills] == [4]
+    assert broker.pending_orders() == [late]
+
+
+def test_equity_curve_grows_past_initial_capacity(broker):
+    start = datetime(2024, 1, 1)
+    n_ticks = 1500  # > initial buffer capacity
+    for i in range(n_ticks):
+        broker.on_price_tick("AAPL", start + timedelta(minutes=i), 100, 100, 100)
+
+    curve = broker.equity_curve()
+    assert len(curve) == n_ticks
+    assert curve.name == "equity"
+    assert curve.index[0] == start
+    assert curve.index[-1] == start + timedelta(minutes=n_ticks - 1)
+    assert (curve == 100_000).all()
+
+
+def test_running_equity_matches_full_revaluation():
+    broker = PaperBroker(starting_cash=100_000, slippage_pct=0.001)
+    start = datetime(2024, 1, 1)
+    broker.submit_order(Order(symbol="AAPL", side=SignalType.BUY, order_type=OrderType.MARKET, quantity=10), start)
+    broker.submit_order(Order(symbol="MSFT", side=SignalType.BUY, order_type=OrderType.MARKET, quantity=5), start)
+    for i in range(50):
+        now = start + timedelta(minutes=i)
+        broker.on_price_tick("AAPL", now, 100 + i, 101 + i, 99 + i, commission=1.0)
+        broker.on_price_tick("MSFT", now, 200 - i, 201 - i, 199 - i, commission=1.0)
+        expected = broker.portfolio.total_equity(broker._last_prices)
+        assert broker.equity_curve().iloc[-1] == pytest.approx(expected)
+
+
+def test_pending_orders_drops_filled_and_cancelled(broker):
+    now = datetime(2024, 1, 1, 9, 30)
+    market = Order(symbol="AAPL", side=SignalType.BUY, order_type=OrderType.MARKET, quantity=1)
+    limit = Order(symbol="AAPL", side=SignalType.BUY, order_type=OrderType.LIMIT, quantity=1, limit_price=50)
+    other = Order(symbol="MSFT", side=SignalType.BUY, order_type=OrderType.LIMIT, quantity=1, limit_price=50)
+    for o in (market, limit, other):
+        broker.submit_order(o, now)
+
+    broker.on_price_tick("AAPL", now + timedelta(seconds=61), 100, 101, 99)
+    assert broker.pending_orders() == [limit, other]
+
+    assert broker.cancel_order(other.id)
+    assert broker.pending_orders() == [limit]
+
+
+def test_book_forgets_orders_once_filled(broker):
+    now = datetime(2024, 1, 1, 9, 30)
+    for _ in range(5):
+        broker.submit_order(Order(symbol="AAPL", side=SignalType.BUY, order_type=OrderType.MARKET, quantity=1), now)
+    broker.on_price_tick("AAPL", now + timedelta(seconds=61), 100, 101, 99)
+    # no pending_orders() call needed for filled orders to be released
+    assert not broker.order_book._by_id
+    assert broker.pending_orders() == []
@@ -5,6 +5,8 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
+from src.core.exceptions import DataProviderError
+from src.data.providers.base import DataProvider
 from src.pipeline.data_pipeline import DataPipeline
 from src.utils.validators import is_valid_symbol
 
@@ -52,3 +54,147 @@ async def test_pipeline_collect(monkeypatch, tmp_path: Path):
     await pipeline.collect()
 
     assert provider.calls == 2
+
+
+class DummyBatchProvider(DummyProvider):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def get_historical_data_batch(self, symbols, start_date, end_date):  # noqa: D401
+        self.batches.append(list(symbols))
+        return {s: self.get_historical_data(s, start_date, end_date) for s in symbols if s != "MSFT"}
+
+
+@pytest.mark.asyncio
+async def test_pipeline_collect_batches_symbols(monkeypatch, tmp_path: Path):
+    from src.data.storage import database as db_module
+
+    monkeypatch.setattr(db_module, "_DEFAULT_DB_PATH", tmp_path / "mem.db")
+
+    provider = DummyBatchProvider()
+    pipeline = DataPipeline(provider, ["AAPL", "MSFT", "GOOG"], date(2022, 1, 1), date(2022, 1, 3))
+    pipeline.batch_size = 2
+
+    await pipeline.collect()
+
+    assert provider.batches == [["AAPL", "MSFT"], ["GOOG"]]
+    assert provider.calls == 2  # MSFT returned no data and is skipped
+
+
+class StrictBatchProvider(DummyBatchProvider):
+    """Rejects a whole batch if any symbol is invalid (as Yahoo does)."""
+
+    def get_historical_data_batch(self, symbols, start_date, end_date):  # noqa: D401
+        if not all(map(self.validate_symbol, symbols)):
+            raise DataProviderError("Invalid symbol(s)")
+        return super().get_historical_data_batch(symbols, start_date, end_date)
+
+    def get_historical_data(self, symbol, start_date, end_date):  # noqa: D401
+        if not self.validate_symbol(symbol):
+            raise DataProviderError(f"Invalid symbol: {symbol}")
+        return super().get_historical_data(symbol, start_date, end_date)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_batch_error_falls_back_per_symbol(monkeypatch, tmp_path: Path):
+    from src.data.storage import database as db_module
+
+    monkeypatch.setattr(db_module, "_DEFAULT_DB_PATH", tmp_path / "mem.db")
+
+    provider = StrictBatchProvider()
+    pipeline = DataPipeline(provider, ["AAPL", "bad sym!", "GOOG"], date(2022, 1, 1), date(2022, 1, 3))
+
+    results = await pipeline._fetch_batch(pipeline.symbols)
+
+    assert [sym for sym, rows in results if rows] == ["AAPL", "GOOG"]
+    assert provider.calls == 2  # the valid symbols, fetched individually
+
+
+@pytest.mark.asyncio
+async def test_pipeline_cache_dir_skips_repeat_fetches(monkeypatch, tmp_path: Path):
+    from src.data.storage import database as db_module
+
+    monkeypatch.setattr(db_module, "_DEFAULT_DB_PATH", tmp_path / "mem.db")
+
+    provider = DummyProvider()
+    for _ in range(2):
+        pipeline = DataPipeline(
+            provider, ["AAPL", "MSFT"], date(2022, 1, 1), date(2022, 1, 3), cache_dir=tmp_path / "cache"
+        )
+        await pipeline.collect()
+
+    assert provider.calls == 2  # second run served from disk
+    assert len(list((tmp_path / "cache").iterdir())) == 2
+
+
+@pytest.mark.asyncio
+async def test_pipeline_cache_dir_accepts_datetime_bounds(monkeypatch, tmp_path: Path):
+    from src.data.storage import database as db_module
+
+    monkeypatch.setattr(db_module, "_DEFAULT_DB_PATH", tmp_path / "mem.db")
+
+    provider = DummyProvider()
+    start, end = datetime(2022, 1, 1), datetime(2022, 1, 3, 16, 0)
+    for _ in range(2):
+        await DataPipeline(provider, ["AAPL"], start, end, cache_dir=tmp_path / "cache").collect()
+
+    assert provider.calls == 1
+    assert [p.name.split(".")[0] for p in (tmp_path / "cache").iterdir()] == ["AAPL_2022-01-01_2022-01-03"]
+
+
+class BarrierProvider(DummyProvider):
+    """Every call blocks until *parties* calls are in flight at once."""
+
+    def __init__(self, parties: int):
+        super().__init__()
+        import threading
+
+        self.barrier = threading.Barrier(parties, timeout=10)
+
+    def get_historical_data(self, symbol, start_date, end_date):  # noqa: D401
+        self.barrier.wait()
+        return super().get_historical_data(symbol, start_date, end_date)
+
+
+class ThreadRecordingProvider(DummyProvider, DataProvider):
+    """A ``DataProvider`` subclass inheriting the default async hook."""
+
+    def __init__(self):
+        super().__init__()
+        self.threads = set()
+
+    def get_historical_data(self, symbol, start_date, end_date):  # noqa: D401
+        import threading
+
+        self.threads.add(threading.current_thread().name)
+        return DummyProvider.get_historical_data(self, symbol, start_date, end_date)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runs_inherited_async_hook_on_own_pool(monkeypatch, tmp_path: Path):
+    from src.data.storage import database as db_module
+
+    monkeypatch.setattr(db_module, "_DEFAULT_DB_PATH", tmp_path / "mem.db")
+
+    provider = ThreadRecordingProvider()
+    await DataPipeline(provider, ["AAPL", "MSFT"], date(2022, 1, 1), date(2022, 1, 3)).collect()
+
+    assert provider.calls == 2
+    assert all(name.startswith("pipeline") for name in provider.threads)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runs_max_concurrency_calls_at_once(monkeypatch, tmp_path: Path):
+    from src.data.storage import database as db_module
+
+    monkeypatch.setattr(db_module, "_DEFAULT_DB_PATH", tmp_path / "mem.db")
+
+    # More than the default executor's min(32, cpu_count + 4) threads
+    symbols = [f"S{i}" for i in range(40)]
+    provider = BarrierProvider(len(symbols))
+    pipeline = DataPipeline(provider, symbols, date(2022, 1, 1), date(2022, 1, 3), max_concurrency=40)
+
+    await pipeline.collect()
+
+    assert provider.calls == 40
@@ -1,5 +1,6 @@
 from datetime import datetime
 
+import numpy as np
 import pytest
 
 from src.backtesting.events import FillEvent
@@ -60,9 +61,32 @@ def test_rebalance_to_target_weights(pm):
     assert deltas["MSFT"] > 0
 
 
+def test_rebalance_handles_unpriced_and_untraded_symbols(pm):
+    pm.apply_fill(_make_fill("AAPL", SignalType.BUY, 10, 100.0))
+    deltas = pm.rebalance_to_target_weights(
+        {"AAPL": 0.0, "MSFT": 0.1, "ZERO": 0.1}, {"AAPL": 100.0, "MSFT": 250.0, "ZERO": 0.0}
+    )
+    equity = pm.total_equity({"AAPL": 100.0})
+    assert deltas == {"AAPL": -10, "MSFT": int(equity * 0.1 // 250.0)}
+
+
+def test_rebalance_array_matches_dict_api():
+    pm = PortfolioManager(starting_cash=50_000, symbols=["AAPL", "MSFT", "ZERO"])
+    pm.apply_fill(_make_fill("AAPL", SignalType.BUY, 30, 100.0))
+    weights = {"AAPL": 0.2, "MSFT": 0.5, "ZERO": 0.1}
+    prices = {"AAPL": 110.0, "MSFT": 250.0, "ZERO": 0.0}
+
+    deltas = pm.rebalance_array(np.array(list(weights.values())), np.array(list(prices.values())))
+
+    assert deltas.dtype == np.int64
+    expected = pm.rebalance_to_target_weights(weights, prices)
+    assert dict(zip(weights, deltas.tolist())) == {s: expected.get(s, 0) for s in weights}
+
+
 def test_persistence(tmp_path):
     pm = PortfolioManager(starting_cash=5000)
-    pm.apply_fill(_make_fill("AAPL", SignalType.BUY, 5, 100.0))
+    fill = _make_fill("AAPL", SignalType.BUY, 5, 100.0)
+    pm.apply_fill(fill)
     path = tmp_path / "state.json"
     pm.save(path)
 
@@ -70,6 +94,13 @@ def test_persistence(tmp_path):
     assert loaded.cash == pm.cash
     assert loaded.positions["AAPL"].quantity == 5
 
+    import json
+
+    saved = json.loads(path.read_text())
+    trade = dict(zip(saved["trade_fields"], saved["trades"][0]))
+    assert trade["symbol"] == "AAPL" and trade["fill_type"] == "BUY" and trade["quantity"] == 5
+    assert trade["time"] == fill.time.isoformat()
+
 
 def test_margin_used_calculation(pm):
     """Cash can go negative up to leverage limit; margin_used reflects loan."""
@@ -77,3 +108,102 @@ def test_margin_used_calculation(pm):
     pm.apply_fill(fill)
     assert pm.cash < 0  # margin loan
     assert pm.margin_used == pytest.approx(-pm.cash)
+
+
+def test_multi_symbol_round_trip(pm):
+    pm.apply_fill(_make_fill("AAPL", SignalType.BUY, 10, 100.0))
+    pm.apply_fill(_make_fill("MSFT", SignalType.BUY, 5, 200.0))
+    pm.apply_fill(_make_fill("AAPL", SignalType.SELL, 10, 110.0))
+
+    assert pm.positions["AAPL"].quantity == 0
+    assert pm.positions["AAPL"].avg_price == 0.0
+    assert pm.market_value({"AAPL": 120.0, "MSFT": 210.0}) == pytest.approx(5 * 210.0)
+    # -1001 - 1001 + 1101 (existing formula adds commission to sell proceeds)
+    assert pm.cash == pytest.approx(100_000 - 901.0)
+
+
+def test_total_equity_array_matches_dict_prices():
+    pm = PortfolioManager(starting_cash=10_000, symbols=["AAPL", "MSFT"])
+    pm.apply_fill(_make_fill("MSFT", SignalType.BUY, 3, 200.0))
+    prices = {"AAPL": 100.0, "MSFT": 210.0}
+    assert pm.total_equity_array(np.array([100.0, 210.0])) == pm.total_equity(prices)
+    # pre-allocated rows stay hidden until they trade
+    assert list(pm.positions) == ["MSFT"]
+
+
+def test_position_arrays_grow_across_many_symbols(pm):
+    symbols = [f"S{i}" for i in range(20)]
+    for i, sym in enumerate(symbols):
+        pm.apply_fill(_make_fill(sym, SignalType.BUY, i + 1, 10.0))
+
+    prices = {sym: 11.0 for sym in symbols}
+    assert pm.market_value(prices) == pytest.approx(11.0 * sum(range(1, 21)))
+    assert pm.unrealised_pnl(prices) == pytest.approx(1.0 * sum(range(1, 21)))
+    assert pm.positions["S19"] == Position(20, 10.0)
+
+
+def test_check_drawdown_tracks_running_peak(pm):
+    pm.apply_fill(_make_fill("AAPL", SignalType.BUY, 100, 100.0))
+    assert not pm.check_drawdown({"AAPL": 100.0}, 0.05)
+    assert not pm.check_drawdown({"AAPL": 150.0}, 0.05)
+    # 5k off a ~105k peak is under 5%; 10k is not
+    assert not pm.check_drawdown({"AAPL": 100.0}, 0.05)
+    assert pm.check_drawdown({"AAPL": 50.0}, 0.05)
+
+    bar = datetime(2022, 1, 3)
+    pm.check_drawdown({"AAPL": 50.0}, 0.05, when=bar)
+    assert pm._equity_history[-1][0] == bar
+
+
+def test_apply_fills_batch_matches_sequential_fills():
+    fills = [
+        _make_fill("AAPL", SignalType.BUY, 10, 100.0),
+        _make_fill("MSFT", SignalType.BUY, 4, 250.0),
+        _make_fill("AAPL", SignalType.SELL, 3, 110.0),
+        _make_fill("AAPL", SignalType.BUY, 5, 90.0),
+    ]
+    one_by_one = PortfolioManager(starting_cash=10_000)
+    for fill in fills:
+        one_by_one.apply_fill(fill)
+    batched = PortfolioManager(starting_cash=10_000)
+    batched.apply_fills_batch(fills)
+
+    assert batched.cash == pytest.approx(one_by_one.cash)
+    assert batched.positions == one_by_one.positions
+    assert list(batched.trade_history) == list(one_by_one.trade_history)
+
+
+def test_apply_fills_rejects_unallocated_rows():
+    pm = PortfolioManager(starting_cash=100_000, symbols=["AAPL"])
+    one = np.ones(1, dtype=np.int64)
+    for bad in (3, 100_000, -1):
+        with pytest.raises(IndexError):
+            pm.apply_fills(datetime(2024, 1, 2), np.array([bad]), one, one, np.array([50.0]))
+    assert pm.cash == 100_000
+    assert len(pm.trade_history) == 0 and len(pm.positions) == 0
+
+
+def test_positions_is_a_live_read_only_view(pm):
+    view = pm.positions
+    assert len(view) == 0 and "AAPL" not in view
+    pm.apply_fill(_make_fill("AAPL", SignalType.BUY, 10, 100.0))
+    assert dict(view) == {"AAPL": Position(10, 100.0)}
+    with pytest.raises(TypeError):
+        view["AAPL"] = Position()  # type: ignore[index]
+
+
+def test_apply_fill_log_replays_trade_history():
+    source = PortfolioManager(starting_cash=10_000)
+    source.apply_fill(_make_fill("MSFT", SignalType.BUY, 4, 250.0))
+    source.apply_fill(_make_fill("AAPL", SignalType.BUY, 10, 100.0))
+    source.apply_fill(_make_fill("MSFT", SignalType.SELL, 1, 260.0))
+
+    replay = PortfolioManager(starting_cash=10_000, symbols=["AAPL"])
+    replay.apply_fill_log(source.trade_history)
+
+    assert replay.cash == pytest.approx(source.cash)
+    assert replay.positions == source.positions
+    assert list(replay.trade_history) == list(source.trade_history)
+    frame = replay.trade_history.as_frame()
+    assert frame["symbol"].tolist() == ["MSFT", "AAPL", "MSFT"]
+    assert frame["side"].tolist() == [1, 1, -1]
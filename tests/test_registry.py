@@ -18,6 +18,8 @@ def test_factory_and_generate():
 
     signals = strat.generate_signals(df)
     assert signals["AAPL"].type == SignalType.BUY
+    assert registry.resolve("BuyAndHold") is type(strat)
+    assert registry.factory("BuyAndHold") is not strat  # instances are never shared
 
 
 def test_duplicate_registration():
@@ -26,3 +28,55 @@ def test_duplicate_registration():
     reg.register(registry.registry["BuyAndHold"])
     with pytest.raises(ValueError):
         reg.register(registry.registry["BuyAndHold"])  # duplicate
+
+
+def test_discovery_is_lazy_and_keeps_explicit_registrations():
+    reg = StrategyRegistry()
+    assert reg._classes == {}
+    reg.register(registry.registry["BuyAndHold"])
+    # first miss scans the package without tripping over the explicit entry
+    assert reg.factory("SMACrossover").name == "SMACrossover"
+    assert "BuyAndHold" in reg.registry
+    with pytest.raises(KeyError):
+        reg.factory("NoSuchStrategy")
+
+
+def test_discovery_skips_taken_names_and_retries_after_failure(monkeypatch):
+    from src.strategies.base import Strategy
+
+    class MySMA(Strategy):
+        name = "SMACrossover"
+
+        def generate_signals(self, data):  # pragma: no cover
+            return []
+
+    reg = StrategyRegistry()
+    reg.register(MySMA)
+    real_import = importlib.import_module
+
+    def failing_import(name, *args):
+        if name.endswith(".buy_and_hold"):
+            raise ImportError("boom")
+        return real_import(name, *args)
+
+    monkeypatch.setattr(importlib, "import_module", failing_import)
+    with pytest.raises(ImportError):
+        reg.resolve("BuyAndHold")
+    monkeypatch.undo()
+    # the failed scan is retried, and the user's class keeps its name
+    assert reg.resolve("BuyAndHold").name == "BuyAndHold"
+    assert reg.resolve("SMACrossover") is MySMA
+
+
+def test_run_and_track_records_calls_unless_disabled():
+    df = pd.DataFrame({"Close": [100.0]}, index=pd.date_range("2022-01-01", periods=1))
+    reg = StrategyRegistry()
+    strat = reg.factory("BuyAndHold")
+    reg.run_and_track(strat, df)
+    reg.run_and_track(strat, df)
+    stats = reg.performance["BuyAndHold"]
+    assert stats["calls"] == 2 and stats["errors"] == 0 and stats["total_time"] >= 0.0
+
+    quiet = StrategyRegistry(tracking=False)
+    assert quiet.run_and_track(strat, df)["AAPL"].type == SignalType.BUY
+    assert quiet.performance == {}
@@ -29,6 +29,7 @@ def test_generate_html_report(tmp_path: Path):
     content = out.read_text()
     assert "Equity Curve" in content
     assert "Performance Summary" in content
+    assert "<th>sharpe_ratio</th><td>1.2000</td>" in content
 
 
 def test_generate_pdf_and_comparison(tmp_path: Path):
@@ -54,3 +55,43 @@ def test_generate_pdf_and_comparison(tmp_path: Path):
 
     comp_out = save_comparison_chart_html({"StratA": equity1, "StratB": equity2}, tmp_path / "compare.html")
     assert comp_out.exists()
+
+
+def test_long_curves_render_with_webgl():
+    from src.backtesting.report import _WEBGL_MIN_POINTS, comparison_equity_chart
+
+    idx = pd.date_range("2023-01-01", periods=_WEBGL_MIN_POINTS, freq="min")
+    long = pd.Series(range(_WEBGL_MIN_POINTS), index=idx, dtype=float)
+    short = long.iloc[:10]
+
+    fig = comparison_equity_chart({"long": long, "short": short})
+    assert [t.type for t in fig.data] == ["scattergl", "scatter"]
+
+
+def test_pdf_export_starts_persistent_kaleido_after_success(tmp_path: Path, monkeypatch):
+    import sys
+    import types
+
+    import plotly.graph_objects as go
+
+    from src.backtesting.report import save_comparison_chart_pdf
+
+    started = []
+    fake = types.ModuleType("kaleido")
+    fake.start_sync_server = lambda **kw: started.append(kw)
+    monkeypatch.setitem(sys.modules, "kaleido", fake)
+
+    def fail(self, path, format):
+        raise ValueError("Chrome not found")
+
+    monkeypatch.setattr(go.Figure, "write_image", fail)
+    idx = pd.date_range("2023-01-01", periods=3, freq="D")
+    curves = {"A": pd.Series([1.0, 2.0, 3.0], index=idx)}
+    with pytest.raises(ValueError):
+        save_comparison_chart_pdf(curves, tmp_path / "a.pdf")
+    assert not started  # a failed export never leaves a server behind
+
+    monkeypatch.setattr(go.Figure, "write_image", lambda self, path, format: Path(path).write_bytes(b"%PDF"))
+    for name in ("a.pdf", "b.pdf"):
+        assert save_comparison_chart_pdf(curves, tmp_path / name).read_bytes() == b"%PDF"
+    assert started == [{"silence_warnings": True}] * 2
@@ -1,8 +1,10 @@
+import numpy as np
 import pandas as pd
 
 from src.strategies.sma_crossover import SMACrossoverStrategy
 from src.strategies.rsi_mean_reversion import RSIMeanReversionStrategy
 from src.strategies.bollinger_bands import BollingerBandsStrategy
+from src.strategies.kernels import band_codes, bollinger_codes, crossover_codes
 from src.strategies.signal import SignalType
 
 
@@ -32,3 +34,192 @@ def test_bb_strategy():
     strat = BollingerBandsStrategy({"symbol": "AAPL", "window": 20})
     sigs = strat.generate_signals(df)
     assert "AAPL" in sigs
+
+
+def test_vectorized_signals_match_per_bar():
+    """Each row of the vectorised output equals a per-bar call on the prefix."""
+    import numpy as np
+
+    from src.strategies.buy_and_hold import BuyAndHoldStrategy
+    from src.strategies.signal import CODE_SIGNALS
+
+    rng = np.random.default_rng(42)
+    idx = pd.date_range("2022-01-01", periods=120, freq="D")
+    df = pd.DataFrame({"Close": 100 * np.exp(np.cumsum(rng.normal(0, 0.03, len(idx))))}, index=idx)
+    strategies = [
+        BuyAndHoldStrategy(),
+        SMACrossoverStrategy({"symbol": "AAPL", "fast_window": 3, "slow_window": 8}),
+        RSIMeanReversionStrategy({"symbol": "AAPL", "window": 5}),
+        BollingerBandsStrategy({"symbol": "AAPL", "window": 10, "num_std": 1.0}),
+    ]
+    for strat in strategies:
+        frame = strat.generate_signals_vectorized(df)
+        for t in range(len(df)):
+            sigs = strat.generate_signals(df.iloc[: t + 1])
+            expected = sigs["AAPL"].type if "AAPL" in sigs else SignalType.HOLD
+            assert CODE_SIGNALS[int(frame["AAPL"].iloc[t])] == expected, (strat.name, t)
+
+
+def test_signal_kernels_are_columnwise():
+    fast = np.array([[1.0, 3.0], [2.0, 2.0], [3.0, 1.0]])
+    slow = np.full_like(fast, 2.0)
+    out = np.empty(fast.shape, dtype=np.int8)
+    crossover_codes(fast, slow, 1, out)
+    # col 0 crosses up at t=2, col 1 crosses down at t=2
+    assert out.tolist() == [[0, 0], [0, 0], [1, -1]]
+
+    band_codes(fast, np.full_like(fast, 1.5), np.full_like(fast, 2.5), out)
+    assert out.tolist() == [[1, -1], [0, 0], [-1, 1]]
+
+    # window 2, 0.5 std: rising col 0 breaks above its band, falling col 1 below
+    bollinger_codes(fast, 2, 0.5, out)
+    assert out.tolist() == [[0, 0], [-1, 1], [-1, 1]]
+
+
+def test_update_parameters_refreshes_parsed_params():
+    strat = SMACrossoverStrategy({"symbol": "AAPL", "fast_window": 5, "slow_window": 10})
+    strat.update_parameters({"symbol": "MSFT"})
+    assert "MSFT" in strat.generate_signals(_dummy_df())
+
+
+def test_rsi_last_matches_rolling_rsi():
+    from src.strategies.rsi_mean_reversion import _rsi_last, _rsi_series
+
+    close = np.array([10.0, 11.0, 10.5, 10.5, 12.0, 11.0, 11.5, 13.0])
+    strat = RSIMeanReversionStrategy({"window": 3})
+    expected = strat._rsi(pd.Series(close), 3).to_numpy()
+    for t in range(len(close)):
+        np.testing.assert_allclose(_rsi_last(close[: t + 1], 3), expected[t])
+    series = np.empty_like(close)
+    _rsi_series(close, 3, series)
+    np.testing.assert_array_equal(series, [_rsi_last(close[: t + 1], 3) for t in range(len(close))])
+    assert _rsi_last(np.array([1.0, 2.0, 3.0]), 2) == 100.0  # no losses
+    assert np.isnan(_rsi_last(np.ones(5), 3))  # no movement
+
+
+def test_rsi_numpy_fallbacks_match_compiled():
+    from src.strategies import rsi_mean_reversion as rsi
+
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.normal(0, 1, 120))
+    close[30:45] = 50.0  # no movement -> NaN
+    close[80] = np.nan
+    for window in (1, 5, 14):
+        series, series_np = np.empty_like(close), np.empty_like(close)
+        rsi._rsi_series(close, window, series)
+        rsi._rsi_series_np(close, window, series_np)
+        np.testing.assert_array_equal(series, series_np)
+        for t in (0, window, 44, 100, len(close)):
+            np.testing.assert_array_equal(rsi._rsi_last_np(close[:t], window), rsi._rsi_last(close[:t], window))
+
+
+def test_generate_signals_batch_returns_int8_codes():
+    df = _dummy_df()
+    for strat in (
+        SMACrossoverStrategy({"symbol": "AAPL", "fast_window": 5, "slow_window": 10}),
+        RSIMeanReversionStrategy({"symbol": "AAPL", "window": 14}),
+        BollingerBandsStrategy({"symbol": "AAPL", "window": 20}),
+    ):
+        codes = strat.generate_signals_batch(df)
+        assert codes.dtype == np.int8 and codes.shape == (len(df),)
+        np.testing.assert_array_equal(codes, strat.generate_signals_vectorized(df)["AAPL"].to_numpy())
+
+
+def test_flat_prices_emit_no_signals():
+    idx = pd.date_range("2022-01-01", periods=60, freq="D")
+    df = pd.DataFrame({"Close": np.repeat([100.1, 0.3, 47.77], 20)}, index=idx)
+    for strat in (
+        SMACrossoverStrategy({"symbol": "AAPL", "fast_window": 3, "slow_window": 7}),
+        BollingerBandsStrategy({"symbol": "AAPL", "window": 5, "num_std": 1.0}),
+    ):
+        codes = strat.generate_signals_batch(df)
+        # only the level changes themselves may trigger; the flat stretches must not
+        flat = np.r_[np.arange(15, 20), np.arange(35, 40), np.arange(55, 60)]
+        assert not codes[flat].any(), strat.name
+        assert strat.generate_signals(df)["AAPL"].type == SignalType.HOLD
+
+
+def test_sma_reused_instance_tracks_sliding_and_revised_frames():
+    rng = np.random.default_rng(11)
+    df = pd.DataFrame(
+        {"Close": 100 + np.cumsum(rng.normal(0, 1, 150))},
+        index=pd.date_range("2022-01-01", periods=150, freq="D"),
+    )
+    params = {"symbol": "AAPL", "fast_window": 3, "slow_window": 8}
+    reused = SMACrossoverStrategy(params)
+    for t in range(20, len(df) + 1):
+        window = df.iloc[t - 20 : t]  # fixed-length sliding frame
+        revised = window.copy()
+        revised.iloc[-6, 0] += 5.0  # revision inside the slow window
+        for frame in (window, revised):
+            cold = SMACrossoverStrategy(params)
+            assert reused.generate_signals(frame)["AAPL"] == cold.generate_signals(frame)["AAPL"]
+    assert "sma_last" not in reused.state
+
+
+def test_noop_parameter_update_keeps_parsed_model():
+    strat = SMACrossoverStrategy({"symbol": "AAPL", "fast_window": 5, "slow_window": 10})
+    parsed = strat._param_obj
+    strat.update_parameters({"fast_window": 5})
+    assert strat._param_obj is parsed
+    strat.update_parameters({"fast_window": 6})
+    assert strat._param_obj is not parsed and strat._fast == 6
+
+
+def test_streaming_update_matches_generate_signals():
+    rng = np.random.default_rng(3)
+    close = 100 + np.cumsum(rng.normal(0, 1, 120))
+    df = pd.DataFrame({"Close": close}, index=pd.date_range("2022-01-01", periods=120, freq="D"))
+    for params, cls in (
+        ({"fast_window": 3, "slow_window": 8}, SMACrossoverStrategy),
+        ({"window": 10, "num_std": 1.0}, BollingerBandsStrategy),
+        ({"window": 5}, RSIMeanReversionStrategy),
+    ):
+        batch, stream = cls(dict(params)), cls(dict(params))
+        stream.seed(close[:20])
+        for t in range(20, len(close)):
+            expected = batch.generate_signals(df.iloc[: t + 1])
+            got = stream.update(close[t])
+            assert {s: g.type for s, g in got.items()} == {s: e.type for s, e in expected.items()}
+
+
+def test_streaming_survives_lookback_change_mid_stream():
+    rng = np.random.default_rng(5)
+    close = 100 + np.cumsum(rng.normal(0, 1, 200))
+    strat = SMACrossoverStrategy({"fast_window": 2, "slow_window": 5})
+    for price in close[:30]:
+        strat.update(price)
+    strat.update_parameters({"fast_window": 10, "slow_window": 40})  # lookback 6 -> 41
+    batch = SMACrossoverStrategy({"fast_window": 10, "slow_window": 40})
+    for t in range(30, len(close)):  # history restarts; runs past the first compaction
+        got = strat.update(close[t])
+        expected = batch.generate_signals(pd.DataFrame({"Close": close[30 : t + 1]}))
+        assert {s: g.type for s, g in got.items()} == {s: e.type for s, e in expected.items()}
+
+
+def test_numpy_kernel_fallbacks_match_compiled():
+    from src.strategies import kernels
+
+    rng = np.random.default_rng(11)
+    x = 100 + np.cumsum(rng.normal(0, 1, (150, 2)), axis=0)
+    x[40:60] = 47.77  # flat stretch
+    x[90, 1] = np.nan
+    window = 12
+    mean, mean_np = np.empty(x.shape), np.empty(x.shape)
+    kernels.rolling_mean(x, window, mean)
+    kernels._rolling_mean_np(x, window, mean_np)
+    np.testing.assert_array_equal(mean, mean_np)
+    codes, codes_np = np.empty(x.shape, np.int8), np.empty(x.shape, np.int8)
+    kernels.bollinger_codes(x, window, 1.0, codes)
+    kernels._bollinger_codes_np(x, window, 1.0, codes_np)
+    np.testing.assert_array_equal(codes, codes_np)
+    fast = np.empty(x.shape)
+    kernels.rolling_mean(x, 4, fast)
+    kernels.crossover_codes(fast, mean, window, codes)
+    kernels._crossover_codes_np(fast, mean, window, codes_np)
+    np.testing.assert_array_equal(codes, codes_np)
+    col = np.ascontiguousarray(x[:, 0])
+    for end in range(window, len(col) + 1):
+        m = kernels.window_mean(col, end, window)
+        assert kernels._window_mean_np(col, end, window) == m
+        assert kernels._window_std_np(col, end, window, m) == kernels.window_std(col, end, window, m)
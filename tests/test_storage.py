@@ -2,10 +2,17 @@ from datetime import date
 
 import pandas as pd
 import pytest
+from sqlalchemy import text
 
+from src.data.storage import database
 from src.data.storage.database import get_engine, get_session, init_engine
 from src.data.storage.migrations import run_migrations
-from src.data.storage.repository import cleanup_before, load_historical_df, upsert_historical_df
+from src.data.storage.repository import (
+    cleanup_before,
+    load_historical_df,
+    prepare_for_insert,
+    upsert_historical_df,
+)
 
 
 @pytest.fixture(scope="module")
@@ -55,3 +62,142 @@ def test_insert_and_retrieve(session, sample_df):
 def test_cleanup(session):
     removed = cleanup_before("AAPL", date(2022, 1, 2), session)
     assert removed == 1
+
+
+def test_upsert_updates_existing_rows(session, sample_df):
+    upsert_historical_df("MSFT", sample_df, session)
+    changed = sample_df.assign(Close=[2.0, 2.1, 2.2])
+    upsert_historical_df("MSFT", changed, session)
+
+    fetched = load_historical_df("MSFT", date(2022, 1, 1), date(2022, 1, 3), session)
+    assert fetched["Close"].tolist() == [2.0, 2.1, 2.2]
+    assert len(fetched) == 3
+
+
+def test_upsert_records_keeps_last_duplicate_key(session, sample_df):
+    from src.data.storage.repository import upsert_records
+
+    records, _ = prepare_for_insert("TSLA", sample_df)
+    revised = dict(records[0], close=9.0)
+    upsert_records([records[0], *records[1:], revised], session)
+
+    fetched = load_historical_df("TSLA", date(2022, 1, 1), date(2022, 1, 3), session)
+    assert fetched["Close"].tolist() == [9.0, 1.1, 1.2]
+
+
+def test_upsert_falls_back_without_on_conflict(session, sample_df, monkeypatch):
+    from src.data.storage import repository
+
+    monkeypatch.setattr(repository, "_INSERTS", {})  # dialect without ON CONFLICT
+    upsert_historical_df("NVDA", sample_df.iloc[:2], session)
+    changed = sample_df.assign(Close=[2.0, 2.1, 2.2])
+    upsert_historical_df("NVDA", changed, session)
+
+    fetched = load_historical_df("NVDA", date(2022, 1, 1), date(2022, 1, 3), session)
+    pd.testing.assert_frame_equal(fetched, changed)
+
+
+def test_prepare_for_insert_drops_nan_rows(sample_df):
+    df = sample_df.rename(columns=str.lower)
+    df.iloc[1, 0] = float("nan")
+    records, dropped = prepare_for_insert("aapl", df)
+    assert dropped == 1
+    assert [r["date"] for r in records] == [date(2022, 1, 1), date(2022, 1, 3)]
+    assert records[0]["symbol"] == "AAPL"
+    assert type(records[0]["volume"]) is int
+    assert list(df.columns) == ["open", "high", "low", "close", "volume"]  # input untouched
+
+    with pytest.raises(ValueError, match="Volume"):
+        prepare_for_insert("AAPL", sample_df.drop(columns="Volume"))
+
+
+def test_sqlite_engine_uses_wal(tmp_path):
+    eng = get_engine(f"sqlite:///{(tmp_path / 'wal.db').as_posix()}")
+    with eng.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+    eng.dispose()
+
+
+def test_reader_session_sees_writer_commits(tmp_path, monkeypatch, sample_df):
+    for name in ("_ENGINE", "_READ_ENGINE", "_SessionLocal", "_ReadSessionLocal"):
+        monkeypatch.setattr(database, name, None)
+    writer = init_engine(f"sqlite:///{(tmp_path / 'rw.db').as_posix()}")
+    run_migrations(writer)
+    assert database._READ_ENGINE is not writer
+
+    with get_session() as sess:
+        upsert_historical_df("AAPL", sample_df, sess)
+    with get_session(readonly=True) as sess:
+        fetched = load_historical_df("AAPL", date(2022, 1, 1), date(2022, 1, 3), sess)
+    pd.testing.assert_frame_equal(fetched, sample_df)
+    writer.dispose()
+    database._READ_ENGINE.dispose()
+
+
+def test_writer_sessions_are_serialised_across_threads(tmp_path, monkeypatch, sample_df):
+    from concurrent.futures import ThreadPoolExecutor
+
+    for name in ("_ENGINE", "_READ_ENGINE", "_SessionLocal", "_ReadSessionLocal"):
+        monkeypatch.setattr(database, name, None)
+    writer = init_engine(f"sqlite:///{(tmp_path / 'mt.db').as_posix()}")
+    run_migrations(writer)
+    symbols = [f"S{i}" for i in range(8)]
+
+    def write(symbol: str) -> None:
+        with get_session() as sess:
+            upsert_historical_df(symbol, sample_df, sess)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(write, symbols))
+    with get_session(readonly=True) as sess:
+        for symbol in symbols:
+            fetched = load_historical_df(symbol, date(2022, 1, 1), date(2022, 1, 3), sess)
+            pd.testing.assert_frame_equal(fetched, sample_df)
+    assert writer.pool.size() == 1
+    writer.dispose()
+    database._READ_ENGINE.dispose()
+
+
+def test_nested_sessions_do_not_wait_on_the_writer(tmp_path, monkeypatch, sample_df):
+    for url in ("sqlite:///:memory:", f"sqlite:///{(tmp_path / 'nest.db').as_posix()}"):
+        for name in ("_ENGINE", "_READ_ENGINE", "_SessionLocal", "_ReadSessionLocal"):
+            monkeypatch.setattr(database, name, None)
+        monkeypatch.setattr(database, "_EXCLUSIVE_WRITER", False)
+        writer = init_engine(url)
+        run_migrations(writer)
+        with get_session() as sess:
+            upsert_historical_df("AAPL", sample_df, sess)
+            with get_session(readonly=True) as read:
+                load_historical_df("AAPL", date(2022, 1, 1), date(2022, 1, 3), read)
+        if database._EXCLUSIVE_WRITER:
+            with get_session():
+                with pytest.raises(RuntimeError):
+                    with get_session():
+                        pass
+            with get_session():  # the guard was released
+                pass
+        writer.dispose()
+        database._READ_ENGINE.dispose()
+    assert database._EXCLUSIVE_WRITER  # the file-backed case ran last
+
+
+def test_run_migrations_is_idempotent(engine):
+    run_migrations(engine)
+    with engine.connect() as conn:
+        versions = conn.execute(text("SELECT version FROM schema_version")).scalars().all()
+    assert versions == [1, 2]
+
+
+def test_range_query_uses_symbol_date_index(engine):
+    with engine.connect() as conn:
+        plan = conn.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT date FROM market_data "
+                "WHERE symbol = 'AAPL' AND date >= '2022-01-01' AND date <= '2022-01-03' ORDER BY date"
+            )
+        ).all()
+        indexes = conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'")).scalars().all()
+    detail = " ".join(row[-1] for row in plan)
+    assert "sqlite_autoindex_market_data" in detail and "TEMP B-TREE" not in detail
+    assert "ix_market_data_symbol" not in indexes and "ix_market_data_date" not in indexes
@@ -14,3 +14,16 @@ def test_buy_and_hold_signal():
     sig = signals["AAPL"]
     assert sig.type == SignalType.BUY
     assert sig.confidence == 1.0
+
+
+def test_hold_signals_carry_no_metadata():
+    from src.strategies.bollinger_bands import BollingerBandsStrategy
+
+    idx = pd.date_range("2022-01-01", periods=5, freq="D")
+    strat = BollingerBandsStrategy({"window": 3, "num_std": 1.0})
+    hold = strat.generate_signals(pd.DataFrame({"Close": [1.0, 1.0, 1.0, 1.0, 1.0]}, index=idx))["AAPL"]
+    assert hold.type == SignalType.HOLD
+    assert hold.metadata is None and hold.meta == {}
+    buy = strat.generate_signals(pd.DataFrame({"Close": [5.0, 5.0, 5.0, 5.0, 1.0]}, index=idx))["AAPL"]
+    assert buy.type == SignalType.BUY
+    assert set(buy.meta) == {"price", "upper", "lower"}